@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Cache Backend Throughput Benchmark
+
+Compares get/set throughput of the evaluation cache backends (JSONL,
+segment log, SQLite) at increasing record counts. No LLM calls are made.
+
+Each record mimics an evaluator write: one example result with a short trace.
+Records are spread over candidates with ``--examples-per-candidate`` examples
+each, mirroring how shards are evaluated.
+
+Usage:
+    python examples/benchmarks/bench_cache_backends.py
+    python examples/benchmarks/bench_cache_backends.py --sizes 10000,100000 --backends jsonl,sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from turbo_gepa.cache import create_cache
+from turbo_gepa.interfaces import Candidate, EvalResult
+
+
+def _make_result(example_id: str, quality: float) -> EvalResult:
+    return EvalResult(
+        objectives={"quality": quality},
+        traces=[{"example_id": example_id, "quality": quality, "tokens": 512.0, "output": "x" * 256}],
+        n_examples=1,
+        shard_fraction=0.2,
+        example_ids=[example_id],
+    )
+
+
+async def _run_backend(backend: str, n_records: int, per_candidate: int, n_reads: int, batch: int) -> dict[str, float]:
+    root = tempfile.mkdtemp(prefix=f"bench_{backend}_")
+    try:
+        cache = create_cache(root, backend)
+        n_candidates = max(1, n_records // per_candidate)
+        candidates = [Candidate(text=f"Prompt variant {i}: solve the problem step by step.") for i in range(n_candidates)]
+
+        pending: list[tuple[Candidate, str, EvalResult]] = []
+        start = time.perf_counter()
+        for idx in range(n_records):
+            cand = candidates[idx // per_candidate % n_candidates]
+            example_id = f"ex-{idx % per_candidate}"
+            pending.append((cand, example_id, _make_result(example_id, float(idx % 2))))
+            if len(pending) >= batch:
+                await cache.batch_set(pending)
+                pending = []
+        if pending:
+            await cache.batch_set(pending)
+        set_seconds = time.perf_counter() - start
+        if hasattr(cache, "close"):
+            cache.close()
+
+        # Cold reads through a fresh instance (what a resumed run or another process sees)
+        reader = create_cache(root, backend)
+        rng = random.Random(0)
+        lookups = [
+            (candidates[rng.randrange(n_candidates)], f"ex-{rng.randrange(per_candidate)}") for _ in range(n_reads)
+        ]
+        start = time.perf_counter()
+        hits = 0
+        for cand, example_id in lookups:
+            if await reader.get(cand, example_id) is not None:
+                hits += 1
+        get_seconds = time.perf_counter() - start
+        if hasattr(reader, "close"):
+            reader.close()
+
+        files = sum(1 for path in Path(root).rglob("*") if path.is_file())
+        return {
+            "set_per_sec": n_records / max(set_seconds, 1e-9),
+            "get_per_sec": n_reads / max(get_seconds, 1e-9),
+            "hit_rate": hits / max(n_reads, 1),
+            "files": files,
+        }
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated record counts")
+    parser.add_argument("--backends", default="jsonl,segment,sqlite", help="Comma-separated backends")
+    parser.add_argument("--examples-per-candidate", type=int, default=50)
+    parser.add_argument("--reads", type=int, default=20000, help="Random cold lookups per run")
+    parser.add_argument("--batch", type=int, default=256, help="Records per batch_set call")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+
+    print("=" * 80)
+    print("CACHE BACKEND THROUGHPUT")
+    print("=" * 80)
+    print(f"{'records':>10} {'backend':>8} {'set/s':>12} {'get/s':>12} {'hit':>6} {'files':>8}")
+    for size in sizes:
+        for backend in backends:
+            stats = asyncio.run(_run_backend(backend, size, args.examples_per_candidate, args.reads, args.batch))
+            print(
+                f"{size:>10} {backend:>8} {stats['set_per_sec']:>12,.0f} {stats['get_per_sec']:>12,.0f} "
+                f"{stats['hit_rate']:>6.0%} {stats['files']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Example Scheduling Simulation
+
+Simulates a stream of candidate evaluations against a backend with skewed
+(log-normal) per-example latency and reports how busy the example-level
+concurrency budget stays under the two scheduling policies:
+
+* ``per_candidate``: the previous launch rule. Each launch reserves
+  ``capacity // (inflight + 1)`` slots (capped at its shard size) for its whole
+  evaluation and only starts when the reservation fits, so early launches hold
+  most of the budget and every reservation idles while its stragglers finish.
+* ``global``: every (candidate, example) call waits for a slot in one shared
+  :class:`ExampleQueue`; launches continue while fewer than two pools' worth of
+  examples are outstanding.
+
+Shard sizes follow an ASHA-shaped mix (mostly small first-rung shards). No LLM
+calls are made; latency is simulated with ``asyncio.sleep``.
+
+Usage:
+    python examples/benchmarks/bench_example_scheduling.py
+    python examples/benchmarks/bench_example_scheduling.py --capacity 64 --candidates 400 --sigma 1.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from turbo_gepa.example_queue import ExampleQueue
+
+
+class SlotMeter:
+    """Integrates the number of running example calls over time."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.busy_seconds = 0.0
+        self._last = time.perf_counter()
+
+    def tick(self) -> None:
+        now = time.perf_counter()
+        self.busy_seconds += self.running * (now - self._last)
+        self._last = now
+
+    def start(self) -> None:
+        self.tick()
+        self.running += 1
+
+    def stop(self) -> None:
+        self.tick()
+        self.running -= 1
+
+
+def _workload(candidates: int, shards: list[int], sigma: float, unit: float, seed: int) -> list[list[float]]:
+    """Per-candidate lists of example latencies (seconds)."""
+    rng = random.Random(seed)
+    weights = [0.5**idx for idx in range(len(shards))]
+    sizes = rng.choices(shards, weights=weights, k=candidates)
+    mu = -sigma * sigma / 2  # Mean latency of one unit
+    return [[unit * rng.lognormvariate(mu, sigma) for _ in range(size)] for size in sizes]
+
+
+async def _call(latency: float, meter: SlotMeter, slot) -> None:
+    async with slot:
+        meter.start()
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            meter.stop()
+
+
+async def _run(policy: str, workload: list[list[float]], capacity: int) -> dict[str, float]:
+    meter = SlotMeter()
+    queue = ExampleQueue(capacity) if policy == "global" else None
+    inflight = 0
+    examples_inflight = 0
+    examples_starting = 0  # Launched, not yet waiting in the queue
+    changed = asyncio.Event()
+    if queue is not None:
+        queue.idle_listeners.append(changed.set)  # As the orchestrator does
+    durations: list[float] = []
+
+    async def evaluate(latencies: list[float], reserved: int) -> None:
+        nonlocal inflight, examples_inflight, examples_starting
+        started = time.perf_counter()
+        if queue is not None:
+            examples_starting -= len(latencies)
+        local = asyncio.Semaphore(reserved) if queue is None else None
+        try:
+            await asyncio.gather(
+                *(_call(latency, meter, queue.slot() if queue is not None else local) for latency in latencies)
+            )
+        finally:
+            durations.append(time.perf_counter() - started)
+            inflight -= 1
+            examples_inflight -= reserved
+            changed.set()
+
+    tasks: list[asyncio.Task] = []
+    pending = list(workload)
+    started = time.perf_counter()
+    while pending:
+        latencies = pending[0]
+        if queue is not None:
+            can_launch = inflight < capacity and queue.waiting + examples_starting < capacity
+            reserved = 0
+        else:
+            reserved = min(len(latencies), max(1, capacity // (inflight + 1)))
+            can_launch = inflight < capacity and examples_inflight + reserved <= capacity
+        if can_launch:
+            pending.pop(0)
+            inflight += 1
+            examples_inflight += reserved
+            if queue is not None:
+                examples_starting += len(latencies)
+            tasks.append(asyncio.create_task(evaluate(latencies, reserved)))
+            continue
+        changed.clear()
+        await changed.wait()
+    await asyncio.gather(*tasks)
+    wall = time.perf_counter() - started
+    meter.tick()
+    durations.sort()
+    return {
+        "wall": wall,
+        "utilisation": meter.busy_seconds / (capacity * wall),
+        "examples": sum(len(latencies) for latencies in workload),
+        "p50": durations[len(durations) // 2],
+        "p95": durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--capacity", type=int, default=32, help="eval_concurrency (example slots)")
+    parser.add_argument("--candidates", type=int, default=200)
+    parser.add_argument("--shards", type=int, nargs="+", default=[5, 20, 100], help="examples per rung")
+    parser.add_argument("--sigma", type=float, default=1.0, help="log-normal latency skew")
+    parser.add_argument("--unit-ms", type=float, default=5.0, help="mean example latency")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    workload = _workload(args.candidates, args.shards, args.sigma, args.unit_ms / 1000, args.seed)
+    print("=" * 80)
+    print(
+        f"EXAMPLE SCHEDULING: {args.candidates} candidates, {args.capacity} slots, "
+        f"shards {args.shards}, latency sigma {args.sigma}"
+    )
+    print("=" * 80)
+    print(f"{'policy':<14} {'wall s':>8} {'examples/s':>11} {'utilisation':>12} {'cand p50 s':>11} {'cand p95 s':>11}")
+    for policy in ("per_candidate", "global"):
+        stats = asyncio.run(_run(policy, workload, args.capacity))
+        print(
+            f"{policy:<14} {stats['wall']:>8.2f} {stats['examples'] / stats['wall']:>11.0f} "
+            f"{stats['utilisation']:>12.1%} {stats['p50']:>11.3f} {stats['p95']:>11.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Candidate Identity Profile
+
+Profiles a synthetic streaming run (zero-latency task runner, see
+``bench_orchestration_overhead.py``) under cProfile and reports the share of
+CPU time spent computing candidate identity (``Candidate.fingerprint`` and
+``Candidate.eval_key``).
+
+Two modes are profiled on the same workload:
+
+* ``recompute``: identity is recomputed on every access through the general
+  normalisation path, which is how ``Candidate`` behaved before memoization.
+* ``memoized``: the shipped behavior; identity is computed once per candidate
+  and flat meta takes the fast path.
+
+Run length depends on how the search unfolds (it may settle before
+``--evaluations``), so compare the per-evaluation column as well as the share.
+
+Usage:
+    python examples/benchmarks/bench_fingerprint_profile.py
+    python examples/benchmarks/bench_fingerprint_profile.py --evaluations 2000 --concurrency 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import pstats
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import xxhash
+from bench_orchestration_overhead import SyntheticMutator, _task_runner
+
+from turbo_gepa import interfaces
+from turbo_gepa.archive import Archive
+from turbo_gepa.cache import DiskCache
+from turbo_gepa.config import Config
+from turbo_gepa.evaluator import AsyncEvaluator
+from turbo_gepa.interfaces import Candidate
+from turbo_gepa.orchestrator import Orchestrator
+from turbo_gepa.sampler import InstanceSampler
+
+_IDENTITY_FUNCTIONS = {"fingerprint", "eval_key"}
+
+
+def _recompute_fingerprint(self: Candidate) -> str:
+    return xxhash.xxh3_64_hexdigest(interfaces._canonical_payload(self.text, self.meta))
+
+
+async def _run(evaluations: int, concurrency: int, examples: int) -> int:
+    root = tempfile.mkdtemp(prefix="bench_fp_")
+    try:
+        config = Config(eval_concurrency=concurrency, shards=(0.2, 0.5, 1.0), max_mutations_per_round=32)
+        cache = DiskCache(root)
+        orchestrator = Orchestrator(
+            config=config,
+            evaluator=AsyncEvaluator(cache=cache, task_runner=_task_runner),
+            archive=Archive(bins_length=8, bins_bullets=6),
+            sampler=InstanceSampler([f"ex{i}" for i in range(examples)], seed=0),
+            mutator=SyntheticMutator(),
+            cache=cache,
+            show_progress=False,
+        )
+        seeds = [Candidate(text=f"Seed prompt {i}: solve the problem step by step.") for i in range(8)]
+        await orchestrator.run(seeds, max_evaluations=evaluations, resume=False)
+        return orchestrator.evaluations_run
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def _profile(mode: str, evaluations: int, concurrency: int, examples: int) -> dict[str, float]:
+    memoized = {name: Candidate.__dict__[name] for name in _IDENTITY_FUNCTIONS}
+    if mode == "recompute":
+        Candidate.fingerprint = property(_recompute_fingerprint)
+        Candidate.eval_key = property(memoized["eval_key"].func)
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+        done = asyncio.run(_run(evaluations, concurrency, examples))
+        profiler.disable()
+    finally:
+        for name, descriptor in memoized.items():
+            setattr(Candidate, name, descriptor)
+
+    stats = pstats.Stats(profiler)
+    identity = 0.0
+    calls = 0
+    for (_, _, func), (_, ncalls, _, cumtime, _) in stats.stats.items():
+        if func in _IDENTITY_FUNCTIONS or func == "_recompute_fingerprint":
+            identity += cumtime
+            calls += ncalls
+    return {"evaluations": done, "total": stats.total_tt, "identity": identity, "calls": calls}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--evaluations", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--examples", type=int, default=50)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print(f"CANDIDATE IDENTITY CPU SHARE (concurrency={args.concurrency}, profiled)")
+    print("=" * 80)
+    print(f"{'mode':<10} {'evals':>6} {'cpu s':>8} {'identity s':>11} {'share':>7} {'us/eval':>8} {'computations':>13}")
+    for mode in ("recompute", "memoized"):
+        stats = _profile(mode, args.evaluations, args.concurrency, args.examples)
+        share = stats["identity"] / stats["total"] if stats["total"] else 0.0
+        print(
+            f"{mode:<10} {stats['evaluations']:>6} {stats['total']:>8.2f} {stats['identity']:>11.3f} "
+            f"{share:>7.1%} {1e6 * stats['identity'] / max(1, stats['evaluations']):>8.1f} {stats['calls']:>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Ready Queue Benchmark
+
+Pushes and launches candidates through the orchestrator's ready queue with a
+steady backlog, comparing the indexed :class:`ReadyQueue` against the previous
+bookkeeping: a global deque plus per-rung deques and fingerprint sets, where
+every launch removed the candidate from the global deque by linear scan and
+``Candidate`` equality (which compares meta dicts field by field).
+
+Each step enqueues one fresh candidate (plus a duplicate that must be
+rejected) on a rung drawn from an ASHA-shaped mix (most work arrives at rung
+0), launches the head of the next non-empty rung in round-robin order, and
+releases the launch that started ``--inflight`` steps earlier. Fingerprints
+are computed (and memoized) up front so the timings measure queue bookkeeping
+only.
+
+Usage:
+    python examples/benchmarks/bench_ready_queue.py
+    python examples/benchmarks/bench_ready_queue.py --launches 100000 --backlog 4096
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from turbo_gepa.interfaces import Candidate
+from turbo_gepa.ready_queue import ReadyQueue
+from turbo_gepa.scheduler import scheduling_key
+
+
+class LegacyQueue:
+    """The deque-based bookkeeping the orchestrator used before ReadyQueue."""
+
+    def __init__(self, n_rungs: int, maxlen: int) -> None:
+        self.queue: deque[Candidate] = deque(maxlen=maxlen)
+        self.per_shard: list[deque[Candidate]] = [deque() for _ in range(n_rungs)]
+        self.pending: set[str] = set()
+        self.inflight: set[str] = set()
+
+    def push(self, candidate: Candidate, rung: int) -> None:
+        fingerprint = candidate.fingerprint
+        if fingerprint in self.pending or fingerprint in self.inflight:
+            return
+        if len(self.queue) == self.queue.maxlen and self.queue:
+            evicted = self.queue.popleft()
+            self.pending.discard(evicted.fingerprint)
+            for dq in self.per_shard:
+                try:
+                    dq.remove(evicted)
+                    break
+                except ValueError:
+                    continue
+        self.per_shard[min(rung, len(self.per_shard) - 1)].append(candidate)
+        self.queue.append(candidate)
+        self.pending.add(fingerprint)
+
+    def launch(self, rung: int) -> str | None:
+        shard = self.per_shard[rung]
+        if not shard:
+            return None
+        candidate = shard.popleft()
+        try:
+            self.queue.remove(candidate)
+        except ValueError:
+            pass
+        fingerprint = candidate.fingerprint
+        self.pending.discard(fingerprint)
+        self.inflight.add(fingerprint)
+        return fingerprint
+
+    def release(self, key: str) -> None:
+        self.inflight.discard(key)
+
+
+class IndexedQueue:
+    def __init__(self, n_rungs: int, maxlen: int) -> None:
+        self.queue = ReadyQueue(n_rungs, maxlen=maxlen)
+
+    def push(self, candidate: Candidate, rung: int) -> None:
+        self.queue.push(candidate, rung)
+
+    def launch(self, rung: int) -> str | None:
+        candidate = self.queue.pop(rung)
+        if candidate is None:
+            return None
+        key = scheduling_key(candidate)
+        self.queue.mark_inflight(key)
+        return key
+
+    def release(self, key: str) -> None:
+        self.queue.release(key)
+
+
+def _candidates(count: int) -> list[Candidate]:
+    return [
+        Candidate(
+            text=f"Candidate prompt {i}: think step by step.",
+            meta={"parent": f"p{i // 4}", "generation": i // 64, "quality": (i % 97) / 97, "source": "mutation"},
+        )
+        for i in range(count)
+    ]
+
+
+def _run(impl, candidates: list[Candidate], launches: int, backlog: int, inflight: int, rungs: int) -> float:
+    rng = random.Random(0)
+    weights = [0.5**idx for idx in range(rungs)]
+    targets = rng.choices(range(rungs), weights=weights, k=len(candidates))
+    cursor = 0
+    for cursor in range(backlog):
+        impl.push(candidates[cursor], targets[cursor])
+    running: deque[str] = deque()
+    started = time.perf_counter()
+    done = 0
+    step = 0
+    while done < launches:
+        cursor += 1
+        impl.push(candidates[cursor], targets[cursor])
+        impl.push(candidates[cursor], targets[cursor])  # Duplicate, rejected
+        key = None
+        for _ in range(rungs):
+            key = impl.launch(step % rungs)
+            step += 1
+            if key is not None:
+                break
+        if key is None:
+            continue
+        done += 1
+        running.append(key)
+        if len(running) > inflight:
+            impl.release(running.popleft())
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--launches", type=int, default=100_000)
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--inflight", type=int, default=64)
+    parser.add_argument("--rungs", type=int, default=3)
+    args = parser.parse_args()
+
+    candidates = _candidates(args.backlog + 2 * args.launches + 1)
+    for candidate in candidates:
+        _ = candidate.fingerprint
+
+    print("=" * 80)
+    print(f"READY QUEUE: {args.launches} launches, backlog {args.backlog}, {args.rungs} rungs")
+    print("=" * 80)
+    results = {}
+    for name, factory in (("deque + sets", LegacyQueue), ("ReadyQueue", IndexedQueue)):
+        impl = factory(args.rungs, args.backlog)
+        elapsed = _run(impl, candidates, args.launches, args.backlog, args.inflight, args.rungs)
+        results[name] = elapsed
+        print(f"{name:<14} {elapsed:8.3f} s   {1e6 * elapsed / args.launches:8.2f} us/launch")
+    print(f"speedup        {results['deque + sets'] / results['ReadyQueue']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
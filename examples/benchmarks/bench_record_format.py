@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Cache Record Format Benchmark
+
+Compares loading a populated evaluation cache stored as JSON lines (default
+backend) against the binary record format (``cache_backend="binary"``).
+
+For each format the benchmark reports, on a fresh cache instance:
+    - time to load every candidate and read ``objectives["quality"]`` only
+    - memory held by the loaded records (tracemalloc)
+    - time to additionally materialise every trace
+
+Usage:
+    python examples/benchmarks/bench_record_format.py
+    python examples/benchmarks/bench_record_format.py --records 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from turbo_gepa.cache import create_cache
+from turbo_gepa.interfaces import Candidate, EvalResult
+
+
+def _make_result(example_id: str, quality: float) -> EvalResult:
+    return EvalResult(
+        objectives={"quality": quality, "neg_cost": -512.0},
+        traces=[
+            {
+                "example_id": example_id,
+                "quality": quality,
+                "tokens": 512.0,
+                "input": "What is the sum of the first 100 positive integers? " * 3,
+                "expected_answer": "5050",
+                "output": "Pair the numbers from both ends... " * 20,
+            }
+        ],
+        n_examples=1,
+        shard_fraction=0.2,
+        example_ids=[example_id],
+    )
+
+
+async def _populate(root: str, backend: str, candidates: list[Candidate], per_candidate: int) -> None:
+    cache = create_cache(root, backend)
+    for idx, cand in enumerate(candidates):
+        await cache.batch_set(
+            [(cand, f"ex-{j}", _make_result(f"ex-{j}", float((idx + j) % 2))) for j in range(per_candidate)]
+        )
+
+
+async def _load_scores(root: str, backend: str, candidates: list[Candidate], example_ids: list[str]):
+    cache = create_cache(root, backend)
+    total = 0.0
+    for cand in candidates:
+        for example_id in example_ids:
+            total += (await cache.get(cand, example_id)).objectives["quality"]
+    return cache
+
+
+async def _measure(root: str, backend: str, candidates: list[Candidate], per_candidate: int) -> dict[str, float]:
+    example_ids = [f"ex-{j}" for j in range(per_candidate)]
+
+    start = time.perf_counter()
+    cache = await _load_scores(root, backend, candidates, example_ids)
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for cand in candidates:
+        for example_id in example_ids:
+            len((await cache.get(cand, example_id)).traces)
+    trace_seconds = time.perf_counter() - start
+    del cache
+
+    # Memory is measured on a separate pass since tracing slows allocation down
+    gc.collect()
+    tracemalloc.start()
+    cache = await _load_scores(root, backend, candidates, example_ids)
+    resident, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    disk = sum(path.stat().st_size for path in Path(root).rglob("*") if path.is_file())
+    return {"load": load_seconds, "memory": resident, "traces": trace_seconds, "disk": disk}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--examples-per-candidate", type=int, default=50)
+    args = parser.parse_args()
+
+    per_candidate = args.examples_per_candidate
+    n_candidates = max(1, args.records // per_candidate)
+    candidates = [Candidate(text=f"Prompt variant {i}: solve the problem step by step.") for i in range(n_candidates)]
+
+    print("=" * 80)
+    print(f"CACHE RECORD FORMAT ({n_candidates * per_candidate:,} records)")
+    print("=" * 80)
+    print(f"{'format':>8} {'load (scores)':>14} {'resident MB':>12} {'+ traces':>10} {'disk MB':>9}")
+    for backend in ("jsonl", "binary"):
+        root = tempfile.mkdtemp(prefix=f"bench_{backend}_")
+        try:
+            asyncio.run(_populate(root, backend, candidates, per_candidate))
+            stats = asyncio.run(_measure(root, backend, candidates, per_candidate))
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+        print(
+            f"{backend:>8} {stats['load']:>13.2f}s {stats['memory'] / 1e6:>12.1f} "
+            f"{stats['traces']:>9.2f}s {stats['disk'] / 1e6:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,8 @@ except ImportError:
     # dspy not installed
     pass
 from .archive import Archive
-from .cache import DiskCache
+from .binary_cache import BinaryCache
+from .cache import DiskCache, create_cache
 from .config import (
     DEFAULT_CONFIG,
     Config,
@@ -26,11 +27,15 @@ from .config import (
     lightning_config,
     sprint_config,
 )
-from .evaluator import AsyncEvaluator
+from .evaluator import AsyncEvaluator, InflightRegistry
 from .interfaces import Candidate, EvalResult
+from .llm_backend import LiteLLMBackend, LLMBackend, SimulatedBackend
 from .mutator import MutationConfig, Mutator
 from .orchestrator import Orchestrator
 from .sampler import InstanceSampler
+from .score_matrix import ScoreMatrix
+from .segment_cache import SegmentCache
+from .sqlite_cache import SqliteCache
 
 # High-level API
 # High-level optimize() API removed to avoid half-baked rule-based path
@@ -21,19 +21,21 @@ from pathlib import Path
 from typing import Any, Sequence
 
 from turbo_gepa.archive import Archive
-from turbo_gepa.cache import DiskCache
+from turbo_gepa.cache import DiskCache, cache_namespace, create_cache, evaluation_key
 from turbo_gepa.config import (
     DEFAULT_CONFIG,
     Config,
     adaptive_config,
     recommended_executor_workers,
 )
-from turbo_gepa.evaluator import AsyncEvaluator
+from turbo_gepa.evaluator import AsyncEvaluator, InflightRegistry
 from turbo_gepa.interfaces import Candidate, EvalResult
 from turbo_gepa.islands import IslandContext, spawn_islands
+from turbo_gepa.llm_backend import LiteLLMBackend, LLMBackend
 from turbo_gepa.logging.logger import LogLevel, StdOutLogger
 from turbo_gepa.mutator import MutationConfig, Mutator
 from turbo_gepa.orchestrator import Orchestrator
+from turbo_gepa.rate_limiter import RateLimiter, estimate_tokens, shared_rate_limiter
 from turbo_gepa.sampler import InstanceSampler
 
 
@@ -68,6 +70,23 @@ class ModelConfig:
     max_tokens: int | None = 24000
     reasoning_effort: str | None = None
 
+    @property
+    def fingerprint(self) -> str:
+        """Stable identifier of the settings that change what the model returns."""
+        return cache_namespace(self.name, self.temperature, self.max_tokens, self.reasoning_effort)
+
+
+class _LimitedBackend:
+    """:class:`LLMBackend` view of an adapter whose calls go through its shared rate limiter."""
+
+    def __init__(self, adapter: DefaultAdapter, call_type: str, *, timeout: float) -> None:
+        self._adapter = adapter
+        self._call_type = call_type
+        self._timeout = timeout
+
+    async def acompletion(self, **kwargs: Any) -> Any:
+        return await self._adapter._limited_completion(self._call_type, kwargs, timeout=self._timeout)
+
 
 class DefaultAdapter:
     """
@@ -90,6 +109,8 @@ class DefaultAdapter:
         auto_config: Enable automatic configuration (default: True)
         shard_strategy: Strategy - "balanced", "conservative", or "aggressive"
         available_compute: "laptop", "workstation", or "server" (default: "laptop")
+        backend: LLM backend for task, reflection and seed-initialization calls
+            (default: litellm; pass a ``SimulatedBackend`` for offline runs)
 
     Example usage::
 
@@ -145,6 +166,7 @@ class DefaultAdapter:
         auto_config: bool = True,
         shard_strategy: str = "balanced",
         available_compute: str = "laptop",
+        backend: LLMBackend | None = None,
     ) -> None:
         if not dataset:
             raise ValueError("dataset must contain at least one data instance")
@@ -196,6 +218,8 @@ class DefaultAdapter:
                 else config.reflection_lm_temperature,
             )
 
+        self.backend: LLMBackend = backend if backend is not None else LiteLLMBackend()
+
         # Convenience string attributes (backwards-compatibility)
         self.task_lm = self.task_model.name
         self.reflection_lm = self.reflection_model.name
@@ -209,11 +233,15 @@ class DefaultAdapter:
         self.base_log_dir = log_dir or config.log_path
         Path(self.base_cache_dir).mkdir(parents=True, exist_ok=True)
         Path(self.base_log_dir).mkdir(parents=True, exist_ok=True)
-        self.cache = DiskCache(self.base_cache_dir)
+        # Records are only valid for the task model and scoring logic that produced them
+        self.cache_namespace = cache_namespace(self.task_model.fingerprint, config.cache_scoring_version)
+        self.cache = self._make_cache()
         self.archive = Archive(
             bins_length=config.qd_bins_length,
             bins_bullets=config.qd_bins_bullets,
             flags=config.qd_flags,
+            pareto_mode=config.pareto_mode,
+            objective=config.promote_objective,
         )
 
         # Temperature support will be checked lazily during Phase 2 (temperature optimization)
@@ -221,6 +249,14 @@ class DefaultAdapter:
         self.temperature_supported = True  # Assume supported, check later if needed
         self._temperature_warned = False
 
+        # Process-wide RPM/TPM limiters: every island, mutator and adapter calling the same model shares one budget
+        self.task_limiter = self._make_rate_limiter("task", self.task_model.name, config.task_rpm, config.task_tpm)
+        self.reflection_limiter = self._make_rate_limiter(
+            "reflection", self.reflection_model.name, config.reflection_rpm, config.reflection_tpm
+        )
+        # Admissions by (evaluation key, example): a call cancelled before it ran leaves one for the next identical call
+        self._admitted_task_calls: defaultdict[tuple[str, str], int] = defaultdict(int)
+
         # Create batched reflection runner and spec induction runner
         batch_reflection_runner = self._create_batched_llm_reflection_runner()
         spec_induction_runner = self._create_spec_induction_runner()
@@ -273,6 +309,73 @@ class DefaultAdapter:
             self.logger.log(f"⚠️  Disabling temperature optimization: {reason}", LogLevel.WARNING)
             self._temperature_warned = True
 
+    @staticmethod
+    def _make_rate_limiter(kind: str, model: str, rpm: float | None, tpm: float | None) -> RateLimiter | None:
+        if rpm is None and tpm is None:
+            return None
+        return shared_rate_limiter(f"{kind}:{model}", rpm, tpm)
+
+    def _record_rate_limit_wait(self, call_type: str, seconds: float) -> None:
+        metrics = getattr(self, "_metrics", None)
+        if metrics is not None:
+            metrics.record_rate_limit_wait(call_type, seconds)
+
+    def _task_messages(self, candidate: Candidate, example_id: str) -> list[dict[str, str]]:
+        return [
+            {"role": "system", "content": candidate.text},
+            {"role": "user", "content": self.example_map[example_id].input},
+        ]
+
+    @staticmethod
+    def _call_estimate(messages: Sequence[dict[str, str]], max_tokens: int | None) -> float:
+        """Tokens to reserve for a call: its prompt plus the completion budget, as providers meter it."""
+        return estimate_tokens(*(message["content"] for message in messages), completion_tokens=max_tokens or 0)
+
+    async def _admit_task_call(self, candidate: Candidate, example_id: str) -> None:
+        """Evaluator admission hook: queue for the task rate limit outside the evaluation timeout."""
+        if self.task_limiter is None:
+            return
+        estimate = self._call_estimate(self._task_messages(candidate, example_id), self.task_model.max_tokens)
+        self._record_rate_limit_wait("task", await self.task_limiter.acquire(estimate))
+        self._admitted_task_calls[(evaluation_key(candidate), example_id)] += 1
+
+    def _claim_task_admission(self, candidate: Candidate, example_id: str) -> bool:
+        """Take one admission made by :meth:`_admit_task_call` for this call, if any."""
+        key = (evaluation_key(candidate), example_id)
+        if not self._admitted_task_calls.get(key):
+            return False
+        self._admitted_task_calls[key] -= 1
+        if not self._admitted_task_calls[key]:
+            del self._admitted_task_calls[key]
+        return True
+
+    async def _limited_completion(
+        self,
+        call_type: str,
+        completion_kwargs: dict[str, Any],
+        *,
+        timeout: float,
+        admitted: bool = False,
+    ) -> Any:
+        """
+        ``self.backend.acompletion`` metered by the shared rate limiter for ``call_type``.
+
+        The wait for the limiter is not part of ``timeout``. A task call the
+        evaluator already admitted (see :meth:`_claim_task_admission`) does
+        not queue a second time.
+        """
+        limiter = self.task_limiter if call_type == "task" else self.reflection_limiter
+        estimate = 0.0
+        if limiter is not None:
+            estimate = self._call_estimate(completion_kwargs["messages"], completion_kwargs.get("max_tokens"))
+            if not admitted:
+                self._record_rate_limit_wait(call_type, await limiter.acquire(estimate))
+        response = await asyncio.wait_for(self.backend.acompletion(**completion_kwargs), timeout=timeout)
+        if limiter is not None:
+            usage = getattr(response, "usage", None)
+            limiter.settle(estimate, getattr(usage, "total_tokens", None))
+        return response
+
     def _check_temperature_support(self, model: str, test_temp: float) -> bool:
         """Quick test to see if model supports custom temperature.
 
@@ -346,8 +449,6 @@ class DefaultAdapter:
                 self._log_debug("\n".join(debug_lines))
 
             try:
-                from litellm import acompletion
-
                 # Build rich reflection prompt showing multiple successful prompts
                 parent_summaries = []
                 for i, ctx in enumerate(parent_contexts[:5]):  # Limit to 5 parents for token efficiency
@@ -483,7 +584,7 @@ IMPORTANT:
 
                 import asyncio
                 try:
-                    response = await asyncio.wait_for(acompletion(**completion_kwargs), timeout=180.0)
+                    response = await self._limited_completion("reflection", completion_kwargs, timeout=180.0)
                 except asyncio.TimeoutError:
                     raise
                 except Exception as e:
@@ -491,7 +592,7 @@ IMPORTANT:
                         self._disable_temperature_support(
                             f"{self.reflection_model.name} rejected temperature parameter"
                         )
-                        response = await asyncio.wait_for(acompletion(**completion_kwargs), timeout=180.0)
+                        response = await self._limited_completion("reflection", completion_kwargs, timeout=180.0)
                     else:
                         raise
 
@@ -594,8 +695,6 @@ IMPORTANT:
             start_time = time.time()
 
             try:
-                from litellm import acompletion
-
                 # Build rich examples summary with solutions (like incremental_reflection)
                 example_summaries = []
                 for i, ex in enumerate(task_examples[:3]):  # Limit to 3 examples
@@ -657,7 +756,7 @@ Output format: Return each instruction separated by "---" (exactly {num_specs} i
 
                 import asyncio
                 try:
-                    response = await asyncio.wait_for(acompletion(**completion_kwargs), timeout=180.0)
+                    response = await self._limited_completion("spec_induction", completion_kwargs, timeout=180.0)
                 except asyncio.TimeoutError:
                     raise
                 except Exception as e:
@@ -665,7 +764,7 @@ Output format: Return each instruction separated by "---" (exactly {num_specs} i
                         self._disable_temperature_support(
                             f"{self.reflection_model.name} rejected temperature parameter"
                         )
-                        response = await asyncio.wait_for(acompletion(**completion_kwargs), timeout=180.0)
+                        response = await self._limited_completion("spec_induction", completion_kwargs, timeout=180.0)
                     else:
                         raise
 
@@ -743,18 +842,30 @@ Output format: Return each instruction separated by "---" (exactly {num_specs} i
             bins_length=self.config.qd_bins_length,
             bins_bullets=self.config.qd_bins_bullets,
             flags=self.config.qd_flags,
+            pareto_mode=self.config.pareto_mode,
+            objective=self.config.promote_objective,
         )
 
     def _make_sampler(self, *, seed_offset: int = 0) -> InstanceSampler:
         return InstanceSampler(self._example_ids, seed=self._sampler_seed + seed_offset)
 
     def _make_cache(self, island_id: int | None = None) -> DiskCache:
-        if island_id is None:
-            return DiskCache(self.base_cache_dir)
+        budget_mb = self.config.cache_memory_budget_mb
+        options = {
+            "memory_budget_bytes": int(budget_mb * 1024 * 1024) if budget_mb is not None else None,
+            "evict_traces_only": self.config.cache_evict_traces_only,
+            "namespace": self.cache_namespace,
+        }
         path = Path(self.base_cache_dir)
-        island_path = path / f"island_{island_id}"
-        island_path.mkdir(parents=True, exist_ok=True)
-        return DiskCache(str(island_path))
+        if island_id is not None:
+            path = path / f"island_{island_id}"
+            path.mkdir(parents=True, exist_ok=True)
+        if self.config.shared_cache_dir:
+            # Records go to the fleet-wide store; resume state stays with this run
+            return create_cache(
+                self.config.shared_cache_dir, self.config.cache_backend, state_dir=str(path), **options
+            )
+        return create_cache(str(path), self.config.cache_backend, **options)
 
     def _make_log_dir(self, island_id: int | None = None) -> str:
         path = Path(self.base_log_dir)
@@ -826,17 +937,14 @@ Output format: Return each instruction separated by "---" (exactly {num_specs} i
 
     async def _task_runner(self, candidate: Candidate, example_id: str) -> dict[str, float]:
         """Execute task LLM on a single example."""
+        # Claimed before anything here can raise, so an admission never outlives its call
+        admitted = self._claim_task_admission(candidate, example_id)
         example = self.example_map[example_id].to_payload()
 
         try:
-            from litellm import acompletion
-
             completion_kwargs: dict[str, Any] = {
                 "model": self.task_model.name,
-                "messages": [
-                    {"role": "system", "content": candidate.text},
-                    {"role": "user", "content": example["input"]},
-                ],
+                "messages": self._task_messages(candidate, example_id),
             }
             if self.task_model.max_tokens is not None:
                 completion_kwargs["max_tokens"] = self.task_model.max_tokens
@@ -859,7 +967,9 @@ Output format: Return each instruction separated by "---" (exactly {num_specs} i
             try:
                 # Add timeout to prevent hanging on slow API calls
                 import asyncio
-                response = await asyncio.wait_for(acompletion(**completion_kwargs), timeout=120.0)
+                response = await self._limited_completion(
+                    "task", completion_kwargs, timeout=120.0, admitted=admitted
+                )
                 _elapsed_llm = _time_module.time() - _start_llm
 
                 # Track LLM call in metrics if available
@@ -894,9 +1004,7 @@ Output format: Return each instruction separated by "---" (exactly {num_specs} i
                 if "temperature" in str(e).lower() and completion_kwargs.get("temperature") is not None:
                     self._disable_temperature_support(f"{self.task_model.name} rejected temperature parameter")
                     completion_kwargs.pop("temperature", None)
-                    if isinstance(candidate.meta, dict):
-                        candidate.meta.pop("temperature", None)
-                    response = await asyncio.wait_for(acompletion(**completion_kwargs), timeout=120.0)
+                    response = await self._limited_completion("task", completion_kwargs, timeout=120.0)
                 else:
                     raise  # Re-raise if it's a different error
 
@@ -946,6 +1054,7 @@ Output format: Return each instruction separated by "---" (exactly {num_specs} i
         mutator: Mutator | None = None,
         log_dir: str | None = None,
         metrics_callback: Callable | None = None,
+        inflight: InflightRegistry | None = None,
     ) -> Orchestrator:
         target_mutator = mutator or self.mutator
         if temperature_mutations_enabled and not self.temperature_supported:
@@ -969,6 +1078,12 @@ Output format: Return each instruction separated by "---" (exactly {num_specs} i
             metrics_mapper=metrics_mapper,
             timeout_seconds=self.config.eval_timeout_seconds,
             min_improve=self.config.eps_improve,
+            write_behind_records=self.config.cache_write_behind_records,
+            write_behind_interval=self.config.cache_write_behind_interval,
+            hedge_percentile=self.config.hedge_percentile,
+            hedge_budget=self.config.hedge_budget,
+            admission=self._admit_task_call if self.task_limiter is not None else None,
+            inflight=inflight,
         )
         # Create stop governor if auto-stop enabled
         # Use provided metrics_callback, or create dashboard if progress display is enabled
@@ -1207,6 +1322,8 @@ Output format: Return each instruction separated by "---" (exactly {num_specs} i
 
         # Create shared cache across all islands (better cache hits + controlled concurrency)
         shared_cache = self._make_cache(island_id=None)
+        # Islands evaluating the same shared/migrated elite join each other's in-flight task calls
+        shared_inflight = InflightRegistry()
 
         async def run_islands() -> list[Orchestrator | None]:
             island_results: list[Orchestrator | None] = [None] * n_islands
@@ -1231,6 +1348,7 @@ Output format: Return each instruction separated by "---" (exactly {num_specs} i
                     sampler=sampler,
                     mutator=mutator,
                     log_dir=log_dir,
+                    inflight=shared_inflight,
                 )
                 # Pass metrics to mutator for tracking mutation LLM calls
                 mutator._metrics = orchestrator.metrics
@@ -1402,6 +1520,7 @@ Output format: Return each instruction separated by "---" (exactly {num_specs} i
                     num_generated_seeds=num_generated_seeds,
                     reflection_lm=self.reflection_lm,
                     reflection_lm_temperature=self.reflection_model.temperature,
+                    backend=_LimitedBackend(self, "seed_initialization", timeout=180.0),
                 )
             )
         elif seeds is None:
@@ -49,7 +49,7 @@ import dspy
 from dspy.primitives import Example, Prediction
 
 from turbo_gepa.archive import Archive
-from turbo_gepa.cache import DiskCache
+from turbo_gepa.cache import create_cache
 from turbo_gepa.config import DEFAULT_CONFIG, Config
 from turbo_gepa.evaluator import AsyncEvaluator
 from turbo_gepa.interfaces import Candidate
@@ -124,11 +124,19 @@ class DSpyAdapter:
 
         # Initialize TurboGEPA components
         self.sampler = InstanceSampler(list(self.example_map.keys()), seed=sampler_seed)
-        self.cache = DiskCache(cache_dir or config.cache_path)
+        budget_mb = config.cache_memory_budget_mb
+        self.cache = create_cache(
+            cache_dir or config.cache_path,
+            config.cache_backend,
+            memory_budget_bytes=int(budget_mb * 1024 * 1024) if budget_mb is not None else None,
+            evict_traces_only=config.cache_evict_traces_only,
+        )
         self.archive = Archive(
             bins_length=config.qd_bins_length,
             bins_bullets=config.qd_bins_bullets,
             flags=config.qd_flags,
+            pareto_mode=config.pareto_mode,
+            objective=config.promote_objective,
         )
         self.log_dir = log_dir or config.log_path
 
@@ -451,6 +459,10 @@ class DSpyAdapter:
             task_runner=self._task_runner,
             timeout_seconds=self.config.eval_timeout_seconds,
             min_improve=self.config.eps_improve,
+            write_behind_records=self.config.cache_write_behind_records,
+            write_behind_interval=self.config.cache_write_behind_interval,
+            hedge_percentile=self.config.hedge_percentile,
+            hedge_budget=self.config.hedge_budget,
         )
         return Orchestrator(
             config=self.config,
@@ -3,6 +3,19 @@ Pareto + QD archive for TurboGEPA.
 
 This module maintains both a multi-objective frontier and a quality-diversity
 grid keyed off simple textual features derived from candidate text.
+
+The frontier is either Pareto-optimal over aggregate objectives
+(``pareto_mode="aggregate"``) or, as in GEPA, over individual examples
+(``pareto_mode="instance"``): every candidate that is best on at least one
+example survives unless another candidate wins a superset of its examples.
+GEPA compares candidates on a fixed Pareto validation set; here that set is
+the full dataset, so example columns only take scores from full-dataset
+evaluations and partial-shard candidates compete on their aggregate alone.
+Per-example winners are kept as integer bitsets over candidate slots, so an
+insert touches only the examples it scored and recomputing the frontier is a
+handful of big-integer operations per candidate. Candidates that leave the
+frontier keep their slot and scores, so a winner re-scored lower hands its
+examples to the next-best candidate.
 """
 
 from __future__ import annotations
@@ -10,11 +23,22 @@ from __future__ import annotations
 import asyncio
 import random
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from typing import Any, Iterable, Sequence
 
-from .cache import candidate_key
+from .cache import (
+    SerializationMemo,
+    candidate_key,
+    deserialize_candidate,
+    deserialize_result,
+    serialize_candidate,
+    serialize_result,
+)
 from .interfaces import Candidate, EvalResult
 
+PARETO_MODES = ("aggregate", "instance")
+# Column holding each candidate's aggregate objective, so the best mean always stays on the instance frontier
+_AGGREGATE_COLUMN = ""
+
 
 @dataclass
 class ArchiveEntry:
@@ -25,12 +49,43 @@ class ArchiveEntry:
 class Archive:
     """Hybrid archive exposing Pareto- and QD-based sampling utilities."""
 
-    def __init__(self, bins_length: int, bins_bullets: int, *, flags: Sequence[str] | None = None) -> None:
+    def __init__(
+        self,
+        bins_length: int,
+        bins_bullets: int,
+        *,
+        flags: Sequence[str] | None = None,
+        pareto_mode: str = "aggregate",
+        objective: str = "quality",
+    ) -> None:
+        if pareto_mode not in PARETO_MODES:
+            raise ValueError(f"Unknown pareto mode: '{pareto_mode}'. Choose from: {', '.join(PARETO_MODES)}")
         self.pareto: dict[str, ArchiveEntry] = {}
         self.qd_grid: dict[tuple[int, int, frozenset[str]], ArchiveEntry] = {}
         self.bins_length = bins_length
         self.bins_bullets = bins_bullets
         self.flags = tuple(flags or ())
+        self.pareto_mode = pareto_mode
+        self.objective = objective
+        # Instance mode: every inserted candidate gets a slot (its bit); each example column tracks
+        # its best score and the bitset of slots achieving it; each slot tracks the bitset of columns it wins.
+        # Slots off the frontier remember one slot that out-wins them, so an insert only re-checks the
+        # slots whose wins changed and the slots those used to out-win.
+        self._slots: dict[str, int] = {}
+        self._slot_keys: list[str] = []
+        self._slot_entries: list[ArchiveEntry] = []
+        self._slot_scores: list[dict[int, float]] = []
+        self._columns: dict[str, int] = {}
+        self._best: list[float] = []
+        self._winners: list[int] = []
+        self._slot_wins: dict[int, int] = {}
+        self._changed: set[int] = set()
+        self._frontier: set[int] = set()
+        self._witness: dict[int, int] = {}
+        self._witnessed: dict[int, set[int]] = {}
+        self._reset_instance()
+        # Serialized entries reused across checkpoints until the entry is replaced
+        self._entry_memo = SerializationMemo(_serialize_entry)
         # Locks to prevent concurrent modification of archives
         self._pareto_lock = asyncio.Lock()
         self._qd_lock = asyncio.Lock()
@@ -40,7 +95,10 @@ class Archive:
         cand_hash = candidate_key(candidate)
         entry = ArchiveEntry(candidate=candidate, result=result)
         async with self._pareto_lock:
-            self._maintain_pareto(cand_hash, entry)
+            if self.pareto_mode == "instance":
+                self._maintain_instance_pareto(cand_hash, entry)
+            else:
+                self._maintain_pareto(cand_hash, entry)
         async with self._qd_lock:
             self._maintain_qd(entry)
 
@@ -60,13 +118,31 @@ class Archive:
         random.shuffle(elites)
         return [entry.candidate for entry in elites[:limit]]
 
+    def instance_wins(self) -> dict[str, int]:
+        """Instance mode: number of examples each frontier candidate is (jointly) best on."""
+        # Column 0 is the aggregate objective, not an example
+        return {self._slot_keys[slot]: (self._slot_wins[slot] >> 1).bit_count() for slot in self._frontier}
+
     def select_for_generation(self, k_exploit: int, k_explore: int, objective: str = "quality") -> list[Candidate]:
-        """Return a mixed batch of exploit/explore candidates."""
+        """
+        Return a mixed batch of exploit/explore candidates.
+
+        In instance mode exploit picks are drawn in proportion to the number of
+        examples each candidate wins (as GEPA samples parents), not by mean.
+        """
         pareto_sorted = sorted(
             self.pareto.values(),
             key=lambda entry: entry.result.objectives.get(objective, float("-inf")),
             reverse=True,
         )
+        if self.pareto_mode == "instance" and len(pareto_sorted) > k_exploit > 0:
+            wins = self.instance_wins()
+            pool = list(pareto_sorted)
+            drawn: list[ArchiveEntry] = []
+            while pool and len(drawn) < k_exploit:
+                weights = [wins.get(candidate_key(entry.candidate), 0) + 1 for entry in pool]
+                drawn.append(pool.pop(random.choices(range(len(pool)), weights=weights)[0]))
+            pareto_sorted = drawn + pool
         exploit = [entry.candidate for entry in pareto_sorted[:k_exploit]]
         explore = self.sample_qd(k_explore)
         missing = max(0, k_exploit + k_explore - len(exploit) - len(explore))
@@ -92,6 +168,51 @@ class Archive:
                 break
         return uniq
 
+    def get_state(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot of the Pareto frontier and QD grid."""
+        memo = self._entry_memo
+        state = {
+            "pareto": {key: memo(f"pareto:{key}", entry) for key, entry in self.pareto.items()},
+            "qd": {
+                candidate_key(entry.candidate): [
+                    [length_bin, bullet_bin, sorted(flags)],
+                    *memo(f"qd:{candidate_key(entry.candidate)}", entry),
+                ]
+                for (length_bin, bullet_bin, flags), entry in self.qd_grid.items()
+            },
+        }
+        if self.pareto_mode == "instance":
+            # Every inserted candidate with its per-example scores, in slot order, to rebuild the bitsets
+            columns = sorted(self._columns, key=self._columns.__getitem__)
+            state["instance"] = {
+                key: [
+                    *memo(f"instance:{key}", entry),
+                    {columns[col]: score for col, score in scores.items()},
+                ]
+                for key, entry, scores in zip(self._slot_keys, self._slot_entries, self._slot_scores, strict=True)
+            }
+        memo.prune()
+        return state
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Restore a snapshot produced by :meth:`get_state`."""
+        self.pareto = {
+            key: ArchiveEntry(deserialize_candidate(candidate), deserialize_result(result))
+            for key, (candidate, result) in state.get("pareto", {}).items()
+        }
+        self.qd_grid = {
+            (int(cell[0]), int(cell[1]), frozenset(cell[2])): ArchiveEntry(
+                deserialize_candidate(candidate), deserialize_result(result)
+            )
+            for cell, candidate, result in state.get("qd", {}).values()
+        }
+        self._reset_instance()
+        if self.pareto_mode == "instance" and "instance" in state:
+            for key, (candidate, result, scores) in state["instance"].items():
+                entry = ArchiveEntry(deserialize_candidate(candidate), deserialize_result(result))
+                self._update_instance_scores(key, entry, scores)
+            self._refresh_instance_frontier()
+
     def _maintain_pareto(self, cand_hash: str, entry: ArchiveEntry) -> None:
         dominated = []
         for key, existing in self.pareto.items():
@@ -118,6 +239,132 @@ class Archive:
             del self.pareto[key]
         self.pareto[cand_hash] = entry
 
+    def _maintain_instance_pareto(self, cand_hash: str, entry: ArchiveEntry) -> None:
+        scores: dict[str, float] = {}
+        # Only full-dataset evaluations fill example columns, so every column compares candidates
+        # scored on the same examples; a lucky partial shard cannot hold an example nobody else saw.
+        if (entry.result.shard_fraction or 0.0) >= 1.0:
+            scores.update(entry.result.example_scores(self.objective))
+        aggregate = entry.result.objectives.get(self.objective)
+        if isinstance(aggregate, (int, float)):
+            scores[_AGGREGATE_COLUMN] = float(aggregate)
+        slot = self._slots.get(cand_hash)
+        if slot is not None:
+            # Same rule as aggregate mode: a smaller-shard evaluation never replaces a larger one
+            if (entry.result.shard_fraction or 0.0) < (self._slot_entries[slot].result.shard_fraction or 0.0):
+                scores.pop(_AGGREGATE_COLUMN, None)
+                entry = self._slot_entries[slot]
+        self._update_instance_scores(cand_hash, entry, scores)
+        self._refresh_instance_frontier()
+        if cand_hash in self.pareto:
+            self.pareto[cand_hash] = entry
+
+    def _reset_instance(self) -> None:
+        self._slots = {}
+        self._slot_keys = []
+        self._slot_entries = []
+        self._slot_scores = []
+        self._columns = {_AGGREGATE_COLUMN: 0}
+        self._best = [float("-inf")]
+        self._winners = [0]
+        self._slot_wins = {}
+        self._changed = set()
+        self._frontier = set()
+        self._witness = {}
+        self._witnessed = {}
+
+    def _update_instance_scores(self, cand_hash: str, entry: ArchiveEntry, scores: dict[str, float]) -> None:
+        slot = self._slots.get(cand_hash)
+        if slot is None:
+            slot = len(self._slot_entries)
+            self._slots[cand_hash] = slot
+            self._slot_keys.append(cand_hash)
+            self._slot_entries.append(entry)
+            self._slot_scores.append({})
+        else:
+            self._slot_entries[slot] = entry
+        self._changed.add(slot)
+        bit = 1 << slot
+        own = self._slot_scores[slot]
+        for example_id, score in scores.items():
+            col = self._columns.get(example_id)
+            if col is None:
+                col = len(self._best)
+                self._columns[example_id] = col
+                self._best.append(float("-inf"))
+                self._winners.append(0)
+            lowered = self._winners[col] & bit and score < own.get(col, score)
+            own[col] = score
+            if lowered:
+                # A winner was re-scored lower: rebuild the column from every slot's score
+                best = max(values[col] for values in self._slot_scores if col in values)
+                winners = 0
+                for other, values in enumerate(self._slot_scores):
+                    if values.get(col) == best:
+                        winners |= 1 << other
+                self._set_winners(col, best, winners)
+            elif score > self._best[col]:
+                self._set_winners(col, score, bit)
+            elif score == self._best[col]:
+                self._set_winners(col, score, self._winners[col] | bit)
+
+    def _set_winners(self, col: int, best: float, winners: int) -> None:
+        # Flip the column bit for exactly the slots that joined or left its winners
+        changed = self._winners[col] ^ winners
+        self._best[col] = best
+        self._winners[col] = winners
+        col_bit = 1 << col
+        while changed:
+            low = changed & -changed
+            slot = low.bit_length() - 1
+            mask = self._slot_wins.get(slot, 0) ^ col_bit
+            self._changed.add(slot)
+            if mask:
+                self._slot_wins[slot] = mask
+            else:
+                self._slot_wins.pop(slot, None)
+            changed ^= low
+
+    def _outwins(self, slot: int, other: int) -> bool:
+        """True if ``slot`` wins every example ``other`` wins (and more, or ties it as the older slot)."""
+        mask = self._slot_wins.get(slot, 0)
+        other_mask = self._slot_wins[other]
+        return other_mask & ~mask == 0 and (mask != other_mask or slot < other)
+
+    def _refresh_instance_frontier(self) -> None:
+        # Out-winning is transitive, so a slot is off the frontier iff some frontier slot out-wins it.
+        # Only slots whose wins changed, and slots they used to out-win, can change status.
+        affected = set(self._changed)
+        for slot in self._changed:
+            affected |= self._witnessed.pop(slot, set())
+        self._changed = set()
+        keys = self._slot_keys
+        for slot in affected:
+            witness = self._witness.pop(slot, None)
+            if witness is not None:
+                self._witnessed.get(witness, set()).discard(slot)
+            if slot in self._frontier:
+                self._frontier.discard(slot)
+                del self.pareto[keys[slot]]
+
+        def rank(slot: int) -> tuple[int, int]:
+            return -self._slot_wins[slot].bit_count(), slot
+
+        # Stronger slots first, so a slot's possible out-winners are settled before it
+        for slot in sorted((slot for slot in affected if slot in self._slot_wins), key=rank):
+            witness = next((other for other in self._frontier if self._outwins(other, slot)), None)
+            if witness is not None:
+                self._witness[slot] = witness
+                self._witnessed.setdefault(witness, set()).add(slot)
+                continue
+            for other in [other for other in self._frontier if self._outwins(slot, other)]:
+                self._frontier.discard(other)
+                del self.pareto[keys[other]]
+                self._witness[other] = slot
+                self._witnessed.setdefault(slot, set()).add(other)
+            self._frontier.add(slot)
+            self.pareto[keys[slot]] = self._slot_entries[slot]
+
     def _maintain_qd(self, entry: ArchiveEntry) -> None:
         cell = qd_cell(entry.candidate, self.bins_length, self.bins_bullets, self.flags)
         elite = self.qd_grid.get(cell)
@@ -125,6 +372,10 @@ class Archive:
             self.qd_grid[cell] = entry
 
 
+def _serialize_entry(entry: ArchiveEntry) -> list[dict]:
+    return [serialize_candidate(entry.candidate), serialize_result(entry.result)]
+
+
 def dominates(lhs: EvalResult, rhs: EvalResult) -> bool:
     """Return True if ``lhs`` dominates ``rhs`` across all objectives."""
     lhs_keys = set(lhs.objectives)
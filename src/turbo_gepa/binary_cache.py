@@ -0,0 +1,315 @@
+"""
+Binary evaluation cache backend.
+
+Records keep the per-candidate file layout of :class:`DiskCache` but are stored
+in a compact, versioned binary format instead of JSON lines::
+
+    <u32 body length> <body>
+
+    body (version 1):
+        u8   version
+        u8   flags            (bit 0: non-numeric objectives live in the trace blob)
+        u16  example_id length, example_id (utf-8)
+        u32  n_examples
+        f64  shard_fraction   (NaN when unknown)
+        u16  objective count, then per objective: u16 name length, name (utf-8), f64 value
+        ...  trace blob       (JSON, decoded only when ``traces`` is first accessed)
+
+Loading a candidate therefore parses a fixed-layout header per record and keeps
+the trace blob as raw bytes. Loads are per candidate, so records for examples a
+run never asks about (other shards, older runs sharing the cache) are never
+decoded either. Served records stay undecoded through shard aggregation, the
+scheduler, the score matrix and the archive, which read per-example scores
+from objectives (:meth:`EvalResult.example_scores`). A shard result's traces
+are decoded when something reads them: reflection on a parent, or the next
+checkpoint, which serializes the latest results in full. Legacy ``.jsonl``
+files in the same directory are still read (binary records win on conflict),
+and :meth:`BinaryCache.migrate` converts them in place.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import struct
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+from .cache import DiskCache
+from .interfaces import EvalResult
+
+RECORD_VERSION = 1
+_FLAG_EXTRA_OBJECTIVES = 0x01
+
+_LENGTH = struct.Struct("<I")
+_PREFIX = struct.Struct("<BBH")
+_COUNTS = struct.Struct("<IdH")
+_NAME = struct.Struct("<H")
+_VALUE = struct.Struct("<d")
+
+
+class _LazyEvalResult(EvalResult):
+    """EvalResult whose traces are decoded from the record blob on first access."""
+
+    def __init__(
+        self,
+        objectives: dict[str, float],
+        trace_blob: bytes,
+        n_examples: int,
+        shard_fraction: float | None,
+        example_ids: list[str],
+    ) -> None:
+        self.objectives = objectives
+        self.n_examples = n_examples
+        self.shard_fraction = shard_fraction
+        self.example_ids = example_ids
+        self._trace_blob: bytes | None = trace_blob
+        self._traces: list[dict[str, Any]] | None = None
+        # Set by BinaryCache while the record is resident, to re-account its memory once decoded
+        self._on_decode: Callable[[_LazyEvalResult, int], None] | None = None
+
+    @property
+    def traces(self) -> list[dict[str, Any]]:
+        if self._traces is None:
+            undecoded = self.undecoded_bytes()
+            payload = json.loads(self._trace_blob) if self._trace_blob else {}
+            self._traces = payload.get("traces", [])
+            self._trace_blob = None
+            self._decoded(undecoded)
+        return self._traces
+
+    @traces.setter
+    def traces(self, value: list[dict[str, Any]]) -> None:
+        undecoded = self.undecoded_bytes() if self._traces is None else None
+        self._traces = value
+        self._trace_blob = None
+        if undecoded is not None:
+            self._decoded(undecoded)
+
+    def _decoded(self, undecoded: int) -> None:
+        hook, self._on_decode = self._on_decode, None
+        if hook is not None:
+            hook(self, undecoded)
+
+    def undecoded_bytes(self) -> int:
+        """Approximate heap footprint while the trace blob is still raw bytes."""
+        return 240 + 96 * len(self.objectives) + self.trace_blob_size
+
+    @property
+    def traces_decoded(self) -> bool:
+        return self._traces is not None
+
+    @property
+    def trace_blob_size(self) -> int:
+        return len(self._trace_blob) if self._trace_blob is not None else 0
+
+    def __repr__(self) -> str:
+        # Avoid decoding traces just to print the result
+        traces = repr(self._traces) if self._traces is not None else f"<{self.trace_blob_size} undecoded bytes>"
+        return (
+            f"EvalResult(objectives={self.objectives!r}, traces={traces}, n_examples={self.n_examples!r}, "
+            f"shard_fraction={self.shard_fraction!r}, example_ids={self.example_ids!r})"
+        )
+
+
+def encode_record(record: dict[str, Any]) -> bytes:
+    """Encode a cache record dict (as built by ``DiskCache._record_from_result``) to bytes."""
+    numeric: list[tuple[str, float]] = []
+    extra: dict[str, Any] = {}
+    for name, value in (record.get("objectives") or {}).items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            numeric.append((str(name), float(value)))
+        else:
+            extra[name] = value
+    blob: dict[str, Any] = {"traces": record.get("traces") or []}
+    flags = 0
+    if extra:
+        blob["objectives"] = extra
+        flags |= _FLAG_EXTRA_OBJECTIVES
+
+    example_id = str(record["example_id"]).encode("utf-8")
+    shard_fraction = record.get("shard_fraction")
+    parts = [
+        _PREFIX.pack(RECORD_VERSION, flags, len(example_id)),
+        example_id,
+        _COUNTS.pack(
+            int(record.get("n_examples", 1)),
+            math.nan if shard_fraction is None else float(shard_fraction),
+            len(numeric),
+        ),
+    ]
+    for name, value in numeric:
+        encoded = name.encode("utf-8")
+        parts.append(_NAME.pack(len(encoded)))
+        parts.append(encoded)
+        parts.append(_VALUE.pack(value))
+    parts.append(json.dumps(blob, separators=(",", ":")).encode("utf-8"))
+    body = b"".join(parts)
+    return _LENGTH.pack(len(body)) + body
+
+
+def decode_record(body: bytes | memoryview) -> tuple[str, EvalResult]:
+    """Decode one record body into ``(example_id, result)`` without touching the trace blob."""
+    version, flags, id_len = _PREFIX.unpack_from(body, 0)
+    if version != RECORD_VERSION:
+        raise ValueError(f"Unsupported cache record version: {version}")
+    offset = _PREFIX.size
+    example_id = bytes(body[offset : offset + id_len]).decode("utf-8")
+    offset += id_len
+    n_examples, shard_fraction, n_objectives = _COUNTS.unpack_from(body, offset)
+    offset += _COUNTS.size
+    objectives: dict[str, float] = {}
+    for _ in range(n_objectives):
+        (name_len,) = _NAME.unpack_from(body, offset)
+        offset += _NAME.size
+        name = bytes(body[offset : offset + name_len]).decode("utf-8")
+        offset += name_len
+        (objectives[name],) = _VALUE.unpack_from(body, offset)
+        offset += _VALUE.size
+    blob = bytes(body[offset:])
+    result = _LazyEvalResult(
+        objectives=objectives,
+        trace_blob=blob,
+        n_examples=n_examples,
+        shard_fraction=None if math.isnan(shard_fraction) else shard_fraction,
+        example_ids=[example_id],
+    )
+    if flags & _FLAG_EXTRA_OBJECTIVES:
+        payload = json.loads(blob)
+        objectives.update(payload.get("objectives", {}))
+        result.traces = payload.get("traces", [])
+    return example_id, result
+
+
+class BinaryCache(DiskCache):
+    """
+    :class:`DiskCache` storing one binary record file per candidate.
+
+    Reads fall back to legacy JSONL files written by the default backend, so an
+    existing cache directory can be switched to ``cache_backend="binary"``
+    without losing results.
+    """
+
+    def __init__(self, cache_dir: str, **options: Any) -> None:
+        super().__init__(cache_dir, **options)
+        # Binary files whose framing was checked (and torn tails cut) this session
+        self._verified: set[Path] = set()
+
+    def _binary_path(self, cand_hash: str) -> Path:
+        return self.cache_dir / cand_hash[:2] / f"{cand_hash}.bin"
+
+    def _read_binary(self, path: Path) -> dict[str, EvalResult]:
+        records: dict[str, EvalResult] = {}
+        data = memoryview(path.read_bytes())
+        offset = 0
+        while offset < len(data):
+            if offset + _LENGTH.size > len(data):
+                break
+            (length,) = _LENGTH.unpack_from(data, offset)
+            end = offset + _LENGTH.size + length
+            if end > len(data):
+                break
+            try:
+                example_id, result = decode_record(data[offset + _LENGTH.size : end])
+            except (ValueError, struct.error) as exc:
+                logging.warning("Skipping unreadable cache record in %s: %s", path, exc)
+            else:
+                records[example_id] = result
+            offset = end
+        if offset < len(data):
+            # Torn write from a crash; drop the partial record so later appends stay aligned
+            logging.warning("Truncating partial cache record in %s at offset %d", path, offset)
+            with path.open("r+b") as fixer:
+                fixer.truncate(offset)
+        self._verified.add(path)
+        return records
+
+    # DiskCache storage hooks
+
+    def _has_stored(self, cand_hash: str) -> bool:
+        return self._binary_path(cand_hash).exists() or self._record_path(cand_hash).exists()
+
+    def _load_stored(self, cand_hash: str) -> dict[str, EvalResult]:
+        records = super()._load_stored(cand_hash)  # Legacy JSONL, if any
+        path = self._binary_path(cand_hash)
+        if path.exists():
+            records.update(self._read_binary(path))
+        return records
+
+    def _append_stored(self, cand_hash: str, records: list[dict[str, object]]) -> None:
+        path = self._binary_path(cand_hash)
+        if path not in self._verified and path.exists():
+            # Appending after a torn record would misalign every later record
+            self._read_binary(path)
+        self._verified.add(path)
+        payload = b"".join(encode_record(record) for record in records)
+        max_attempts = 3
+        for attempt in range(max_attempts):
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with path.open("ab") as handle:
+                    handle.write(payload)
+                return
+            except OSError:
+                if attempt < max_attempts - 1:
+                    import time
+
+                    time.sleep(0.1 * (2**attempt))
+                else:
+                    raise
+
+    @staticmethod
+    def _approx_result_bytes(result: EvalResult) -> int:
+        if isinstance(result, _LazyEvalResult) and not result.traces_decoded:
+            return result.undecoded_bytes()
+        return DiskCache._approx_result_bytes(result)
+
+    def _install(self, cand_hash: str, records: dict[str, EvalResult]) -> None:
+        for example_id, result in records.items():
+            if isinstance(result, _LazyEvalResult) and not result.traces_decoded:
+                result._on_decode = partial(self._note_decoded, cand_hash, example_id)
+        super()._install(cand_hash, records)
+
+    def _note_decoded(self, cand_hash: str, example_id: str, result: EvalResult, undecoded: int) -> None:
+        """Charge the memory budget for traces a caller just decoded."""
+        records = self._record_cache.get(cand_hash)
+        if records is None or records.get(example_id) is not result:
+            return  # Evicted or replaced since loading; its bytes are no longer counted
+        delta = DiskCache._approx_result_bytes(result) - undecoded
+        self._record_bytes[cand_hash] = self._record_bytes.get(cand_hash, 0) + delta
+        self._resident_bytes += delta
+        # The budget itself is enforced on the next insert, not from inside a property read
+
+    def clear(self) -> None:
+        """Remove all cached records."""
+        self._verified.clear()
+        super().clear()
+
+    def migrate(self) -> int:
+        """Convert every legacy JSONL file under ``cache_dir`` to binary records.
+
+        Returns the number of candidate files migrated. Safe to re-run; records
+        already present in binary form take precedence over the JSONL copy.
+        """
+        migrated = 0
+        for legacy in sorted(self.cache_dir.glob("*/*.jsonl")):
+            cand_hash = legacy.stem
+            records = super()._load_stored(cand_hash)
+            binary = self._binary_path(cand_hash)
+            existing = self._read_binary(binary) if binary.exists() else {}
+            rows = [
+                self._record_from_result(example_id, result)
+                for example_id, result in records.items()
+                if example_id not in existing
+            ]
+            if rows:
+                self._append_stored(cand_hash, rows)
+            legacy.unlink()
+            self._record_cache.pop(cand_hash, None)
+            self._record_bytes.pop(cand_hash, None)
+            self._loaded.discard(cand_hash)
+            migrated += 1
+        self._resident_bytes = sum(self._record_bytes.values())
+        return migrated
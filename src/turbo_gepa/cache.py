@@ -2,8 +2,9 @@
 Content-addressed cache utilities.
 
 The cache stores:
-1. Evaluation results keyed by candidate hash and example ID
-2. Orchestrator state for resumable optimization (archive, queue, round number)
+1. Evaluation results keyed by evaluation identity (see ``evaluation_key``) and example ID
+2. Orchestrator state for resumable optimization (archive, queue, round number),
+   as a snapshot plus an append-only journal of per-window changes
 
 This enables cross-island reuse and automatic resume after cancellation.
 """
@@ -14,8 +15,11 @@ import asyncio
 import json
 import logging
 import os
-from collections import defaultdict
+import uuid
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, Iterable
 
 from .interfaces import Candidate, EvalResult
 
@@ -25,24 +29,456 @@ def candidate_key(candidate: Candidate) -> str:
     return candidate.fingerprint
 
 
+def evaluation_key(candidate: Candidate) -> str:
+    """Compute the cache key for per-example results.
+
+    Only prompt text, temperature, and reasoning effort participate, so metadata
+    rewrites during promotion do not invalidate previously scored examples.
+    """
+    return candidate.eval_key
+
+
+def cache_namespace(*parts: object) -> str:
+    """Derive a cache namespace from whatever determines a score besides the prompt.
+
+    Adapters pass the task model configuration and a scoring-function version so
+    that runs with a different model, decoding defaults or metric never read each
+    other's records from a shared cache directory.
+    """
+    import xxhash
+
+    payload = json.dumps(parts, default=repr, sort_keys=True)
+    return xxhash.xxh3_64_hexdigest(payload.encode("utf-8"))
+
+
+# Version of the orchestrator checkpoint written by ``DiskCache.save_state``.
+# Version 1 (implicit) stored candidates only; version 2 adds a full
+# ``checkpoint`` payload (scheduler, sampler, archive and orchestrator state);
+# version 3 keys large collections by id so the journal can diff them.
+CHECKPOINT_VERSION = 3
+
+
+def serialize_candidate(candidate: Candidate) -> dict:
+    """Convert a Candidate to a JSON-serializable dict."""
+    return {"text": candidate.text, "meta": dict(candidate.meta)}
+
+
+def deserialize_candidate(data: dict) -> Candidate:
+    """Reconstruct a Candidate from :func:`serialize_candidate` output."""
+    return Candidate(text=data["text"], meta=data.get("meta", {}))
+
+
+def serialize_result(result: EvalResult) -> dict:
+    """Convert an EvalResult to a JSON-serializable dict."""
+    return {
+        "objectives": dict(result.objectives),
+        "traces": list(result.traces or []),
+        "n_examples": result.n_examples,
+        "shard_fraction": result.shard_fraction,
+        "example_ids": list(result.example_ids) if result.example_ids is not None else None,
+    }
+
+
+def deserialize_result(data: dict) -> EvalResult:
+    """Reconstruct an EvalResult from :func:`serialize_result` output."""
+    return EvalResult(
+        objectives=dict(data["objectives"]),
+        traces=list(data.get("traces", [])),
+        n_examples=data.get("n_examples", 0),
+        shard_fraction=data.get("shard_fraction"),
+        example_ids=data.get("example_ids"),
+    )
+
+
+class SerializationMemo:
+    """
+    Reuse the serialized form of objects that were not replaced since the last checkpoint.
+
+    Keyed by a caller-chosen id and valid while the same object (by identity)
+    sits under that id, so it only suits objects that are replaced rather than
+    mutated, such as candidates, evaluation results and archive entries.
+    Unchanged entries keep returning the same dict, which lets the checkpoint
+    journal skip them without comparing their contents.
+    """
+
+    def __init__(self, serialize: Callable[[Any], Any]) -> None:
+        self._serialize = serialize
+        self._memo: dict[str, tuple[Any, Any]] = {}
+        self._seen: set[str] = set()
+
+    def __call__(self, key: str, obj: Any) -> Any:
+        self._seen.add(key)
+        hit = self._memo.get(key)
+        if hit is not None and hit[0] is obj:
+            return hit[1]
+        value = self._serialize(obj)
+        self._memo[key] = (obj, value)
+        return value
+
+    def prune(self) -> None:
+        """Forget ids not requested since the previous prune (call once per snapshot)."""
+        if len(self._seen) < len(self._memo):
+            self._memo = {key: hit for key, hit in self._memo.items() if key in self._seen}
+        self._seen = set()
+
+
+class _Snapshot(dict):
+    """Checkpoint section that knows which keys may differ from the snapshot it was copied from."""
+
+    __slots__ = ("base", "touched")
+
+
+class _DirtyTracking:
+    """
+    Mixin for containers whose checkpoint section is rebuilt only for changed keys.
+
+    Mutations record the key; :meth:`touch` records one whose value was
+    changed in place. A snapshot copies the previous one and re-serializes
+    just those keys, and :func:`_diff_state` compares only them.
+    """
+
+    __slots__ = ()
+
+    def touch(self, key: Any) -> None:
+        """Mark ``key`` changed (re-inserted, so marks keep the order of the latest changes)."""
+        self._dirty.pop(key, None)
+        self._dirty[key] = None
+
+    def _snapshot(self, value_of: Callable[[Any], Any], keys: Callable[[], Iterable[Any]], nested: bool) -> dict[Any, Any]:
+        last = self._last
+        if last is not None and not self._dirty:
+            return last
+        snap = _Snapshot() if last is None else _Snapshot(last)
+        touched = snap.touched = set()
+        snap.base = last
+        groups: set[Any] = set()
+        for key in keys() if last is None else self._dirty:
+            value = value_of(key)
+            if nested:
+                # ``(outer, inner)`` keys become ``{outer: {str(inner): value}}``; only touched groups are copied
+                outer, inner = key
+                if outer not in groups:
+                    groups.add(outer)
+                    snap[outer] = dict(snap.get(outer, {}))
+                if value is _MISSING:
+                    snap[outer].pop(str(inner), None)
+                else:
+                    snap[outer][str(inner)] = value
+                touched.add(outer)
+                continue
+            snap.pop(key, None)
+            if value is not _MISSING:
+                snap[key] = value
+            touched.add(key)
+        for outer in groups:
+            if not snap[outer]:
+                del snap[outer]
+        self._dirty = {}
+        self._last = snap
+        return snap
+
+
+class TrackedDict(_DirtyTracking, dict):
+    """
+    dict that rebuilds its checkpoint section incrementally (see :meth:`snapshot`).
+
+    With ``default_factory`` it fills missing keys like ``defaultdict``. Values
+    edited in place (a set or deque under a key) must be reported with
+    :meth:`touch`.
+    """
+
+    __slots__ = ("_dirty", "_last", "default_factory")
+
+    def __init__(self, *args: Any, default_factory: Callable[[], Any] | None = None, **kwargs: Any) -> None:
+        dict.__init__(self, *args, **kwargs)
+        self.default_factory = default_factory
+        self._dirty: dict[Any, None] = {}
+        self._last: dict[Any, Any] | None = None
+
+    def __missing__(self, key: Any) -> Any:
+        if self.default_factory is None:
+            raise KeyError(key)
+        value = self[key] = self.default_factory()
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        dict.__setitem__(self, key, value)
+        self.touch(key)
+
+    def __delitem__(self, key: Any) -> None:
+        dict.__delitem__(self, key)
+        self.touch(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            self.touch(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> tuple[Any, Any]:
+        key, value = dict.popitem(self)
+        self.touch(key)
+        return key, value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        for key in self:
+            self.touch(key)
+        dict.clear(self)
+
+    def snapshot(self, serialize: Callable[[Any], Any] | None = None, *, nested: bool = False) -> dict[Any, Any]:
+        """
+        JSON-ready ``{key: serialize(value)}``, re-serializing only keys changed since the last call.
+
+        Returns the previous snapshot object when nothing changed. Snapshots
+        are never edited once returned, so the checkpoint journal may keep
+        them. ``nested`` turns ``(outer, inner)`` keys into nested dicts.
+        """
+
+        def value_of(key: Any) -> Any:
+            value = dict.get(self, key, _MISSING)
+            return value if value is _MISSING or serialize is None else serialize(value)
+
+        return self._snapshot(value_of, lambda: list(self), nested)
+
+
+class TrackedSet(_DirtyTracking, set):
+    """set whose checkpoint section ``{item: True}`` is rebuilt incrementally (see :meth:`TrackedDict.snapshot`)."""
+
+    __slots__ = ("_dirty", "_last")
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        set.__init__(self, items)
+        self._dirty: dict[Any, None] = {}
+        self._last: dict[Any, Any] | None = None
+
+    def add(self, item: Any) -> None:
+        if item not in self:
+            set.add(self, item)
+            self.touch(item)
+
+    def discard(self, item: Any) -> None:
+        if item in self:
+            set.discard(self, item)
+            self.touch(item)
+
+    def remove(self, item: Any) -> None:
+        set.remove(self, item)
+        self.touch(item)
+
+    def pop(self) -> Any:
+        item = set.pop(self)
+        self.touch(item)
+        return item
+
+    def update(self, *iterables: Iterable[Any]) -> None:
+        for items in iterables:
+            for item in items:
+                self.add(item)
+
+    def difference_update(self, *iterables: Iterable[Any]) -> None:
+        for items in iterables:
+            for item in items:
+                self.discard(item)
+
+    def clear(self) -> None:
+        for item in self:
+            self.touch(item)
+        set.clear(self)
+
+    def snapshot(self, *, nested: bool = False) -> dict[Any, Any]:
+        """Membership as ``{item: True}`` (nested for ``(outer, inner)`` items), rebuilt only for changed items."""
+        return self._snapshot(lambda item: True if item in self else _MISSING, lambda: sorted(self), nested)
+
+
+def _flatten_state(state: dict[str, Any], prefix: tuple[str, ...] = ()) -> dict[tuple[str, ...], Any]:
+    """Split nested dicts into ``{path: leaf}`` entries; lists, scalars and empty dicts are leaves."""
+    entries: dict[tuple[str, ...], Any] = {}
+    for key, value in state.items():
+        path = prefix + (str(key),)
+        if isinstance(value, dict) and value:
+            entries.update(_flatten_state(value, path))
+        else:
+            entries[path] = value
+    return entries
+
+
+def _diff_state(
+    old: dict[str, Any],
+    new: dict[str, Any],
+    changed: list[tuple[tuple[str, ...], Any]],
+    removed: list[tuple[str, ...]],
+    prefix: tuple[str, ...] = (),
+) -> None:
+    """Collect the leaves of ``new`` that differ from ``old`` (see :func:`_flatten_state`).
+
+    Subtrees and leaves that are the same object in both states are skipped
+    without being walked, and a section snapshot copied from ``old`` (see
+    :class:`TrackedDict`) is compared only on the keys it touched, so the cost
+    follows the part of the state that was rebuilt rather than its total size.
+    """
+    if isinstance(new, _Snapshot) and new.base is old:
+        for key in new.touched:
+            if key not in new and key in old:
+                _diff_state({key: old[key]}, {}, changed, removed, prefix)
+        new = {key: new[key] for key in new.touched if key in new}
+        old = {key: old[key] for key in new if key in old}
+    for key, value in new.items():
+        path = prefix + (str(key),)
+        before = old.get(key, _MISSING)
+        if before is value:
+            continue
+        new_tree = isinstance(value, dict) and bool(value)
+        old_tree = isinstance(before, dict) and bool(before)
+        if new_tree and old_tree:
+            _diff_state(before, value, changed, removed, path)
+            continue
+        if old_tree:
+            removed.extend(_flatten_state(before, path))
+        elif new_tree and before is not _MISSING:
+            removed.append(path)
+        if new_tree:
+            changed.extend(_flatten_state(value, path).items())
+        elif before is _MISSING or old_tree or before != value:
+            changed.append((path, value))
+    for key, before in old.items():
+        if key not in new:
+            path = prefix + (str(key),)
+            if isinstance(before, dict) and before:
+                removed.extend(_flatten_state(before, path))
+            else:
+                removed.append(path)
+
+
+_MISSING = object()
+
+
+def _unflatten_state(entries: dict[tuple[str, ...], Any]) -> dict[str, Any]:
+    """Inverse of :func:`_flatten_state`."""
+    state: dict[str, Any] = {}
+    for path, value in entries.items():
+        node = state
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+    return state
+
+
+def create_cache(
+    cache_dir: str,
+    backend: str = "jsonl",
+    *,
+    memory_budget_bytes: int | None = None,
+    evict_traces_only: bool = False,
+    namespace: str | None = None,
+    state_dir: str | None = None,
+) -> DiskCache:
+    """
+    Build the evaluation cache selected by ``Config.cache_backend``.
+
+    Backends:
+        - "jsonl": one append-only JSONL file per candidate (default)
+        - "segment": a few large append-only segment files plus an in-memory offset index
+        - "sqlite": a WAL-mode SQLite database safe to share between processes
+        - "binary": one compact binary record file per candidate, traces decoded lazily
+
+    ``memory_budget_bytes`` and ``evict_traces_only`` bound the in-memory record
+    index of every backend; ``namespace`` and ``state_dir`` let several runs share
+    one record store (see :class:`DiskCache`).
+    """
+    options = {
+        "memory_budget_bytes": memory_budget_bytes,
+        "evict_traces_only": evict_traces_only,
+        "namespace": namespace,
+        "state_dir": state_dir,
+    }
+    if backend == "jsonl":
+        return DiskCache(cache_dir, **options)
+    if backend == "segment":
+        from .segment_cache import SegmentCache
+
+        return SegmentCache(cache_dir, **options)
+    if backend == "sqlite":
+        from .sqlite_cache import SqliteCache
+
+        return SqliteCache(cache_dir, **options)
+    if backend == "binary":
+        from .binary_cache import BinaryCache
+
+        return BinaryCache(cache_dir, **options)
+    raise ValueError(f"Unknown cache backend: '{backend}'. Choose from: jsonl, segment, sqlite, binary")
+
+
 class DiskCache:
     """
     JSONL-backed cache for evaluation results.
 
     Files are partitioned by candidate hash to minimize contention; writes are
     serialized with an asyncio lock so async evaluators can share the cache.
+
+    Records read or written are also kept in an in-memory index. With
+    ``memory_budget_bytes`` set, the index is bounded: whole candidates are
+    evicted in least-recently-used order once their approximate size exceeds
+    the budget, and reloaded from disk on the next miss. With
+    ``evict_traces_only`` the index instead drops the bulky trace fields
+    (inputs, outputs, feedback text) of the least-recently-used candidates and
+    keeps objectives and numeric trace fields resident, so the scheduler never
+    pays a disk read for a score it has already seen. Slimmed entries are only
+    served to ``get(..., objectives_only=True)``; any other lookup reloads the
+    full records from storage.
+
+    A ``namespace`` (see :func:`cache_namespace`) is mixed into every record key,
+    so one directory can hold results for many model/metric combinations
+    without them ever being confused. ``state_dir`` keeps the orchestrator's
+    resume state apart from the records when the record store is shared.
     """
 
-    def __init__(self, cache_dir: str) -> None:
+    def __init__(
+        self,
+        cache_dir: str,
+        *,
+        memory_budget_bytes: int | None = None,
+        evict_traces_only: bool = False,
+        namespace: str | None = None,
+        state_dir: str | None = None,
+    ) -> None:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.namespace = namespace
+        self.state_dir = Path(state_dir) if state_dir is not None else self.cache_dir
+        self.state_dir.mkdir(parents=True, exist_ok=True)
         # Use defaultdict to avoid race condition in lock creation
         self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         # Global semaphore to limit concurrent file operations (prevent "too many open files")
         # Dynamically determine safe limit based on system's file descriptor limit
         self._file_semaphore = asyncio.Semaphore(self._get_safe_file_limit())
-        # In-memory index to avoid repeated linear scans per candidate
-        self._record_cache: dict[str, dict[str, EvalResult]] = {}
+        # In-memory index to avoid repeated linear scans per candidate, in LRU order
+        self._record_cache: OrderedDict[str, dict[str, EvalResult]] = OrderedDict()
+        # Candidates whose persisted records have been merged into _record_cache
+        self._loaded: set[str] = set()
+        # Memory accounting for the bounded index
+        self.memory_budget_bytes = memory_budget_bytes
+        self.evict_traces_only = evict_traces_only
+        self._record_bytes: dict[str, int] = {}
+        self._resident_bytes = 0
+        self._slim: set[str] = set()  # Candidates whose resident traces were dropped (storage has them)
+        self.memory_hits = 0
+        self.memory_misses = 0
+        self.evictions = 0
+        self.trace_evictions = 0
+        # Checkpoint journal: the tracked state as of the last persisted save
+        self._journal_state: dict[str, Any] | None = None
+        self._journal_id: str | None = None
+        self._journal_records = 0
+        self._journal_bytes = 0
+        self._snapshot_bytes = 0
 
     def _get_safe_file_limit(self) -> int:
         """Determine a safe file descriptor limit for concurrent operations.
@@ -77,11 +513,17 @@ class DiskCache:
         # defaultdict ensures atomic lock creation per key
         return self._locks[key]
 
+    def _record_key(self, candidate: Candidate) -> str:
+        """Storage key for ``candidate``'s records: its evaluation key, namespaced if configured."""
+        key = evaluation_key(candidate)
+        if self.namespace is None:
+            return key
+        import xxhash
+
+        return xxhash.xxh3_64_hexdigest(f"{self.namespace}:{key}".encode())
+
     def _record_path(self, cand_hash: str) -> Path:
-        prefix = cand_hash[:2]
-        shard_dir = self.cache_dir / prefix
-        shard_dir.mkdir(parents=True, exist_ok=True)
-        return shard_dir / f"{cand_hash}.jsonl"
+        return self.cache_dir / cand_hash[:2] / f"{cand_hash}.jsonl"
 
     def _clone_result(self, result: EvalResult, example_id: str) -> EvalResult:
         example_ids = list(result.example_ids) if result.example_ids else [example_id]
@@ -99,99 +541,266 @@ class DiskCache:
             example_ids=example_ids,
         )
 
-    def _ensure_candidate_cache(self, cand_hash: str, path: Path) -> dict[str, EvalResult]:
-        cached = self._record_cache.get(cand_hash)
-        if cached is not None:
-            return cached
+    @staticmethod
+    def _record_from_result(example_id: str, result: EvalResult) -> dict[str, object]:
+        return {
+            "example_id": example_id,
+            "objectives": dict(result.objectives),
+            "traces": result.traces,
+            "n_examples": result.n_examples,
+            "shard_fraction": result.shard_fraction,
+        }
+
+    @staticmethod
+    def _result_from_record(record: dict) -> EvalResult:
+        return EvalResult(
+            objectives=dict(record["objectives"]),
+            traces=[dict(trace) if isinstance(trace, dict) else trace for trace in record.get("traces", [])],
+            n_examples=record.get("n_examples", 1),
+            shard_fraction=record.get("shard_fraction"),
+            example_ids=[record["example_id"]],
+        )
+
+    # Storage hooks: alternative backends override these three methods and
+    # inherit the locking and in-memory indexing below unchanged.
+
+    def _has_stored(self, cand_hash: str) -> bool:
+        """Return True if persistent storage may hold records for ``cand_hash``."""
+        return self._record_path(cand_hash).exists()
 
+    def _load_stored(self, cand_hash: str) -> dict[str, EvalResult]:
+        """Read every persisted record for ``cand_hash`` (runs in a worker thread)."""
         records: dict[str, EvalResult] = {}
+        path = self._record_path(cand_hash)
         if path.exists():
             with path.open("r", encoding="utf-8") as handle:
                 for line in handle:
                     record = json.loads(line)
-                    example_id = record["example_id"]
-                    result = EvalResult(
-                        objectives=dict(record["objectives"]),
-                        traces=[
-                            dict(trace) if isinstance(trace, dict) else trace
-                            for trace in record.get("traces", [])
-                        ],
-                        n_examples=record.get("n_examples", 1),
-                        shard_fraction=record.get("shard_fraction"),
-                        example_ids=[example_id],
-                    )
-                    records[example_id] = result
-        self._record_cache[cand_hash] = records
+                    records[record["example_id"]] = self._result_from_record(record)
         return records
 
-    async def get(self, candidate: Candidate, example_id: str) -> EvalResult | None:
-        """Fetch a cached result if present."""
-        cand_hash = candidate_key(candidate)
+    def _append_stored(self, cand_hash: str, records: list[dict[str, object]]) -> None:
+        """Persist ``records`` for ``cand_hash`` (runs in a worker thread)."""
         path = self._record_path(cand_hash)
+        if len(records) == 1:
+            self._append_record(path, records[0])
+        else:
+            self._append_records(path, records)
+
+    # Bounded in-memory index
+
+    @staticmethod
+    def _approx_result_bytes(result: EvalResult) -> int:
+        """Rough heap footprint of a cached result (strings dominate)."""
+        size = 240 + 96 * len(result.objectives)
+        for trace in result.traces or []:
+            if isinstance(trace, dict):
+                size += 240
+                for key, value in trace.items():
+                    size += 64 + len(key)
+                    if isinstance(value, (str, bytes)):
+                        size += len(value)
+                    elif isinstance(value, (list, dict)):
+                        size += len(str(value))
+            else:
+                size += 64 + len(str(trace))
+        return size
+
+    @staticmethod
+    def _slim_result(result: EvalResult) -> EvalResult:
+        """Copy of ``result`` whose traces keep only example IDs and numeric fields."""
+        traces = [
+            {
+                key: value
+                for key, value in trace.items()
+                if key == "example_id" or value is None or isinstance(value, (bool, int, float))
+            }
+            if isinstance(trace, dict)
+            else trace
+            for trace in (result.traces or [])
+        ]
+        return EvalResult(
+            objectives=result.objectives,
+            traces=traces,
+            n_examples=result.n_examples,
+            shard_fraction=result.shard_fraction,
+            example_ids=result.example_ids,
+        )
+
+    def _recount(self, cand_hash: str) -> None:
+        records = self._record_cache.get(cand_hash)
+        new_size = sum(self._approx_result_bytes(r) for r in records.values()) if records else 0
+        self._resident_bytes += new_size - self._record_bytes.pop(cand_hash, 0)
+        if records is not None:
+            self._record_bytes[cand_hash] = new_size
+
+    def _remember(self, cand_hash: str, example_id: str, result: EvalResult) -> None:
+        """Insert one result into the index and enforce the memory budget."""
+        records = self._record_cache.get(cand_hash)
+        if records is None:
+            records = self._record_cache[cand_hash] = {}
+        else:
+            self._record_cache.move_to_end(cand_hash)
+            previous = records.get(example_id)
+            if previous is not None:
+                self._resident_bytes -= self._approx_result_bytes(previous)
+                self._record_bytes[cand_hash] -= self._approx_result_bytes(previous)
+        if cand_hash in self._slim:
+            # Keep a slimmed candidate uniformly slim; storage holds the full record
+            result = self._slim_result(result)
+        records[example_id] = result
+        size = self._approx_result_bytes(result)
+        self._record_bytes[cand_hash] = self._record_bytes.get(cand_hash, 0) + size
+        self._resident_bytes += size
+        self._enforce_budget(keep=cand_hash)
+
+    def _install(self, cand_hash: str, records: dict[str, EvalResult]) -> None:
+        """Replace the index entry for ``cand_hash`` after a load from storage."""
+        self._record_cache[cand_hash] = records
+        self._record_cache.move_to_end(cand_hash)
+        self._slim.discard(cand_hash)
+        self._loaded.add(cand_hash)
+        self._recount(cand_hash)
+        self._enforce_budget(keep=cand_hash)
+
+    def _enforce_budget(self, keep: str | None = None) -> None:
+        """Evict least-recently-used candidates until the index fits the budget."""
+        budget = self.memory_budget_bytes
+        if budget is None or self._resident_bytes <= budget:
+            return
+        for cand_hash in list(self._record_cache):
+            if self._resident_bytes <= budget:
+                break
+            if cand_hash == keep:
+                continue
+            if self.evict_traces_only:
+                if cand_hash in self._slim:
+                    continue
+                records = self._record_cache[cand_hash]
+                self._record_cache[cand_hash] = {eid: self._slim_result(r) for eid, r in records.items()}
+                self._slim.add(cand_hash)
+                # Full lookups must go back to storage for the dropped trace fields
+                self._loaded.discard(cand_hash)
+                self._recount(cand_hash)
+                self.trace_evictions += 1
+            else:
+                del self._record_cache[cand_hash]
+                self._resident_bytes -= self._record_bytes.pop(cand_hash, 0)
+                self._loaded.discard(cand_hash)
+                self.evictions += 1
+
+    def memory_stats(self) -> dict[str, int]:
+        """Snapshot of in-memory index counters (consumed by ``Metrics.record_cache_memory``)."""
+        return {
+            "hits": self.memory_hits,
+            "misses": self.memory_misses,
+            "evictions": self.evictions,
+            "trace_evictions": self.trace_evictions,
+            "resident_bytes": self._resident_bytes,
+            "resident_candidates": len(self._record_cache),
+        }
+
+    def _lookup_memory(self, cand_hash: str, example_id: str, objectives_only: bool = False) -> EvalResult | None:
         in_memory = self._record_cache.get(cand_hash)
-        if in_memory is not None and example_id in in_memory:
+        if in_memory is not None and example_id in in_memory and (objectives_only or cand_hash not in self._slim):
+            self._record_cache.move_to_end(cand_hash)
+            self.memory_hits += 1
             return in_memory[example_id]
-        if not path.exists():
+        self.memory_misses += 1
+        return None
+
+    def _merge_resident(self, cand_hash: str, records: dict[str, EvalResult]) -> dict[str, EvalResult]:
+        """Overlay this session's resident records on ``records`` freshly read from storage."""
+        # Records written during this session are newer than anything on disk,
+        # unless their traces were dropped: storage then has the same record in full
+        if cand_hash not in self._slim:
+            records.update(self._record_cache.get(cand_hash) or {})
+        return records
+
+    async def get(self, candidate: Candidate, example_id: str, *, objectives_only: bool = False) -> EvalResult | None:
+        """Fetch a cached result if present.
+
+        With ``objectives_only`` the caller promises to read only ``objectives``,
+        so a resident entry whose traces were evicted is good enough.
+        """
+        cand_hash = self._record_key(candidate)
+        result = self._lookup_memory(cand_hash, example_id, objectives_only)
+        if result is not None:
+            return result
+        if cand_hash in self._loaded or not self._has_stored(cand_hash):
             return None
         lock = self._lock_for(cand_hash)
         async with lock:
-            # Use semaphore to limit concurrent file operations
-            async with self._file_semaphore:
-                records = await asyncio.to_thread(self._ensure_candidate_cache, cand_hash, path)
+            if cand_hash not in self._loaded:
+                # Use semaphore to limit concurrent file operations
+                async with self._file_semaphore:
+                    records = await asyncio.to_thread(self._load_stored, cand_hash)
+                self._install(cand_hash, self._merge_resident(cand_hash, records))
+            records = self._record_cache.get(cand_hash) or {}
         return records.get(example_id)
 
+    async def preload(
+        self, candidates: Iterable[Candidate], max_workers: int = 8
+    ) -> dict[str, dict[str, EvalResult]]:
+        """
+        Bulk-load every stored record for ``candidates`` in one pass.
+
+        Candidates not yet in the in-memory index are read concurrently on a
+        thread pool. Returns ``{evaluation_key: {example_id: result}}`` for
+        every requested candidate (empty when nothing is cached).
+        """
+        # Storage key -> evaluation key the caller looks results up by
+        key_map = {self._record_key(candidate): evaluation_key(candidate) for candidate in candidates}
+        keys = list(key_map)
+        preloaded: dict[str, dict[str, EvalResult]] = {}
+        pending: list[str] = []
+        for key in keys:
+            if key in self._loaded:
+                preloaded[key_map[key]] = dict(self._record_cache.get(key) or {})
+            else:
+                pending.append(key)
+
+        def load_all() -> list[dict[str, EvalResult]]:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+                return list(pool.map(self._load_stored, pending))
+
+        if pending:
+            for key, records in zip(pending, await asyncio.to_thread(load_all), strict=True):
+                records = self._merge_resident(key, records)
+                preloaded[key_map[key]] = dict(records)
+                self._install(key, records)
+        return preloaded
+
     async def set(self, candidate: Candidate, example_id: str, result: EvalResult) -> None:
         """Persist a new evaluation record."""
-        cand_hash = candidate_key(candidate)
-        path = self._record_path(cand_hash)
-        record = {
-            "example_id": example_id,
-            "objectives": dict(result.objectives),
-            "traces": result.traces,
-            "n_examples": result.n_examples,
-            "shard_fraction": result.shard_fraction,
-        }
+        cand_hash = self._record_key(candidate)
+        record = self._record_from_result(example_id, result)
         lock = self._lock_for(cand_hash)
         async with lock:
             # Use semaphore to limit concurrent file operations
             async with self._file_semaphore:
-                await asyncio.to_thread(self._append_record, path, record)
-            cache = self._record_cache.setdefault(cand_hash, {})
-            cache[example_id] = self._clone_result(result, example_id)
+                await asyncio.to_thread(self._append_stored, cand_hash, [record])
+            self._remember(cand_hash, example_id, self._clone_result(result, example_id))
 
     async def batch_set(self, writes: list[tuple[Candidate, str, EvalResult]]) -> None:
         """Batch write multiple results, grouping by candidate for efficiency."""
-        from collections import defaultdict
-
         # Group writes by candidate hash to minimize lock contention
-        by_candidate: defaultdict[str, list[tuple[Path, dict[str, object]]]] = defaultdict(list)
+        by_candidate: defaultdict[str, list[dict[str, object]]] = defaultdict(list)
         updates: defaultdict[str, list[tuple[str, EvalResult]]] = defaultdict(list)
 
         for candidate, example_id, result in writes:
-            cand_hash = candidate_key(candidate)
-            path = self._record_path(cand_hash)
-            record = {
-                "example_id": example_id,
-                "objectives": dict(result.objectives),
-                "traces": result.traces,
-                "n_examples": result.n_examples,
-                "shard_fraction": result.shard_fraction,
-            }
-            by_candidate[cand_hash].append((path, record))
+            cand_hash = self._record_key(candidate)
+            by_candidate[cand_hash].append(self._record_from_result(example_id, result))
             updates[cand_hash].append((example_id, result))
 
-        async def write_batch(cand_hash: str, records: list[tuple[Path, dict]]) -> None:
-            # All records for same candidate go to same file
-            path = records[0][0]
-            record_objs = [r[1] for r in records]
+        async def write_batch(cand_hash: str, records: list[dict[str, object]]) -> None:
             lock = self._lock_for(cand_hash)
             async with lock:
                 # Use semaphore to limit concurrent file operations
                 async with self._file_semaphore:
-                    await asyncio.to_thread(self._append_records, path, record_objs)
-            cache = self._record_cache.setdefault(cand_hash, {})
+                    await asyncio.to_thread(self._append_stored, cand_hash, records)
             for example_id, res in updates.get(cand_hash, []):
-                cache[example_id] = self._clone_result(res, example_id)
+                self._remember(cand_hash, example_id, self._clone_result(res, example_id))
 
         # Write all candidate batches in parallel
         await asyncio.gather(*(write_batch(k, v) for k, v in by_candidate.items()))
@@ -199,6 +808,10 @@ class DiskCache:
     def clear(self) -> None:
         """Remove all cached records (useful for tests)."""
         self._record_cache.clear()
+        self._loaded.clear()
+        self._record_bytes.clear()
+        self._slim.clear()
+        self._resident_bytes = 0
         if not self.cache_dir.exists():
             return
         for root, _dirs, files in os.walk(self.cache_dir, topdown=False):
@@ -228,6 +841,7 @@ class DiskCache:
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
+                path.parent.mkdir(parents=True, exist_ok=True)
                 with path.open("a", encoding="utf-8", buffering=1) as handle:
                     handle.write(json.dumps(record) + "\n")
                 return
@@ -244,6 +858,7 @@ class DiskCache:
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
+                path.parent.mkdir(parents=True, exist_ok=True)
                 with path.open("a", encoding="utf-8", buffering=1) as handle:
                     for record in records:
                         handle.write(json.dumps(record) + "\n")
@@ -260,7 +875,7 @@ class DiskCache:
 
     def _state_path(self) -> Path:
         """Path to orchestrator state file."""
-        return self.cache_dir / "orchestrator_state.json"
+        return self.state_dir / "orchestrator_state.json"
 
     def save_state(
         self,
@@ -269,20 +884,31 @@ class DiskCache:
         pareto_candidates: list[Candidate],
         qd_candidates: list[Candidate],
         queue: list[Candidate],
+        checkpoint: dict | None = None,
+        *,
+        journal_id: str | None = None,
     ) -> None:
         """
         Save orchestrator state for resumable optimization.
 
         Atomically writes state to disk so it's safe to interrupt anytime.
-        Uses retry logic to handle temporary file system issues.
+        Uses retry logic to handle temporary file system issues. ``checkpoint``
+        is an already JSON-serializable snapshot (see ``Orchestrator``) that
+        allows resuming without re-evaluating anything. ``journal_id`` ties the
+        snapshot to the checkpoint journal appended after it.
         """
         state = {
+            "version": CHECKPOINT_VERSION,
             "round": round_num,
             "evaluations": evaluations,
             "pareto": [self._serialize_candidate(c) for c in pareto_candidates],
             "qd": [self._serialize_candidate(c) for c in qd_candidates],
             "queue": [self._serialize_candidate(c) for c in queue],
         }
+        if checkpoint is not None:
+            state["checkpoint"] = checkpoint
+        if journal_id is not None:
+            state["journal"] = journal_id
 
         # Atomic write with retry: write to temp file, then rename
         state_path = self._state_path()
@@ -294,6 +920,7 @@ class DiskCache:
                 with temp_path.open("w", encoding="utf-8") as f:
                     json.dump(state, f, indent=2)
                 temp_path.replace(state_path)
+                self._snapshot_bytes = state_path.stat().st_size
                 return
             except OSError as e:
                 if attempt < max_attempts - 1:
@@ -304,12 +931,122 @@ class DiskCache:
                     # On final failure, log warning but don't crash optimization
                     logging.warning("Failed to save state after %d attempts: %s", max_attempts, e)
 
+    def _journal_path(self) -> Path:
+        """Path to the append-only journal of changes since the last state snapshot."""
+        return self.state_dir / "orchestrator_state.journal"
+
+    def save_checkpoint(
+        self,
+        round_num: int,
+        evaluations: int,
+        pareto_candidates: list[Candidate],
+        qd_candidates: list[Candidate],
+        queue: list[Candidate],
+        checkpoint: dict,
+        *,
+        compact_every: int = 50,
+    ) -> bool:
+        """
+        Persist ``checkpoint``, appending only what changed since the last save.
+
+        Nested dicts are tracked leaf by leaf; each call appends one journal line
+        holding the changed and removed leaves, so serialization and write cost
+        follow the size of the change rather than of the archive. Subtrees that
+        are the same object as in the previous save are skipped outright (see
+        :class:`SerializationMemo`), sections built by :class:`TrackedDict` or
+        :class:`TrackedSet` are compared only on the keys they touched, and the
+        rest are compared by value. Callers must
+        therefore never mutate a snapshot they passed earlier. The journal is compacted
+        into a full :meth:`save_state` snapshot on the first save of a process,
+        every ``compact_every`` appends, and whenever it outgrows the snapshot.
+
+        Returns True when a full snapshot was written.
+        """
+        tracked = {"round": round_num, "evaluations": evaluations, "checkpoint": checkpoint}
+        previous = self._journal_state
+        if (
+            previous is None
+            or self._journal_records >= compact_every
+            or self._journal_bytes > self._snapshot_bytes
+        ):
+            journal_id = uuid.uuid4().hex
+            self._journal_state = None
+            self.save_state(
+                round_num, evaluations, pareto_candidates, qd_candidates, queue, checkpoint, journal_id=journal_id
+            )
+            journal_path = self._journal_path()
+            if journal_path.exists():
+                journal_path.unlink()
+            self._journal_state = tracked
+            self._journal_id = journal_id
+            self._journal_records = 0
+            self._journal_bytes = 0
+            return True
+
+        changed: list[tuple[tuple[str, ...], Any]] = []
+        removed: list[tuple[str, ...]] = []
+        _diff_state(previous, tracked, changed, removed)
+        if not changed and not removed:
+            self._journal_state = tracked
+            return False
+        line = (
+            json.dumps(
+                {"del": [list(path) for path in removed], "set": [[list(path), value] for path, value in changed]},
+                separators=(",", ":"),
+            )
+            + "\n"
+        )
+        journal_path = self._journal_path()
+        try:
+            with journal_path.open("a", encoding="utf-8") as f:
+                if self._journal_records == 0:
+                    f.write(json.dumps({"journal": self._journal_id}) + "\n")
+                f.write(line)
+        except OSError as e:
+            # Force a full snapshot next time rather than leave a gap in the journal
+            logging.warning("Failed to append checkpoint journal: %s", e)
+            self._journal_state = None
+            return False
+        self._journal_state = tracked
+        self._journal_records += 1
+        self._journal_bytes += len(line)
+        return False
+
+    def _replay_journal(self, state: dict) -> None:
+        """Apply journal lines written after ``state``'s snapshot, in order."""
+        journal_path = self._journal_path()
+        if not journal_path.exists() or "journal" not in state:
+            return
+        with journal_path.open("r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except json.JSONDecodeError:
+            header = {}
+        if header.get("journal") != state["journal"]:
+            return  # Left over from an older snapshot
+        tracked = {key: state[key] for key in ("round", "evaluations", "checkpoint") if key in state}
+        entries = _flatten_state(tracked)
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logging.warning("Ignoring torn checkpoint journal line")
+                break
+            for path in record.get("del", []):
+                entries.pop(tuple(path), None)
+            for path, value in record.get("set", []):
+                entries[tuple(path)] = value
+        state.update(_unflatten_state(entries))
+
     def load_state(self) -> dict | None:
         """
         Load saved orchestrator state, or None if no state exists.
 
-        Returns dict with keys: round, evaluations, pareto, qd, queue
-        Uses retry logic to handle temporary file system issues.
+        Returns dict with keys: version, round, evaluations, pareto, qd, queue and,
+        for version 2+ checkpoints, the raw ``checkpoint`` payload with the
+        checkpoint journal applied. ``pareto``/``qd``/``queue`` reflect the last
+        full snapshot. Uses retry logic to handle temporary file system issues.
         """
         state_path = self._state_path()
         if not state_path.exists():
@@ -320,11 +1057,13 @@ class DiskCache:
             try:
                 with state_path.open("r", encoding="utf-8") as f:
                     state = json.load(f)
+                self._replay_journal(state)
 
                 # Deserialize candidates
                 state["pareto"] = [self._deserialize_candidate(c) for c in state["pareto"]]
                 state["qd"] = [self._deserialize_candidate(c) for c in state["qd"]]
                 state["queue"] = [self._deserialize_candidate(c) for c in state["queue"]]
+                state.setdefault("version", 1)
 
                 return state
             except OSError as e:
@@ -346,21 +1085,16 @@ class DiskCache:
         return self._state_path().exists()
 
     def clear_state(self) -> None:
-        """Delete saved state file."""
-        state_path = self._state_path()
-        if state_path.exists():
-            state_path.unlink()
+        """Delete saved state file and checkpoint journal."""
+        for path in (self._state_path(), self._journal_path()):
+            if path.exists():
+                path.unlink()
+        self._journal_state = None
 
     def _serialize_candidate(self, candidate: Candidate) -> dict:
         """Convert Candidate to JSON-serializable dict."""
-        return {
-            "text": candidate.text,
-            "meta": dict(candidate.meta),
-        }
+        return serialize_candidate(candidate)
 
     def _deserialize_candidate(self, data: dict) -> Candidate:
         """Reconstruct Candidate from dict."""
-        return Candidate(
-            text=data["text"],
-            meta=data.get("meta", {}),
-        )
+        return deserialize_candidate(data)
@@ -0,0 +1,146 @@
+"""
+Adaptive example-level concurrency.
+
+``eval_concurrency`` is a guess made before the run sees the provider. The
+:class:`AIMDController` turns it into a feedback loop in the style of TCP
+congestion control: every finished LLM call reports its latency and outcome,
+and the controller
+
+* raises the limit additively (``+increase``) after each window of calls in
+  which the limit was actually in use, the p95 latency stayed within
+  ``latency_tolerance`` of the best recent p95 and errors stayed under
+  ``error_threshold``;
+* cuts it multiplicatively (``x decrease``) as soon as a call is rate limited
+  (HTTP 429) or times out, then ignores further congestion signals until the
+  calls launched under the old limit have drained.
+
+The orchestrator applies the limit to the shared example queue (or the
+per-candidate budget) live.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import deque
+
+CALL_OUTCOMES = ("ok", "error", "timeout", "rate_limit")
+_RATE_LIMIT_MARKERS = ("ratelimit", "rate limit exceeded", "rate_limit_exceeded", "429", "too many requests")
+
+
+def classify_call_error(error: BaseException) -> str:
+    """Map a task-call exception to ``"rate_limit"`` (429 / quota errors), ``"timeout"`` or ``"error"``."""
+    chain: list[BaseException] = []
+    current: BaseException | None = error
+    while current is not None and len(chain) < 5:  # Adapters wrap provider errors (``raise ... from e``)
+        chain.append(current)
+        current = current.__cause__ or current.__context__
+    for exc in chain:
+        status = getattr(exc, "status_code", None) or getattr(exc, "status", None)
+        if status == 429 or "ratelimit" in type(exc).__name__.lower():
+            return "rate_limit"
+        if isinstance(exc, (asyncio.TimeoutError, TimeoutError)):
+            return "timeout"
+    text = " ".join(str(exc) for exc in chain).lower()
+    if any(marker in text for marker in _RATE_LIMIT_MARKERS):
+        return "rate_limit"
+    return "error"
+
+
+class AIMDController:
+    """Additive-increase / multiplicative-decrease limit on concurrent LLM calls."""
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        minimum: int = 1,
+        maximum: int | None = None,
+        increase: int = 1,
+        decrease: float = 0.5,
+        window: int = 20,
+        latency_tolerance: float = 1.5,
+        error_threshold: float = 0.05,
+        baseline_windows: int = 5,
+    ) -> None:
+        if not 0.0 < decrease < 1.0:
+            raise ValueError(f"decrease must be in (0, 1), got {decrease}")
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum if maximum is not None else max(initial, 1) * 4))
+        self.limit = min(self.maximum, max(self.minimum, int(initial)))
+        self.increase = max(1, int(increase))
+        self.decrease = float(decrease)
+        self.window = max(1, int(window))
+        self.latency_tolerance = float(latency_tolerance)
+        self.error_threshold = float(error_threshold)
+        self._latencies: list[float] = []
+        self._errors = 0
+        self._peak_in_use: int | None = None  # None: callers do not report usage, treat as saturated
+        self._recent_p95: deque[float] = deque(maxlen=max(1, int(baseline_windows)))
+        self._hold = 0  # Observations to ignore congestion for after a cut
+        self.increases = 0
+        self.decreases = 0
+        self.observed: dict[str, int] = dict.fromkeys(CALL_OUTCOMES, 0)
+
+    @property
+    def baseline_p95(self) -> float | None:
+        """Best p95 latency over the recent windows, or None before the first full window."""
+        return min(self._recent_p95) if self._recent_p95 else None
+
+    def observe(self, latency: float, outcome: str = "ok", *, in_use: int | None = None) -> bool:
+        """
+        Record one finished call; returns True when the limit changed.
+
+        ``in_use`` is the number of calls running when this one finished, so the
+        limit only grows while the current one is actually reached.
+        """
+        if outcome not in self.observed:
+            raise ValueError(f"Unknown call outcome: '{outcome}'. Choose from: {', '.join(CALL_OUTCOMES)}")
+        self.observed[outcome] += 1
+        if in_use is not None:
+            self._peak_in_use = max(self._peak_in_use or 0, in_use)
+        if self._hold > 0:
+            self._hold -= 1
+            return False
+        if outcome in ("rate_limit", "timeout"):
+            return self._cut()
+        if outcome == "error":
+            self._errors += 1
+        else:
+            self._latencies.append(latency)
+        if len(self._latencies) + self._errors < self.window:
+            return False
+        return self._close_window()
+
+    def _close_window(self) -> bool:
+        latencies = sorted(self._latencies)
+        calls = len(latencies) + self._errors
+        error_rate = self._errors / calls
+        saturated = self._peak_in_use is None or self._peak_in_use >= self.limit - self.increase
+        self._latencies = []
+        self._errors = 0
+        self._peak_in_use = None
+        if not latencies:
+            return False
+        p95 = latencies[min(len(latencies) - 1, math.ceil(0.95 * len(latencies)) - 1)]
+        baseline = self.baseline_p95
+        self._recent_p95.append(p95)
+        steady = baseline is None or p95 <= baseline * self.latency_tolerance
+        if not (steady and saturated and error_rate <= self.error_threshold) or self.limit >= self.maximum:
+            return False
+        self.limit = min(self.maximum, self.limit + self.increase)
+        self.increases += 1
+        return True
+
+    def _cut(self) -> bool:
+        new_limit = max(self.minimum, int(self.limit * self.decrease))
+        # Calls already running were launched under the old limit; their failures are the same congestion event
+        self._hold = self.limit
+        self._latencies = []
+        self._errors = 0
+        self._peak_in_use = None
+        if new_limit == self.limit:
+            return False
+        self.limit = new_limit
+        self.decreases += 1
+        return True
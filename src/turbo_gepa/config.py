@@ -113,16 +113,28 @@ class Config:
     n_islands: int = 4
     shards: Sequence[float] = field(default_factory=lambda: (0.05, 0.2, 1.0))
     adaptive_shards_enabled: bool = True
+    nested_shards: bool = False  # Rung shards are prefixes of one per-window permutation, so promotions reuse results
     eps_improve: float = 0.0  # Children must match or beat parent score before quantile pruning
     cohort_quantile: float = 0.6
     qd_bins_length: int = 8
     qd_bins_bullets: int = 6
     qd_flags: Sequence[str] = field(default_factory=lambda: ("cot", "format", "fewshot"))
+    # Archive frontier: "aggregate" (Pareto over mean objectives) or "instance" (GEPA-style:
+    # keep every candidate that is best on some example of its full-dataset evaluation and not out-won by another)
+    pareto_mode: str = "aggregate"
     reflection_batch_size: int = 6
     max_tokens: int = 2048
     migration_period: int = 1  # Migrate every evaluation batch by default
     migration_k: int = 3
     cache_path: str = ".turbo_gepa/cache"
+    cache_backend: str = "jsonl"  # "jsonl" (file per candidate), "segment" (append-only log), or "sqlite" (WAL, multi-process), or "binary" (lazy traces)
+    cache_memory_budget_mb: float | None = None  # Bound on in-memory cached records (None = unbounded, LRU by candidate)
+    cache_evict_traces_only: bool = False  # Over budget, drop trace text but keep objectives resident
+    cache_write_behind_records: int = 0  # Buffer up to N results before a batched cache write (0 = write-through); max lost on crash
+    cache_write_behind_interval: float = 1.0  # Seconds between background flushes of buffered cache writes
+    shared_cache_dir: str | None = None  # Evaluation records shared across runs (keyed by task model + scoring version)
+    cache_scoring_version: str = "1"  # Bump when the scoring function changes so old records are not reused
+    checkpoint_compact_every: int = 50  # Checkpoint journal appends between full state snapshots
     log_path: str = ".turbo_gepa/logs"
     batch_size: int | None = None  # Auto-scaled to eval_concurrency if None
     queue_limit: int | None = None  # Auto-scaled to 2x eval_concurrency if None
@@ -133,11 +145,29 @@ class Config:
     reflection_lm_temperature: float | None = 1.0
     target_quality: float | None = None  # Stop when best quality reaches this threshold
     eval_timeout_seconds: float | None = 120.0  # Max time to wait for a single LLM evaluation
+    # Hedging: duplicate a task call still running past this percentile of recent call latencies (e.g. 0.95);
+    # the first reply wins. Replaces straggler cancellation. At most hedge_budget of all task calls are hedged.
+    hedge_percentile: float | None = None
+    hedge_budget: float = 0.05
+    # Process-wide LLM rate limits (requests / tokens per minute) shared by every island and mutator.
+    # Task and reflection (incl. spec induction) calls draw from separate budgets; None = unlimited.
+    task_rpm: float | None = None
+    task_tpm: float | None = None
+    reflection_rpm: float | None = None
+    reflection_tpm: float | None = None
 
     # Streaming mode config
     streaming_mode: bool = True  # Enable continuous launch/drain (no batch barriers)
     mutation_buffer_min: int = 4  # Minimum mutations to trigger generation
     max_total_inflight: int | None = None  # Override total concurrent evaluations (defaults to eval_concurrency)
+    # "global": every (candidate, example) call shares one prioritised pool of eval_concurrency slots;
+    # "per_candidate": each launch reserves an equal slice of eval_concurrency for its whole evaluation
+    example_scheduling: str = "global"
+    # Adaptive concurrency (AIMD): starting from eval_concurrency, grow the example-level limit by one per window of
+    # calls while p95 latency and error rates hold, halve it on 429s or timeouts
+    adaptive_concurrency: bool = False
+    adaptive_concurrency_min: int = 1
+    adaptive_concurrency_max: int | None = None  # None = 4x eval_concurrency
 
     # Logging config
     # Log levels control verbosity:
@@ -153,6 +183,13 @@ class Config:
     enable_rung_convergence: bool = True  # Promote stagnating candidates automatically
     lineage_patience: int = 2  # Number of stagnant children before forcing promotion
     lineage_min_improve: float = 0.01  # Minimum improvement over parent to reset lineage counter
+    rung_window: int | None = None  # Recently scored candidates per rung used for promotion thresholds (None = all)
+    # Racing: stop a shard once its promote/prune outcome is settled at racing_confidence.
+    # Bound on the shard mean: "hoeffding", "bernstein" or "beta" (0/1 scores); None evaluates every example.
+    racing: str | None = None
+    racing_confidence: float = 0.95
+    racing_min_examples: int = 5  # Scored examples before a bound may settle an open outcome
+    paired_min_examples: int = 5  # Judge children by per-example differences vs the parent's cached scores (0 = off)
 
     def __post_init__(self):
         """Auto-scale parameters based on eval_concurrency if not explicitly set."""
@@ -9,23 +9,153 @@ we can run quickly in constrained environments.
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, Sequence
+import contextlib
+from collections import deque
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Sequence
 
 from turbo_gepa.logging.logger import LoggerProtocol, StdOutLogger
 
-from .cache import DiskCache
+from .cache import DiskCache, evaluation_key
+from .concurrency import classify_call_error
+from .example_queue import ExampleQueue
 from .interfaces import Candidate, EvalResult
 
 if TYPE_CHECKING:
     from .metrics import Metrics
+    from .scheduler import RaceBound
 
 Validator = Callable[[Candidate], None]
 MetricsMapper = Callable[[dict[str, float]], dict[str, float]]
 TaskRunner = Callable[[Candidate, str], Awaitable[dict[str, float]]]
+Admission = Callable[[Candidate, str], Awaitable[object]]
+CallObserver = Callable[[float, str], None]
+
+
+class InflightRegistry:
+    """
+    Single-flight table of task calls in progress, shared by evaluators.
+
+    Keyed by ``(evaluation_key(candidate), example_id)``. The first evaluator
+    to miss the cache leads the call; others asking for the same key while it
+    runs await its result instead of calling the model again. Islands run in
+    one event loop, so one registry passed to every island's evaluator
+    deduplicates the overlapping evaluations that sharing and migration cause
+    before the shared cache has the result.
+
+    A finished result stays held here, together with the cache the leader
+    writes it to, until the leader reports it persisted (:meth:`release`).
+    A write-behind leader only buffers the result in memory, so until its
+    flush other evaluators could otherwise find it in neither place.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[tuple[str, str], asyncio.Future] = {}
+        self._held: dict[tuple[str, str], tuple[dict[str, float], object]] = {}
+        self.calls_saved = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    @property
+    def held(self) -> int:
+        """Number of finished results not yet persisted by their leader."""
+        return len(self._held)
+
+    def lead(self, key: tuple[str, str]) -> asyncio.Future | None:
+        """Claim ``key`` for a new call; None when a call for it is already running."""
+        if key in self._calls:
+            return None
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        return future
+
+    def finish(
+        self,
+        key: tuple[str, str],
+        future: asyncio.Future,
+        metrics: dict[str, float] | None,
+        cache: object = None,
+    ) -> None:
+        """
+        End the call for ``key`` and hand ``metrics`` (None when the call failed) to the waiting evaluators.
+
+        A successful result is held until :meth:`release` is called with the
+        same ``cache`` (the one the leader writes it to).
+        """
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        shared = (metrics, cache) if metrics is not None else None
+        if shared is not None:
+            self._held[key] = shared
+        if not future.done():
+            future.set_result(shared)
+
+    def release(self, keys: Iterable[tuple[str, str]], cache: object) -> None:
+        """Forget held results for ``keys`` once ``cache`` has persisted them."""
+        for key in keys:
+            held = self._held.get(key)
+            if held is not None and held[1] is cache:
+                del self._held[key]
+
+    async def join(self, key: tuple[str, str]) -> tuple[dict[str, float], object] | None:
+        """
+        ``(metrics, cache)`` of a held or running call for ``key``; None when there is none or it failed.
+
+        ``cache`` is where the leader stores the result, so a waiter using the
+        same cache need not write it again.
+        """
+        while True:
+            held = self._held.get(key)
+            if held is not None:
+                self.calls_saved += 1
+                return held
+            future = self._calls.get(key)
+            if future is None:
+                return None
+            # Shielded: a waiter being cancelled must not cancel the leader's result
+            shared = await asyncio.shield(future)
+            if shared is not None:
+                self.calls_saved += 1
+                return shared
 
 
 class AsyncEvaluator:
-    """Concurrent evaluator with disk-backed caching."""
+    """
+    Concurrent evaluator with disk-backed caching.
+
+    By default every fresh result is written through to the cache before the
+    example counts as complete. With ``write_behind_records > 0`` results are
+    instead buffered in memory (and served from the buffer on lookup) while a
+    background task persists them with ``DiskCache.batch_set`` every
+    ``write_behind_interval`` seconds, or as soon as the buffer holds
+    ``write_behind_records`` entries. A crash therefore loses at most
+    ``write_behind_records`` unflushed results plus the batch being written at
+    that moment; those examples are simply re-evaluated on the next run. Call
+    :meth:`flush` (``Orchestrator.finalize`` does) before relying on the cache
+    contents from another process.
+
+    When ``example_queue`` is set, every uncached example additionally waits
+    for a slot in that shared pool, so concurrent ``eval_on_shard`` calls
+    share one global concurrency budget ordered by their ``priority``.
+
+    ``admission`` (e.g. a rate limiter) is awaited before each uncached task
+    call, once the call holds its slot; time spent there does not count
+    towards ``timeout_seconds``. ``call_observer`` is told the latency and
+    outcome (``"ok"``, ``"error"``, ``"timeout"`` or ``"rate_limit"``) of every
+    finished task call, e.g. to drive an adaptive concurrency limit.
+
+    With ``hedge_percentile`` set, a task call still running past that
+    percentile of recent call latencies gets a duplicate request; the first
+    reply wins and the other is cancelled. Hedges run outside the slot pool
+    and are capped at ``hedge_budget`` of all task calls. Since stragglers are
+    hedged rather than abandoned, ``eval_on_shard`` no longer cancels them.
+
+    ``inflight`` deduplicates concurrent cache misses for the same candidate
+    and example (see :class:`InflightRegistry`): a miss whose call is already
+    running elsewhere waits for that result without taking a slot. If the
+    running call fails, the waiter makes its own call. A waiter sharing the
+    leader's cache does not write the result again.
+    """
 
     def __init__(
         self,
@@ -38,6 +168,15 @@ class AsyncEvaluator:
         timeout_seconds: float | None = None,
         min_improve: float = 0.0,
         metrics: Metrics | None = None,
+        write_behind_records: int = 0,
+        write_behind_interval: float = 1.0,
+        example_queue: ExampleQueue | None = None,
+        admission: Admission | None = None,
+        call_observer: CallObserver | None = None,
+        hedge_percentile: float | None = None,
+        hedge_budget: float = 0.05,
+        hedge_min_samples: int = 20,
+        inflight: InflightRegistry | None = None,
     ) -> None:
         self.cache = cache
         self.task_runner = task_runner
@@ -50,6 +189,152 @@ class AsyncEvaluator:
         self.timeout_seconds = timeout_seconds
         self.min_improve = float(min_improve)
         self.metrics = metrics
+        self.write_behind_records = max(0, int(write_behind_records))
+        self.write_behind_interval = write_behind_interval
+        self.example_queue = example_queue
+        self.admission = admission
+        self.call_observer = call_observer
+        if hedge_percentile is not None and not 0.0 < hedge_percentile < 1.0:
+            raise ValueError(f"hedge_percentile must be in (0, 1), got {hedge_percentile}")
+        self.hedge_percentile = hedge_percentile
+        self.hedge_budget = max(0.0, float(hedge_budget))
+        self.hedge_min_samples = max(1, int(hedge_min_samples))
+        self._call_latencies: deque[float] = deque(maxlen=256)  # Recent successful task-call latencies
+        self._task_calls = 0
+        self.hedges_launched = 0
+        self.hedges_won = 0
+        self.inflight = inflight
+        # Write-behind state: results not yet handed to the cache, and the batch being written
+        self._write_buffer: dict[tuple[str, str], tuple[Candidate, str, EvalResult]] = {}
+        self._writing: dict[tuple[str, str], tuple[Candidate, str, EvalResult]] = {}
+        self._flush_lock: asyncio.Lock | None = None
+        self._flush_task: asyncio.Task | None = None
+
+    def _observe_call(self, latency: float, outcome: str) -> None:
+        if self.call_observer is not None:
+            self.call_observer(latency, outcome)
+
+    def _hedge_delay(self) -> float | None:
+        """Latency after which a running call gets a hedge, or None when hedging is off or over budget."""
+        if self.hedge_percentile is None or len(self._call_latencies) < self.hedge_min_samples:
+            return None
+        if self.hedges_launched >= self.hedge_budget * self._task_calls:
+            return None
+        ordered = sorted(self._call_latencies)
+        return ordered[min(len(ordered) - 1, int(self.hedge_percentile * len(ordered)))]
+
+    async def _call_task(self, candidate: Candidate, example_id: str) -> dict[str, float]:
+        """Run the task call, hedging it with a duplicate request if it straggles past the hedge delay."""
+        self._task_calls += 1
+        delay = self._hedge_delay()
+        if delay is None:
+            return await self.task_runner(candidate, example_id)
+        primary = asyncio.ensure_future(self.task_runner(candidate, example_id))
+        running = {primary}
+        try:
+            done, _ = await asyncio.wait(running, timeout=delay)
+            # Re-check the budget: other calls may have hedged while this one waited
+            if done or self.hedges_launched >= self.hedge_budget * self._task_calls:
+                return await primary
+            hedge = asyncio.ensure_future(self.task_runner(candidate, example_id))
+            running.add(hedge)
+            self.hedges_launched += 1
+            if self.metrics:
+                self.metrics.record_hedge()
+            first_error: BaseException | None = None
+            while running:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    if finished.cancelled():
+                        continue
+                    if finished.exception() is None:
+                        if finished is hedge:
+                            self.hedges_won += 1
+                            if self.metrics:
+                                self.metrics.record_hedge_win()
+                        return finished.result()
+                    first_error = first_error or finished.exception()
+            raise first_error or asyncio.CancelledError()
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def cached_result(
+        self, candidate: Candidate, example_id: str, *, objectives_only: bool = False
+    ) -> EvalResult | None:
+        """Cached result for one example, including writes still buffered in memory."""
+        return await self._cache_get(candidate, example_id, objectives_only=objectives_only)
+
+    async def _cache_get(
+        self, candidate: Candidate, example_id: str, *, objectives_only: bool = False
+    ) -> EvalResult | None:
+        if self._write_buffer or self._writing:
+            key = (evaluation_key(candidate), example_id)
+            pending = self._write_buffer.get(key) or self._writing.get(key)
+            if pending is not None:
+                return pending[2]
+        return await self.cache.get(candidate, example_id, objectives_only=objectives_only)
+
+    async def _cache_set(self, candidate: Candidate, example_id: str, result: EvalResult) -> None:
+        if self.write_behind_records <= 0:
+            try:
+                await self.cache.set(candidate, example_id, result)
+            finally:
+                if self.inflight is not None:
+                    self.inflight.release([(evaluation_key(candidate), example_id)], self.cache)
+            return
+        self._write_buffer[(evaluation_key(candidate), example_id)] = (candidate, example_id, result)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+        if len(self._write_buffer) >= self.write_behind_records:
+            try:
+                await self.flush()
+            except Exception as exc:  # The result is scored and still buffered; the next flush retries it
+                self.logger.log(f"⚠️  Cache flush failed: {type(exc).__name__}: {exc}")
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.write_behind_interval)
+            try:
+                await self.flush()
+            except Exception as exc:  # Keep buffering; the next flush retries these records
+                self.logger.log(f"⚠️  Cache flush failed: {type(exc).__name__}: {exc}")
+
+    @property
+    def pending_writes(self) -> int:
+        """Number of results buffered but not yet persisted to the cache."""
+        return len(self._write_buffer) + len(self._writing)
+
+    async def flush(self) -> None:
+        """Persist every buffered result with a single ``batch_set``."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            if not self._write_buffer:
+                return
+            self._writing, self._write_buffer = self._write_buffer, {}
+            try:
+                await self.cache.batch_set(list(self._writing.values()))
+                if self.inflight is not None:
+                    self.inflight.release(self._writing, self.cache)
+            except BaseException:
+                # Put the batch back (newer buffered results win) so nothing is dropped silently
+                self._writing.update(self._write_buffer)
+                self._write_buffer = self._writing
+                raise
+            finally:
+                self._writing = {}
+
+    async def close(self) -> None:
+        """Stop the background flusher and persist any buffered results."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        await self.flush()
 
     async def eval_on_shard(
         self,
@@ -59,12 +344,17 @@ class AsyncEvaluator:
         shard_fraction: float | None = None,
         show_progress: bool = False,
         early_stop_fraction: float = 0.9,  # Return after 90% complete
+        priority: Sequence[float] = (),
+        race: RaceBound | None = None,
     ) -> EvalResult:
         """
         Evaluate ``candidate`` on ``example_ids`` with a concurrency cap.
 
         Cached traces are reused automatically, and only cache misses trigger
-        fresh model calls.
+        fresh model calls. ``priority`` orders this call's examples in the
+        shared ``example_queue`` (lower first) and is ignored without one.
+        ``race`` (from :meth:`BudgetedScheduler.race_bound`) stops the shard as
+        soon as its promote/prune outcome is settled.
         """
         for validator in self.validators:
             validator(candidate)
@@ -100,10 +390,11 @@ class AsyncEvaluator:
         eval_durations: list[float] = []  # Track how long each eval took (excluding cached)
         quality_lock = asyncio.Lock()
         running_quality = 0.0
+        running_sq = 0.0  # Sum of squared per-example quality, for variance-aware racing bounds
         early_stop_flag = False
 
         async def _register_result(result: EvalResult, quality_override: float | None = None) -> None:
-            nonlocal completed, running_quality, early_stop_flag
+            nonlocal completed, running_quality, running_sq, early_stop_flag
             async with quality_lock:
                 results.append(result)
                 completed += result.n_examples
@@ -114,6 +405,7 @@ class AsyncEvaluator:
                         q_val = float(obj_quality)
                 if isinstance(q_val, (int, float)):
                     running_quality += float(q_val) * max(1, result.n_examples)
+                    running_sq += float(q_val) ** 2 * max(1, result.n_examples)
                 if (
                     not early_stop_flag
                     and parent_target is not None
@@ -132,15 +424,28 @@ class AsyncEvaluator:
                             self.logger.log(
                                 f"⚠️ Early stop: candidate {candidate.fingerprint[:12]} cannot beat parent target {parent_target:.1%}"
                             )
+                if not early_stop_flag and race is not None and completed < total:
+                    verdict = race.settle(running_quality, running_sq, completed, total)
+                    if verdict is not None:
+                        early_stop_flag = True
+                        if self.metrics:
+                            self.metrics.record_racing_stop(total - completed)
+                        if show_progress:
+                            self.logger.log(
+                                f"🏁 Racing: candidate {candidate.fingerprint[:12]} settled ({verdict}) after "
+                                f"{completed}/{total} examples vs target {race.target:.1%}"
+                            )
 
         async def eval_one(example_id: str, task_start_time: float) -> None:
             nonlocal completed
 
-            cached = await self.cache.get(candidate, example_id)
+            cached = await self._cache_get(candidate, example_id)
             if cached:
                 # Track cache hit
                 if self.metrics:
                     self.metrics.record_cache_lookup(hit=True)
+                    if cached.shard_fraction is not None and cached.shard_fraction != shard_fraction:
+                        self.metrics.record_cross_rung_reuse()
                 quality_val = None
                 if isinstance(cached.objectives, dict):
                     q = cached.objectives.get("quality")
@@ -155,26 +460,49 @@ class AsyncEvaluator:
             if self.metrics:
                 self.metrics.record_cache_lookup(hit=False)
 
+            call_started: float | None = None
+            _elapsed_api: float | None = None
+            flight_key = (evaluation_key(candidate), example_id)
+            flight: asyncio.Future | None = None
             try:
-                # Log when we're about to start an API call
-                if show_progress:
-                    self.logger.log(f"🔄 Starting eval for example {example_id} (inflight: {self._inflight_examples})")
-
-                async with semaphore:
+                shared = await self.inflight.join(flight_key) if self.inflight is not None else None
+                if shared is not None:
+                    # Another evaluator just made this exact call; reuse its metrics
+                    metrics, shared_cache = shared
                     self._inflight_examples += 1
-                    if self._inflight_examples > self._max_observed_inflight:
-                        self._max_observed_inflight = self._inflight_examples
+                    if self.metrics:
+                        self.metrics.record_singleflight_hit()
+                else:
+                    if self.inflight is not None:
+                        flight = self.inflight.lead(flight_key)
+                    # Log when we're about to start an API call
+                    if show_progress:
+                        self.logger.log(
+                            f"🔄 Starting eval for example {example_id} (inflight: {self._inflight_examples})"
+                        )
 
-                    _start_api = time.time()
-                    task = self.task_runner(candidate, example_id)
-                    if self.timeout_seconds is not None:
-                        metrics = await asyncio.wait_for(task, timeout=self.timeout_seconds)
-                    else:
-                        metrics = await task
-                    _elapsed_api = time.time() - _start_api
+                    slot = (
+                        self.example_queue.slot(priority) if self.example_queue is not None else contextlib.nullcontext()
+                    )
+                    async with semaphore, slot:
+                        self._inflight_examples += 1
+                        if self._inflight_examples > self._max_observed_inflight:
+                            self._max_observed_inflight = self._inflight_examples
+
+                        if self.admission is not None:
+                            await self.admission(candidate, example_id)
+                        _start_api = call_started = time.time()
+                        task = self._call_task(candidate, example_id)
+                        if self.timeout_seconds is not None:
+                            metrics = await asyncio.wait_for(task, timeout=self.timeout_seconds)
+                        else:
+                            metrics = await task
+                        _elapsed_api = time.time() - _start_api
+                        self._call_latencies.append(_elapsed_api)
+                        self._observe_call(_elapsed_api, "ok")
 
-                    if show_progress:
-                        self.logger.log(f"✅ Completed eval for example {example_id} in {_elapsed_api:.1f}s")
+                        if show_progress:
+                            self.logger.log(f"✅ Completed eval for example {example_id} in {_elapsed_api:.1f}s")
 
                 # Ensure inflight counter is decremented even if mapper raises
                 self._inflight_examples = max(0, self._inflight_examples - 1)
@@ -205,6 +533,7 @@ class AsyncEvaluator:
                     if len(out) > max_len:
                         out = out[: max_len] + "…"
                     trace["output"] = out
+                _store_example_objectives(trace, mapped)
                 result = EvalResult(
                     objectives=mapped,
                     traces=[trace],
@@ -212,10 +541,15 @@ class AsyncEvaluator:
                     shard_fraction=shard_fraction,
                     example_ids=[example_id],
                 )
-                await self.cache.set(candidate, example_id, result)
-                # Track cache write
-                if self.metrics:
-                    self.metrics.record_cache_write()
+                if flight is not None:
+                    # Held by the registry until our cache has persisted it, so later misses find it
+                    self.inflight.finish(flight_key, flight, metrics, self.cache)
+                if shared is None or shared_cache is not self.cache:
+                    # The leader already stores shared results in a common cache
+                    await self._cache_set(candidate, example_id, result)
+                    # Track cache write
+                    if self.metrics:
+                        self.metrics.record_cache_write()
                 quality_val = None
                 if isinstance(mapped, dict):
                     val = mapped.get("quality")
@@ -231,6 +565,8 @@ class AsyncEvaluator:
                     self.logger.log(f"Progress: {completed}/{total} examples ({completed / max(total, 1) * 100:.0f}%)")
             except asyncio.TimeoutError as e:
                 self._inflight_examples = max(0, self._inflight_examples - 1)
+                if call_started is not None:
+                    self._observe_call(time.time() - call_started, "timeout")
                 timeout_msg = (
                     f"⚠️  Evaluation timed out for example {example_id} "
                     f"after {self.timeout_seconds:.1f}s" if self.timeout_seconds else
@@ -247,6 +583,7 @@ class AsyncEvaluator:
                 trace = dict(fallback_metrics)
                 trace["example_id"] = example_id
                 trace["error"] = "timeout"
+                _store_example_objectives(trace, mapped)
                 result = EvalResult(
                     objectives=mapped,
                     traces=[trace],
@@ -258,6 +595,8 @@ class AsyncEvaluator:
                 await _register_result(result, 0.0)
             except Exception as e:
                 self._inflight_examples = max(0, self._inflight_examples - 1)
+                if call_started is not None and _elapsed_api is None:
+                    self._observe_call(time.time() - call_started, classify_call_error(e))
                 # Handle task runner failures gracefully
                 # Return zero scores to avoid crashing the entire batch
                 error_msg = f"⚠️  Evaluation failed for example {example_id}: {type(e).__name__}: {str(e)[:100]}"
@@ -275,6 +614,7 @@ class AsyncEvaluator:
                 trace = dict(fallback_metrics)
                 trace["example_id"] = example_id
                 trace["error"] = str(e)
+                _store_example_objectives(trace, mapped)
                 result = EvalResult(
                     objectives=mapped,
                     traces=[trace],
@@ -284,6 +624,10 @@ class AsyncEvaluator:
                 )
                 # Don't cache failed evaluations - allow retry on next run
                 await _register_result(result, 0.0)
+            finally:
+                if flight is not None:
+                    # Failed or cancelled: wake the waiters so one of them retries the call
+                    self.inflight.finish(flight_key, flight, None)
 
         # Launch all tasks
         current_time = time.time()
@@ -293,7 +637,12 @@ class AsyncEvaluator:
         # Wait for early_stop_fraction to complete, then move on
         while pending:
             # Check if we've hit early stop threshold (dynamic version)
-            if completed >= early_stop_target and early_stop_fraction < 1.0 and len(eval_durations) >= 5:
+            if (
+                completed >= early_stop_target
+                and early_stop_fraction < 1.0
+                and len(eval_durations) >= 5
+                and self.hedge_percentile is None  # Stragglers are hedged instead
+            ):
                 elapsed = time.time() - batch_start_time
                 remaining = len(pending)
 
@@ -352,25 +701,7 @@ class AsyncEvaluator:
 
         # No explicit progress bar cleanup when using logger
 
-        totals: dict[str, float] = {}
-        traces: list[dict[str, float]] = []
-        example_trace_ids: list[str] = []
-        n_examples = 0
-        for result in results:
-            totals = _accumulate(totals, result.objectives, weight=result.n_examples)
-            traces.extend(result.traces)
-            if result.example_ids:
-                example_trace_ids.extend(result.example_ids)
-            n_examples += result.n_examples
-
-        averaged = {k: v / max(n_examples, 1) for k, v in totals.items()}
-        return EvalResult(
-            objectives=averaged,
-            traces=traces,
-            n_examples=n_examples,
-            shard_fraction=shard_fraction,
-            example_ids=example_trace_ids,
-        )
+        return aggregate_results(results, shard_fraction)
 
     @property
     def inflight_examples(self) -> int:
@@ -383,6 +714,89 @@ class AsyncEvaluator:
         return self._max_observed_inflight
 
 
+def aggregate_results(results: Iterable[EvalResult], shard_fraction: float | None = None) -> EvalResult:
+    """
+    Combine per-example results into one shard-level result (example-weighted mean objectives).
+
+    Traces are concatenated only when first read; per-example scores and errors
+    are answered from the parts, so cached records keep their traces undecoded.
+    """
+    parts = list(results)
+    totals: dict[str, float] = {}
+    example_trace_ids: list[str] = []
+    n_examples = 0
+    for result in parts:
+        totals = _accumulate(totals, result.objectives, weight=result.n_examples)
+        if result.example_ids:
+            example_trace_ids.extend(result.example_ids)
+        n_examples += result.n_examples
+
+    averaged = {k: v / max(n_examples, 1) for k, v in totals.items()}
+    return _ShardResult(averaged, parts, n_examples, shard_fraction, example_trace_ids)
+
+
+class _ShardResult(EvalResult):
+    """Aggregate of per-example results whose traces are concatenated on first access."""
+
+    def __init__(
+        self,
+        objectives: dict[str, float],
+        parts: list[EvalResult],
+        n_examples: int,
+        shard_fraction: float | None,
+        example_ids: list[str],
+    ) -> None:
+        self.objectives = objectives
+        self.n_examples = n_examples
+        self.shard_fraction = shard_fraction
+        self.example_ids = example_ids
+        self._parts: list[EvalResult] | None = parts
+        self._traces: list[dict[str, Any]] | None = None
+
+    @property
+    def traces(self) -> list[dict[str, Any]]:
+        if self._traces is None:
+            self._traces = [trace for part in self._parts or () for trace in part.traces]
+            self._parts = None
+        return self._traces
+
+    @traces.setter
+    def traces(self, value: list[dict[str, Any]]) -> None:
+        self._traces = value
+        self._parts = None
+
+    def example_scores(self, key: str) -> dict[str, float]:
+        if self._parts is None:
+            return super().example_scores(key)
+        scores: dict[str, float] = {}
+        for part in self._parts:
+            value = part.objectives.get(key)
+            if part.n_examples == 1 and part.example_ids and isinstance(value, (int, float)):
+                # A single example's objectives are its score; no need to touch its traces
+                scores[str(part.example_ids[0])] = float(value)
+            else:
+                scores.update(part.example_scores(key))
+        return scores
+
+    def example_errors(self) -> dict[str, str]:
+        if self._parts is None:
+            return super().example_errors()
+        errors: dict[str, str] = {}
+        for part in self._parts:
+            # Failed evaluations are never cached, so records still holding raw trace bytes have no errors
+            if getattr(part, "traces_decoded", True):
+                errors.update(part.example_errors())
+        return errors
+
+    def __repr__(self) -> str:
+        # Avoid decoding traces just to print the result (asyncio reprs task results too)
+        traces = repr(self._traces) if self._traces is not None else f"<traces of {len(self._parts or ())} results>"
+        return (
+            f"EvalResult(objectives={self.objectives!r}, traces={traces}, n_examples={self.n_examples!r}, "
+            f"shard_fraction={self.shard_fraction!r}, example_ids={self.example_ids!r})"
+        )
+
+
 def _accumulate(
     base: dict[str, float],
     update: dict[str, float],
@@ -395,3 +809,16 @@ def _accumulate(
             continue
         merged[key] = merged.get(key, 0.0) + value * weight
     return merged
+
+
+def _store_example_objectives(trace: dict[str, object], mapped: dict[str, float]) -> None:
+    """
+    Write the example's mapped objectives into its trace.
+
+    Per-example consumers (paired comparisons, the score matrix, instance-mode
+    archive columns) read ``trace[objective]``, so they see the same values
+    that average into ``EvalResult.objectives`` rather than the raw metrics.
+    """
+    for key, value in mapped.items():
+        if key not in ("example_id", "error") and isinstance(value, (int, float)) and not isinstance(value, bool):
+            trace[key] = value
@@ -0,0 +1,129 @@
+"""
+Global example-level work queue shared by every candidate evaluation.
+
+Instead of reserving a slice of the concurrency budget for each launched
+candidate, every (candidate, example) call waits here for one of a fixed pool
+of slots. Free slots are handed to the waiting call with the lowest
+``(priority, arrival order)``, so the pool stays busy as long as any launched
+evaluation has work left, and no slot sits idle while its candidate waits on
+stragglers. Cancelled waiters are discarded lazily.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Sequence
+
+
+class ExampleQueue:
+    """Priority dispatch of example evaluations onto ``capacity`` shared slots."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(1, int(capacity))
+        self.busy = 0
+        self._waiters: list[tuple[tuple[float, ...], int, asyncio.Future[None]]] = []
+        self._waiting = 0
+        self._seq = 0
+        self.dispatched = 0
+        self.peak_busy = 0
+        self.peak_waiting = 0
+        # Utilisation accounting: integral of busy slots (and of capacity) over time since first use
+        self._busy_seconds = 0.0
+        self._capacity_seconds = 0.0
+        self._last_change: float | None = None
+        # Called whenever a slot falls idle because nothing is waiting (e.g. to launch more work)
+        self.idle_listeners: list[Callable[[], None]] = []
+
+    @property
+    def waiting(self) -> int:
+        """Calls queued for a slot."""
+        return self._waiting
+
+    @asynccontextmanager
+    async def slot(self, priority: Sequence[float] = ()) -> AsyncIterator[None]:
+        """
+        Hold one slot for the duration of the block.
+
+        Lower ``priority`` tuples are served first; the empty default sorts
+        ahead of everything, which suits one-off evaluations the run blocks on.
+        Ties are served in arrival order.
+        """
+        if self.busy < self.capacity and not self._waiting:
+            self._take()
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._seq += 1
+            heapq.heappush(self._waiters, (tuple(priority), self._seq, future))
+            self._waiting += 1
+            self.peak_waiting = max(self.peak_waiting, self._waiting)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The slot was handed over just as we were cancelled: pass it on
+                    self._release()
+                else:
+                    future.cancel()
+                    self._waiting -= 1
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def resize(self, capacity: int) -> None:
+        """Change the pool size; extra slots are handed to waiters immediately."""
+        self._account()
+        self.capacity = max(1, int(capacity))
+        self._dispatch()
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for metrics: dispatches, peak backlog and slot-seconds used versus available."""
+        self._account()
+        return {
+            "capacity": self.capacity,
+            "dispatched": self.dispatched,
+            "peak_busy": self.peak_busy,
+            "peak_waiting": self.peak_waiting,
+            "busy_seconds": self._busy_seconds,
+            "capacity_seconds": self._capacity_seconds,
+        }
+
+    def utilisation(self) -> float:
+        """Fraction of slot-seconds spent evaluating since the queue was first used."""
+        self._account()
+        return self._busy_seconds / self._capacity_seconds if self._capacity_seconds > 0 else 0.0
+
+    def _take(self) -> None:
+        self._account()
+        self.busy += 1
+        self.dispatched += 1
+        self.peak_busy = max(self.peak_busy, self.busy)
+
+    def _release(self) -> None:
+        self._account()
+        self.busy -= 1
+        self._dispatch()
+        if self.busy < self.capacity:
+            for listener in self.idle_listeners:
+                listener()
+
+    def _dispatch(self) -> None:
+        while self.busy < self.capacity and self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():  # Cancelled while waiting
+                continue
+            self._waiting -= 1
+            self._take()
+            future.set_result(None)
+
+    def _account(self) -> None:
+        now = time.perf_counter()
+        if self._last_change is not None:
+            elapsed = now - self._last_change
+            self._busy_seconds += self.busy * elapsed
+            self._capacity_seconds += self.capacity * elapsed
+        self._last_change = now
@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Iterable, Sequence
 
 
@@ -26,47 +27,89 @@ class Candidate:
         merged.update(updates)
         return Candidate(text=self.text, meta=merged)
 
-    @property
+    @cached_property
     def fingerprint(self) -> str:
-        """Stable identifier derived from canonicalised prompt + metadata."""
+        """Stable identifier derived from canonicalised prompt + metadata.
+
+        Computed once per instance: candidates are immutable, so ``meta`` must
+        not be edited in place after construction (use :meth:`with_meta`).
+        """
         import xxhash
 
-        def _normalize(value: Any) -> Any:
-            if value is None:
-                return None
-            if isinstance(value, str):
-                return " ".join(value.split())
-            if isinstance(value, Candidate):  # pragma: no cover - defensive
-                return value.fingerprint
-            if isinstance(value, Mapping):
-                return {k: _normalize(value[k]) for k in sorted(value)}
-            if isinstance(value, (list, tuple)):
-                return [_normalize(v) for v in value]
-            if isinstance(value, set):
-                normalised = [_normalize(v) for v in value]
-                return sorted(normalised, key=lambda x: repr(x))
-            return value
-
-        canonical = {
-            "text": _normalize(self.text),
-            "meta": _normalize({k: self.meta[k] for k in sorted(self.meta)}),
-        }
+        return xxhash.xxh3_64_hexdigest(_fingerprint_payload(self.text, self.meta))
+
+    @cached_property
+    def eval_key(self) -> str:
+        """Evaluation identity derived only from fields that change model output.
 
+        Unlike :attr:`fingerprint`, this ignores bookkeeping metadata such as
+        ``quality`` or ``_sched_key`` that the orchestrator rewrites after every
+        evaluation, so cached per-example results survive promotion between rungs.
+        """
+        import xxhash
+
+        identity = {
+            "text": self.text,
+            "temperature": self.meta.get("temperature"),
+            "reasoning_effort": self.meta.get("reasoning_effort"),
+        }
         try:
-            payload = json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            payload = json.dumps(identity, sort_keys=True, separators=(",", ":")).encode("utf-8")
         except TypeError:
-            # Fallback: stringify non-serialisable objects deterministically
-            fallback = {
-                "text": canonical["text"],
-                "meta": {k: repr(v) for k, v in canonical["meta"].items()}
-                if isinstance(canonical["meta"], dict)
-                else repr(canonical["meta"]),
-            }
-            payload = json.dumps(fallback, sort_keys=True, separators=(",", ":")).encode("utf-8")
-
+            payload = json.dumps({k: repr(v) for k, v in identity.items()}, sort_keys=True).encode("utf-8")
         return xxhash.xxh3_64_hexdigest(payload)
 
 
+_FLAT_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _normalize(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, Candidate):  # pragma: no cover - defensive
+        return value.fingerprint
+    if isinstance(value, Mapping):
+        return {k: _normalize(value[k]) for k in sorted(value)}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, set):
+        normalised = [_normalize(v) for v in value]
+        return sorted(normalised, key=lambda x: repr(x))
+    return value
+
+
+def _fingerprint_payload(text: str, meta: Mapping[str, Any]) -> bytes:
+    """Canonical JSON bytes hashed into :attr:`Candidate.fingerprint`."""
+    if type(text) is str and all(type(k) is str and type(v) in _FLAT_TYPES for k, v in meta.items()):
+        # Fast path for flat string/scalar meta (the common case); produces the same bytes as the general path
+        flat = {k: " ".join(v.split()) if type(v) is str else v for k, v in meta.items()}
+        canonical = {"text": " ".join(text.split()), "meta": flat}
+        return json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return _canonical_payload(text, meta)
+
+
+def _canonical_payload(text: str, meta: Mapping[str, Any]) -> bytes:
+    """General path: recursively normalise nested meta before serialising."""
+    canonical = {
+        "text": _normalize(text),
+        "meta": _normalize({k: meta[k] for k in sorted(meta)}),
+    }
+
+    try:
+        return json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    except TypeError:
+        # Fallback: stringify non-serialisable objects deterministically
+        fallback = {
+            "text": canonical["text"],
+            "meta": {k: repr(v) for k, v in canonical["meta"].items()}
+            if isinstance(canonical["meta"], dict)
+            else repr(canonical["meta"]),
+        }
+        return json.dumps(fallback, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
 @dataclass
 class EvalResult:
     """
@@ -87,6 +130,24 @@ class EvalResult:
             return self.objectives[key]
         return self.objectives.get(key, default)
 
+    def example_scores(self, key: str) -> dict[str, float]:
+        """Per-example ``key`` values by example ID (examples without a numeric value are left out)."""
+        scores: dict[str, float] = {}
+        for trace in self.traces:
+            example_id = trace.get("example_id") if isinstance(trace, dict) else None
+            value = trace.get(key) if isinstance(trace, dict) else None
+            if example_id is not None and isinstance(value, (int, float)):
+                scores[str(example_id)] = float(value)
+        return scores
+
+    def example_errors(self) -> dict[str, str]:
+        """Error recorded for each example whose evaluation failed or timed out, by example ID."""
+        errors: dict[str, str] = {}
+        for trace in self.traces:
+            if isinstance(trace, dict) and trace.get("error") is not None:
+                errors[str(trace.get("example_id"))] = str(trace["error"])
+        return errors
+
     def merge(self, other: EvalResult) -> EvalResult:
         """Combine two evaluation results by summing objectives and traces."""
         combined = dict(self.objectives)
@@ -0,0 +1,199 @@
+"""
+Pluggable LLM backends.
+
+Adapters and the seed initializer never import a provider SDK directly; they
+call ``backend.acompletion(**kwargs)`` with litellm-style arguments (``model``,
+``messages``, ``temperature``, ``max_tokens``...) and read a litellm-shaped
+response (``response.choices[0].message.content``, ``response.usage``).
+
+* :class:`LiteLLMBackend` (the default) forwards to ``litellm.acompletion``.
+* :class:`SimulatedBackend` answers in-process with configurable latency,
+  error and 429 rates, token counts and per-(prompt, example) correctness, so
+  orchestration throughput and scheduler changes can be measured offline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+from types import SimpleNamespace
+from typing import Any, Callable, Mapping, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class LLMBackend(Protocol):
+    """Anything with a litellm-compatible async ``acompletion``."""
+
+    async def acompletion(self, **kwargs: Any) -> Any: ...
+
+
+class LiteLLMBackend:
+    """Backend that forwards every call to ``litellm.acompletion``."""
+
+    async def acompletion(self, **kwargs: Any) -> Any:
+        try:
+            from litellm import acompletion
+        except ImportError:
+            raise ImportError("litellm is required for LiteLLMBackend. Install with: pip install litellm")
+        return await acompletion(**kwargs)
+
+
+class SimulatedRateLimitError(Exception):
+    """HTTP 429 raised by :class:`SimulatedBackend`."""
+
+    status_code = 429
+
+
+class SimulatedAPIError(Exception):
+    """Transient provider error raised by :class:`SimulatedBackend`."""
+
+    status_code = 500
+
+
+def _unit(*parts: str) -> float:
+    """Stable hash of ``parts`` mapped to [0, 1) (independent of PYTHONHASHSEED)."""
+    digest = hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64
+
+
+def default_accuracy(prompt: str, example: str) -> float:
+    """Probability that ``prompt`` solves ``example``: a per-prompt skill times a per-example ease."""
+    skill = 0.2 + 0.7 * _unit("skill", prompt)
+    ease = 0.4 + 0.6 * _unit("ease", example)
+    return skill * ease
+
+
+class SimulatedBackend:
+    """
+    Deterministic in-process stand-in for an LLM provider.
+
+    Task calls (a system prompt plus a user message) are judged correct when a
+    stable hash of ``(prompt, example)`` falls below ``accuracy(prompt,
+    example)``, so repeated calls agree and better prompts score higher. A
+    correct reply contains the expected answer from ``answers`` (keyed by the
+    user message); a wrong one is ``"???"``. Other calls (reflection, spec
+    induction, seed initialization) return ``variants`` new prompts in the
+    format the request asks for (``<PROMPT>`` tags, ``---SPEC---`` or ``---``
+    separators).
+
+    Latency is log-normal around ``latency`` seconds with spread
+    ``latency_sigma``; ``rate_limit_rate`` and ``error_rate`` inject failures,
+    and calls beyond ``max_concurrency`` running at once are rejected with a
+    429. Random draws come from a generator seeded with ``seed``.
+    """
+
+    def __init__(
+        self,
+        *,
+        answers: Mapping[str, str] | None = None,
+        accuracy: Callable[[str, str], float] = default_accuracy,
+        latency: float = 0.0,
+        latency_sigma: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        error_rate: float = 0.0,
+        max_concurrency: int | None = None,
+        completion_tokens: int = 64,
+        variants: int = 3,
+        seed: int = 0,
+    ) -> None:
+        self.answers = dict(answers or {})
+        self.accuracy = accuracy
+        self.latency = max(0.0, float(latency))
+        self.latency_sigma = max(0.0, float(latency_sigma))
+        self.rate_limit_rate = float(rate_limit_rate)
+        self.error_rate = float(error_rate)
+        self.max_concurrency = max_concurrency
+        self.completion_tokens = int(completion_tokens)
+        self.variants = max(1, int(variants))
+        self._rng = random.Random(seed)
+        self.running = 0
+        self.calls = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.total_tokens = 0
+        self._prompt_replies = 0
+
+    @classmethod
+    def from_dataset(cls, dataset: Any, **kwargs: Any) -> SimulatedBackend:
+        """Simulator whose task replies know the answers of ``dataset`` (items with ``input``/``answer``)."""
+        answers = {}
+        for item in dataset:
+            payload = item.to_payload() if hasattr(item, "to_payload") else item
+            answers[str(payload["input"])] = str(payload["answer"])
+        return cls(answers=answers, **kwargs)
+
+    async def acompletion(self, **kwargs: Any) -> Any:
+        self.calls += 1
+        messages = list(kwargs.get("messages") or [])
+        if self.max_concurrency is not None and self.running >= self.max_concurrency:
+            self.rate_limited += 1
+            raise SimulatedRateLimitError(f"429 Too Many Requests ({self.running} calls running)")
+        self.running += 1
+        try:
+            delay = self._latency()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            draw = self._rng.random()
+            if draw < self.rate_limit_rate:
+                self.rate_limited += 1
+                raise SimulatedRateLimitError("429 Too Many Requests (simulated rate limit)")
+            if draw < self.rate_limit_rate + self.error_rate:
+                self.errors += 1
+                raise SimulatedAPIError("500 Internal Server Error (simulated)")
+            system = next((m["content"] for m in messages if m.get("role") == "system"), None)
+            user = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "")
+            if system is not None:
+                content = self._task_reply(system, user)
+            else:
+                content = self._prompt_reply(user)
+        finally:
+            self.running -= 1
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in messages) // 4
+        completion_tokens = max(1, min(self.completion_tokens, len(content) // 4 or 1))
+        self.total_tokens += prompt_tokens + completion_tokens
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            ),
+            model=kwargs.get("model"),
+        )
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "calls": self.calls,
+            "rate_limited": self.rate_limited,
+            "errors": self.errors,
+            "total_tokens": self.total_tokens,
+        }
+
+    def _latency(self) -> float:
+        if self.latency <= 0:
+            return 0.0
+        if self.latency_sigma <= 0:
+            return self.latency
+        mu = -self.latency_sigma**2 / 2  # Keeps the mean at ``latency``
+        return self.latency * self._rng.lognormvariate(mu, self.latency_sigma)
+
+    def _task_reply(self, prompt: str, example: str) -> str:
+        correct = _unit("correct", prompt, example) < self.accuracy(prompt, example)
+        answer = self.answers.get(example)
+        if correct and answer is not None:
+            return f"Final answer: {answer}"
+        return "???"  # No letters or digits, so it cannot contain the expected answer by accident
+
+    def _prompt_reply(self, request: str) -> str:
+        self._prompt_replies += 1
+        tag = hashlib.blake2b(f"{request}\x1f{self._prompt_replies}".encode(), digest_size=4).hexdigest()
+        prompts = [
+            f"You are a meticulous problem solver (strategy {tag}-{idx}). Read the question carefully, reason "
+            "step by step, check your work, and end with 'Final answer:' followed by the answer."
+            for idx in range(self.variants)
+        ]
+        if "<PROMPT>" in request:
+            return "\n\n".join(f"<PROMPT>\n{prompt}\n</PROMPT>" for prompt in prompts)
+        separator = "---SPEC---" if "---SPEC---" in request else "---"
+        return f"\n{separator}\n".join(prompts)
@@ -34,23 +34,43 @@ class Metrics:
     llm_latency_samples: list[float] = field(default_factory=list)
     llm_timeouts: int = 0
     llm_errors: int = 0
+    rate_limit_waits: dict[str, int] = field(default_factory=lambda: defaultdict(int))  # Calls delayed, by call type
+    rate_limit_wait_seconds: dict[str, float] = field(default_factory=lambda: defaultdict(float))  # Queueing delay
 
     # Cache Performance
     cache_hits: int = 0
     cache_misses: int = 0
     cache_writes: int = 0
+    cache_cross_rung_hits: int = 0  # Hits served from an evaluation on a different shard
+    cache_memory_hits: int = 0  # Lookups answered by the in-memory index
+    cache_memory_misses: int = 0
+    cache_evictions: int = 0  # Candidates dropped from the in-memory index
+    cache_trace_evictions: int = 0  # Candidates whose traces were dropped (objectives kept)
+    cache_resident_bytes: int = 0
 
     # Evaluation Throughput
     evaluations_total: int = 0
     evaluations_by_shard: dict[float, int] = field(default_factory=lambda: defaultdict(int))
     concurrent_evals_peak: int = 0
     eval_time_sum: float = 0.0
+    example_slots: int = 0  # Size of the shared example queue (global example scheduling)
+    example_slot_busy_seconds: float = 0.0
+    example_slot_capacity_seconds: float = 0.0
+    example_queue_peak_waiting: int = 0
+    hedges_launched: int = 0  # Duplicate requests for straggling task calls
+    hedges_won: int = 0  # ... that answered before the original
+    singleflight_calls_saved: int = 0  # Cache misses served by an identical call already in flight
+    concurrency_limit: int = 0  # Current adaptive (AIMD) example-level limit; 0 when fixed
+    concurrency_increases: int = 0
+    concurrency_decreases: int = 0
 
     # Scheduler Decisions
     candidates_promoted: int = 0
     candidates_pruned: int = 0
     candidates_completed: int = 0
     promotions_by_rung: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+    promotion_evaluations: int = 0  # Launches of a candidate on a higher rung than its previous one
+    promotion_examples_saved: int = 0  # Examples of those shards already scored on the lower rung
 
     # Mutation Performance
     mutations_generated: int = 0
@@ -61,8 +81,14 @@ class Metrics:
     # Early Stopping
     early_stops_parent_target: int = 0
     early_stops_stragglers: int = 0
+    early_stops_racing: int = 0
+    racing_examples_saved: int = 0  # Shard examples skipped once a race settled
     candidates_early_stopped: int = 0
 
+    # Paired parent comparisons (child vs parent on common examples)
+    paired_comparisons: int = 0
+    paired_examples: int = 0
+
     # Operator Success Tracking
     operator_delta_quality: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
 
@@ -93,6 +119,12 @@ class Metrics:
         elif call_type == "spec_induction":
             self.llm_calls_spec_induction += 1
 
+    def record_rate_limit_wait(self, call_type: str, seconds: float) -> None:
+        """Record the time an LLM call queued for the shared rate limiter (zero waits are not counted)."""
+        if seconds > 0:
+            self.rate_limit_waits[call_type] += 1
+            self.rate_limit_wait_seconds[call_type] += seconds
+
     def record_cache_lookup(self, hit: bool) -> None:
         """Record a cache lookup result."""
         if hit:
@@ -100,10 +132,50 @@ class Metrics:
         else:
             self.cache_misses += 1
 
+    def record_cross_rung_reuse(self) -> None:
+        """Record a cache hit that reused a result scored on a different rung."""
+        self.cache_cross_rung_hits += 1
+
+    def record_cache_memory(self, stats: dict[str, int]) -> None:
+        """Record a snapshot of the cache's in-memory index counters (``DiskCache.memory_stats``)."""
+        self.cache_memory_hits = stats.get("hits", 0)
+        self.cache_memory_misses = stats.get("misses", 0)
+        self.cache_evictions = stats.get("evictions", 0)
+        self.cache_trace_evictions = stats.get("trace_evictions", 0)
+        self.cache_resident_bytes = stats.get("resident_bytes", 0)
+
     def record_cache_write(self) -> None:
         """Record a cache write."""
         self.cache_writes += 1
 
+    def record_example_queue(self, stats: dict[str, float]) -> None:
+        """Record a snapshot of the shared example queue's counters (``ExampleQueue.stats``)."""
+        self.example_slots = int(stats.get("capacity", 0))
+        self.example_slot_busy_seconds = stats.get("busy_seconds", 0.0)
+        self.example_slot_capacity_seconds = stats.get("capacity_seconds", 0.0)
+        self.example_queue_peak_waiting = int(stats.get("peak_waiting", 0))
+        self.update_concurrent_evals(int(stats.get("peak_busy", 0)))
+
+    def record_hedge(self) -> None:
+        """Record a duplicate request launched for a straggling task call."""
+        self.hedges_launched += 1
+
+    def record_hedge_win(self) -> None:
+        """Record a hedge that answered before the original call."""
+        self.hedges_won += 1
+
+    def record_singleflight_hit(self) -> None:
+        """Record a task call saved by awaiting an identical in-flight call."""
+        self.singleflight_calls_saved += 1
+
+    def record_concurrency_limit(self, limit: int, *, increased: bool) -> None:
+        """Record a change of the adaptive concurrency limit."""
+        self.concurrency_limit = limit
+        if increased:
+            self.concurrency_increases += 1
+        else:
+            self.concurrency_decreases += 1
+
     def record_evaluation(self, shard_fraction: float, duration: float) -> None:
         """Record an evaluation completion."""
         self.evaluations_total += 1
@@ -115,6 +187,11 @@ class Metrics:
         self.candidates_promoted += 1
         self.promotions_by_rung[from_rung] += 1
 
+    def record_promotion_reuse(self, saved: int) -> None:
+        """Record a promoted candidate's launch and how many of its examples the lower rung already scored."""
+        self.promotion_evaluations += 1
+        self.promotion_examples_saved += saved
+
     def record_pruning(self) -> None:
         """Record a candidate being pruned."""
         self.candidates_pruned += 1
@@ -145,8 +222,20 @@ class Metrics:
             self.early_stops_parent_target += 1
         elif reason == "stragglers":
             self.early_stops_stragglers += 1
+        elif reason == "racing":
+            self.early_stops_racing += 1
         self.candidates_early_stopped += 1
 
+    def record_racing_stop(self, skipped: int) -> None:
+        """Record a racing evaluation that settled with ``skipped`` shard examples left unevaluated."""
+        self.record_early_stop("racing")
+        self.racing_examples_saved += skipped
+
+    def record_paired_comparison(self, common_examples: int) -> None:
+        """Record a child judged against its parent on ``common_examples`` shared examples."""
+        self.paired_comparisons += 1
+        self.paired_examples += common_examples
+
     def update_concurrent_evals(self, current: int) -> None:
         """Update peak concurrent evaluations."""
         if current > self.concurrent_evals_peak:
@@ -181,6 +270,32 @@ class Metrics:
         total = self.candidates_promoted + self.candidates_pruned
         return self.candidates_promoted / total if total > 0 else 0.0
 
+    @property
+    def examples_saved_per_promotion(self) -> float:
+        """Mean number of examples a promoted candidate reuses from its previous rung."""
+        if self.promotion_evaluations == 0:
+            return 0.0
+        return self.promotion_examples_saved / self.promotion_evaluations
+
+    @property
+    def paired_examples_mean(self) -> float:
+        """Mean number of common examples behind a paired parent comparison."""
+        if self.paired_comparisons == 0:
+            return 0.0
+        return self.paired_examples / self.paired_comparisons
+
+    @property
+    def example_slot_utilisation(self) -> float:
+        """Fraction of example-slot time spent evaluating."""
+        if self.example_slot_capacity_seconds <= 0:
+            return 0.0
+        return self.example_slot_busy_seconds / self.example_slot_capacity_seconds
+
+    @property
+    def rate_limit_wait_total(self) -> float:
+        """Total seconds LLM calls spent queued for the rate limiter."""
+        return sum(self.rate_limit_wait_seconds.values())
+
     @property
     def llm_latency_mean(self) -> float:
         """Calculate mean LLM latency."""
@@ -240,15 +355,27 @@ class Metrics:
             f"    - Spec induction: {self.llm_calls_spec_induction}",
             f"  Latency: mean={self.llm_latency_mean:.2f}s, p50={self.llm_latency_p50:.2f}s, p95={self.llm_latency_p95:.2f}s",
             f"  Timeouts: {self.llm_timeouts}, Errors: {self.llm_errors}",
+            f"  Rate-limit queueing: {sum(self.rate_limit_waits.values())} calls delayed, "
+            f"{self.rate_limit_wait_total:.1f}s total {dict(self.rate_limit_wait_seconds)}",
             "",
             "💾 Cache Performance:",
             f"  Hit rate: {self.cache_hit_rate:.1%} ({self.cache_hits}/{self.cache_hits + self.cache_misses})",
             f"  Writes: {self.cache_writes}",
+            f"  Cross-rung reuse: {self.cache_cross_rung_hits}",
+            f"  Memory index: {self.cache_memory_hits} hits, {self.cache_memory_misses} misses, "
+            f"{self.cache_evictions} evictions, {self.cache_trace_evictions} trace evictions, "
+            f"{self.cache_resident_bytes / 1e6:.1f} MB resident",
             "",
             "⚡ Evaluation Throughput:",
             f"  Total evaluations: {self.evaluations_total}",
             f"  Throughput: {self.evals_per_second:.2f} evals/sec",
             f"  Peak concurrency: {self.concurrent_evals_peak}",
+            f"  Example slots: {self.example_slot_utilisation:.1%} busy across {self.example_slots} "
+            f"(peak backlog {self.example_queue_peak_waiting})",
+            f"  Hedged calls: {self.hedges_launched} launched, {self.hedges_won} answered first",
+            f"  Single-flight: {self.singleflight_calls_saved} calls saved by joining identical in-flight calls",
+            f"  Adaptive concurrency: limit {self.concurrency_limit} "
+            f"({self.concurrency_increases} increases, {self.concurrency_decreases} cuts)",
             f"  By shard: {dict(self.evaluations_by_shard)}",
             "",
             "📊 Scheduler Decisions:",
@@ -257,6 +384,10 @@ class Metrics:
             f"  Completed: {self.candidates_completed}",
             f"  Promotion rate: {self.promotion_rate:.1%}",
             f"  Promotions by rung: {dict(self.promotions_by_rung)}",
+            f"  Examples saved per promotion: {self.examples_saved_per_promotion:.1f} "
+            f"({self.promotion_examples_saved} over {self.promotion_evaluations} promoted launches)",
+            f"  Paired parent comparisons: {self.paired_comparisons} "
+            f"({self.paired_examples_mean:.1f} common examples each)",
             "",
             "🔬 Mutation Generation:",
             f"  Total mutations: {self.mutations_generated}",
@@ -284,6 +415,7 @@ class Metrics:
             "🚫 Early Stopping:",
             f"  Parent target: {self.early_stops_parent_target}",
             f"  Stragglers: {self.early_stops_stragglers}",
+            f"  Racing: {self.early_stops_racing} ({self.racing_examples_saved} examples skipped)",
             f"  Total candidates early-stopped: {self.candidates_early_stopped}",
             "",
             "📦 Archive:",
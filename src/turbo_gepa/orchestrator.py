@@ -10,25 +10,52 @@ in the same process (async ring topology), not separate OS processes.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import math
 import time
-from collections import defaultdict, deque
+from collections import deque
 from typing import Any, Callable, Iterable, Sequence
 
 from turbo_gepa.logging.logger import LogLevel, LoggerProtocol, StdOutLogger
 
 from .archive import Archive, ArchiveEntry
-from .cache import DiskCache, candidate_key
+from .cache import (
+    CHECKPOINT_VERSION,
+    DiskCache,
+    SerializationMemo,
+    TrackedDict,
+    TrackedSet,
+    candidate_key,
+    deserialize_candidate,
+    deserialize_result,
+    evaluation_key,
+    serialize_candidate,
+    serialize_result,
+)
+from .concurrency import AIMDController
 from .config import Config
-from .evaluator import AsyncEvaluator
+from .evaluator import AsyncEvaluator, aggregate_results
+from .example_queue import ExampleQueue
 from .interfaces import Candidate, EvalResult
 from .islands import IslandContext, integrate_in, migrate_out
 from .metrics import Metrics
 from .mutator import Mutator
 from .sampler import InstanceSampler
-from .scheduler import BudgetedScheduler, SchedulerConfig
+from .ready_queue import ReadyQueue
+from .scheduler import BudgetedScheduler, SchedulerConfig, scheduling_key
+from .score_matrix import ScoreMatrix
 from .stop_governor import EpochMetrics, StopGovernor, compute_hypervolume_2d
 
+# Back-off before retrying a mutation task that produced no candidates
+_MUTATION_COOLDOWN_SECONDS = 1.0
+# Upper bound on how long the idle main loop sleeps without an event (safety net only)
+_WAKEUP_FALLBACK_SECONDS = 1.0
+
+
+def _new_lineage_history() -> deque:
+    return deque(maxlen=8)
+
 
 class Orchestrator:
     """Single-island orchestrator loop."""
@@ -66,15 +93,24 @@ class Orchestrator:
                 enable_convergence=config.enable_rung_convergence,
                 lineage_patience=config.lineage_patience,
                 lineage_min_improve=config.lineage_min_improve,
+                rung_window=config.rung_window,
+                racing=config.racing,
+                racing_confidence=config.racing_confidence,
+                racing_min_examples=config.racing_min_examples,
+                paired_min_examples=config.paired_min_examples,
             )
         )
         self._runtime_shards: list[float] = list(self.config.shards)
-        self.queue: deque[Candidate] = deque(maxlen=config.queue_limit)
-        self._per_shard_queue: list[deque[Candidate]] = [deque() for _ in range(len(self._runtime_shards))]
-        self._pending_fingerprints: set[str] = set()
-        self._inflight_fingerprints: set[str] = set()
+        self._base_shards: tuple[float, ...] = tuple(self.config.shards)
+        self._run_signature: str | None = None
+        self.queue = ReadyQueue(len(self._runtime_shards), maxlen=config.queue_limit)
         self._next_shard: int = 0
         self.latest_results: dict[str, EvalResult] = {}
+        # Serialized latest_results reused across checkpoints until the result is replaced
+        self._result_memo = SerializationMemo(serialize_result)
+        # Per-example promotion-objective scores of every candidate (rows keyed by scheduling key)
+        self.score_matrix = ScoreMatrix(self.sampler.example_ids)
+        self.sampler.score_matrix = self.score_matrix
         self.evaluations_run: int = 0
         self.round_index: int = 0
         self.show_progress = show_progress
@@ -85,6 +121,13 @@ class Orchestrator:
         self.total_tokens_spent: int = 0
         self.qd_cells_seen: set[tuple] = set()
         self._shard_cache: dict[tuple[int, float], list[str]] = {}
+        # Nested shards: one example permutation per window (rung shards are its prefixes), and the
+        # window, rung and shard of each candidate's last launch so promotions stay on their permutation
+        self._window_orders: dict[int, list[str]] = {}
+        self._candidate_shards: dict[str, tuple[int, int, list[str]]] = {}
+        # Parents handed to the mutator, by scheduling key, so children can be compared on common examples;
+        # pruned to archive members and parents of children still awaiting evaluation
+        self._parent_candidates: dict[str, Candidate] = {}
         self.metrics_callback = metrics_callback
         self.logger: LoggerProtocol = logger or StdOutLogger()
         self.max_rounds: int | None = None
@@ -98,11 +141,14 @@ class Orchestrator:
 
         # Streaming evaluation infrastructure
         self._inflight_tasks: dict[str, asyncio.Task] = {}  # cand_hash -> task
+        self._inflight_candidates: dict[str, Candidate] = {}  # cand_hash -> candidate (for checkpoints)
+        self._pending_save: dict[str, Any] | None = None  # Latest checkpoint waiting for the writer
         self._result_queue: asyncio.Queue[tuple[Candidate, EvalResult | Exception, int]] = asyncio.Queue()
         self._total_inflight: int = 0  # Total evaluations in flight across all shards
         total_cap = self.config.max_total_inflight or self.config.eval_concurrency
         self._max_total_inflight: int = max(1, total_cap)
         self._examples_inflight: int = 0
+        self._examples_starting: int = 0  # Examples of launches not yet handed to the evaluator
         self._launch_start_times: dict[str, float] = {}
         self._latency_ema: float = 0.0
         self._latency_samples: int = 0
@@ -122,21 +168,58 @@ class Orchestrator:
         self._mutations_requested: int = 0
         self._mutations_generated: int = 0
         self._mutations_enqueued: int = 0
-        self._parent_children: defaultdict[str, set[str]] = defaultdict(set)
-        self._children_seen: set[str] = set()
-        self._promoted_children: set[str] = set()
+        # Tracked containers let checkpoints rebuild only the entries changed since the last save
+        self._parent_children: TrackedDict = TrackedDict(default_factory=set)
+        self._children_seen: set[str] = TrackedSet()
+        self._promoted_children: set[str] = TrackedSet()
         # Track generation depth for each candidate (fingerprint -> generation number)
-        self._candidate_generations: dict[str, int] = {}
-        self._lineage_history: defaultdict[str, deque] = defaultdict(lambda: deque(maxlen=8))
-        self._sched_to_fingerprint: dict[str, str] = {}
+        self._candidate_generations: dict[str, int] = TrackedDict()
+        self._lineage_history: TrackedDict = TrackedDict(default_factory=_new_lineage_history)
+        self._sched_to_fingerprint: dict[str, str] = TrackedDict()
         self._promotion_pending: set[str] = set()
         self._last_mutation_attempt: float = 0.0
+        self._mutations_before_task: int = 0
+        self._mutation_yielded: bool = False  # Last mutation task enqueued something
+        self._mutation_attempt_evals: int = 0  # evaluations_run when the last mutation task started
+        # Set whenever the main loop has something to react to (result, new mutations,
+        # freed capacity, mutation task finished); the loop blocks on it when idle
+        self._wakeup = asyncio.Event()
 
         # Metrics tracking
         self.metrics = Metrics()
         # Pass metrics to evaluator for cache tracking
         self.evaluator.metrics = self.metrics
 
+        # Example-level scheduling: one prioritised pool of slots shared by every launch,
+        # or the legacy per-candidate slice of the concurrency budget
+        if config.example_scheduling not in ("global", "per_candidate"):
+            raise ValueError(
+                f"Unknown example scheduling: '{config.example_scheduling}'. Choose from: global, per_candidate"
+            )
+        self._example_queue: ExampleQueue | None = None
+        self._owns_example_queue = False
+        if config.example_scheduling == "global" and isinstance(self.evaluator, AsyncEvaluator):
+            self._example_queue = getattr(self.evaluator, "example_queue", None)
+            if self._example_queue is None:
+                # Sized by _recompute_capacities. A queue supplied with the evaluator may be shared, so its
+                # capacity is left alone unless adaptive concurrency owns the limit
+                self._example_queue = ExampleQueue(config.eval_concurrency)
+                self._owns_example_queue = True
+                self.evaluator.example_queue = self._example_queue
+            # An idle slot means the backlog ran dry: let the main loop launch more work
+            self._example_queue.idle_listeners.append(self._wakeup.set)
+
+        # Adaptive concurrency: an AIMD controller fed by every finished task call owns the example-level limit
+        self._concurrency: AIMDController | None = None
+        if config.adaptive_concurrency and isinstance(self.evaluator, AsyncEvaluator):
+            self._concurrency = AIMDController(
+                config.eval_concurrency,
+                minimum=config.adaptive_concurrency_min,
+                maximum=config.adaptive_concurrency_max,
+            )
+            self.evaluator.call_observer = self._observe_call
+            self.metrics.concurrency_limit = self._concurrency.limit
+
         # Scheduler state derived from capacities
         self._recompute_capacities()
 
@@ -154,18 +237,16 @@ class Orchestrator:
             data = data[:target]
         return data
 
-    def _rebalance_shard_queue(self, target: int) -> None:
-        while len(self._per_shard_queue) < target:
-            self._per_shard_queue.append(deque())
-        while len(self._per_shard_queue) > target:
-            extra = self._per_shard_queue.pop()
-            if extra and self._per_shard_queue:
-                self._per_shard_queue[-1].extend(extra)
-
     def _recompute_capacities(self) -> None:
         num_shards = max(1, len(self._runtime_shards))
-        self._rebalance_shard_queue(num_shards)
-        self._effective_concurrency = max(1, min(self._max_total_inflight, self.config.eval_concurrency))
+        self.queue.resize(num_shards)
+        if self._concurrency is not None:
+            self._effective_concurrency = self._concurrency.limit
+        else:
+            self._effective_concurrency = max(1, min(self._max_total_inflight, self.config.eval_concurrency))
+        if self._example_queue is not None and (self._owns_example_queue or self._concurrency is not None):
+            # The AIMD limit only takes effect if the slots that actually run examples follow it
+            self._example_queue.resize(self._effective_concurrency)
         base = max(1, self._effective_concurrency // num_shards)
         remainder = max(0, self._effective_concurrency - base * num_shards)
         self._shard_capacity = [base + (1 if i < remainder else 0) for i in range(num_shards)]
@@ -199,23 +280,21 @@ class Orchestrator:
         for candidate in candidates:
             if not candidate.text.strip():
                 continue
-            fingerprint = candidate.fingerprint
-            if fingerprint in self._pending_fingerprints or fingerprint in self._inflight_fingerprints:
-                continue
-            if len(self.queue) == self.queue.maxlen and self.queue:
-                evicted = self.queue.popleft()
-                self._pending_fingerprints.discard(evicted.fingerprint)
-                for dq in self._per_shard_queue:
-                    try:
-                        dq.remove(evicted)
-                        break
-                    except ValueError:
-                        continue
-            idx = self.scheduler.current_shard_index(candidate)
-            shard_idx = min(idx, len(self._per_shard_queue) - 1)
-            self._per_shard_queue[shard_idx].append(candidate)
-            self.queue.append(candidate)
-            self._pending_fingerprints.add(fingerprint)
+            self.queue.push(
+                candidate, self.scheduler.current_shard_index(candidate), priority=self._queue_priority(candidate)
+            )
+
+    def _queue_priority(self, candidate: Candidate) -> float:
+        """
+        Launch order within a rung of the ready queue (lower first).
+
+        Candidates with the best score estimate (see :meth:`_score_estimate`)
+        launch first, so a promoted candidate that did well on the previous rung,
+        or a child of a strong parent, is confirmed before weaker ones; candidates
+        with nothing to go on yet tie at 0 and launch in arrival order.
+        """
+        estimate = self._score_estimate(candidate)
+        return -estimate if estimate is not None else 0.0
 
     def _get_rung_key(self, candidate: Candidate) -> str:
         """Get rung key string for a candidate based on its current shard.
@@ -240,15 +319,31 @@ class Orchestrator:
                 alpha = 0.2
                 self._latency_ema = (1 - alpha) * self._latency_ema + alpha * duration
             self._latency_samples += 1
-        timed_out = False
-        for trace in result.traces:
-            if isinstance(trace, dict) and trace.get("error") == "timeout":
-                timed_out = True
-                break
+        timed_out = "timeout" in result.example_errors().values()
         self._eval_samples += 1
         if timed_out:
             self._timeout_count += 1
 
+    def _example_load(self) -> str:
+        """Example slots in use for progress lines: the shared queue's when present, else the reservations."""
+        if self._example_queue is not None:
+            queue = self._example_queue
+            return f"{queue.busy}/{queue.capacity} (+{queue.waiting} waiting)"
+        return f"{self._examples_inflight}/{self._effective_concurrency}"
+
+    def _observe_call(self, latency: float, outcome: str) -> None:
+        """Feed one finished task call to the concurrency controller and apply a changed limit live."""
+        in_use = self._example_queue.busy if self._example_queue is not None else self._examples_inflight
+        previous = self._concurrency.limit
+        if not self._concurrency.observe(latency, outcome, in_use=in_use):
+            return
+        limit = self._concurrency.limit
+        self.metrics.record_concurrency_limit(limit, increased=limit > previous)
+        if self.show_progress and limit < previous:
+            self.logger.log(f"🚦 Concurrency {previous} → {limit} after {outcome.replace('_', ' ')}")
+        self._recompute_capacities()
+        self._wakeup.set()
+
     def _current_timeout_ratio(self) -> float:
         return self._timeout_count / max(1, self._eval_samples)
 
@@ -345,7 +440,7 @@ class Orchestrator:
         adjusted = False
         if self._latency_ema > high_latency or timeout_ratio > timeout_high:
             new_inflight = max(1, self._max_total_inflight - 1)
-            if new_inflight != self._max_total_inflight:
+            if self._concurrency is None and new_inflight != self._max_total_inflight:
                 self._max_total_inflight = new_inflight
                 self._recompute_capacities()
             if self.config.max_mutations_per_round:
@@ -355,7 +450,7 @@ class Orchestrator:
             adjusted = True
         elif self._latency_ema < low_latency and timeout_ratio < timeout_low:
             new_inflight = min(self._max_total_inflight + 1, self.config.eval_concurrency)
-            if new_inflight != self._max_total_inflight:
+            if self._concurrency is None and new_inflight != self._max_total_inflight:
                 self._max_total_inflight = new_inflight
                 self._recompute_capacities()
             if self.config.max_mutations_per_round:
@@ -363,7 +458,7 @@ class Orchestrator:
                     self.config.max_mutations_per_round + 1, self._max_mutations_ceiling
                 )
             adjusted = True
-        backlog0 = len(self._per_shard_queue[0]) if self._per_shard_queue else 0
+        backlog0 = self.queue.rung_len(0)
         launches0 = self._rung_launches[0] if self._rung_launches else 0
         promotions0 = self._rung_promotions[0] if self._rung_promotions else 0
         promo_rate0 = promotions0 / max(1, launches0)
@@ -403,9 +498,16 @@ class Orchestrator:
         self.max_evaluations = max_evaluations
 
         # Attempt to resume from saved state
+        self._run_signature = self._compute_run_signature(seeds)
         resumed = False
         if resume and self.cache.has_state():
             state = self.cache.load_state()
+            saved_signature = ((state or {}).get("checkpoint") or {}).get("signature")
+            if state and saved_signature not in (None, self._run_signature):
+                # Checkpoint belongs to a different run (other seeds, dataset or shards)
+                if self.show_progress:
+                    self.logger.log("⚠️  Saved state was written by a different run; starting fresh")
+                state = None
             if state:
                 await self._restore_state(state)
                 resumed = True
@@ -468,6 +570,8 @@ class Orchestrator:
                 break
             if max_evaluations is not None and self.evaluations_run >= max_evaluations:
                 break
+            # Cleared before looking at any state, so events raised from here on are not lost
+            self._wakeup.clear()
 
             # 1) Move freshly generated mutations into the ready queue
             while self._mutation_buffer:
@@ -476,7 +580,7 @@ class Orchestrator:
             # DEBUG: Log critical state before launch attempt
             if loop_iter % 10 == 0 and len(self.queue) > 0 and self._total_inflight == 0:
                 _debug_log(f"🔍 MAIN LOOP: queue={len(self.queue)}, inflight={self._total_inflight}, buffer={len(self._mutation_buffer)}")
-                _debug_log(f"   Per-shard queues: {[len(q) for q in self._per_shard_queue]}")
+                _debug_log(f"   Per-shard queues: {self.queue.rung_sizes()}")
 
             # DEBUG: Log before potentially blocking await
             if loop_iter % 20 == 0:
@@ -502,7 +606,7 @@ class Orchestrator:
             if now - last_heartbeat >= 30.0:
                 _debug_log(
                     f"💓 HEARTBEAT: Inflight={self._total_inflight}, "
-                    f"Queue={len(self.queue)}, ExInflight={self._examples_inflight}, "
+                    f"Queue={len(self.queue)}, ExInflight={self._example_load()}, "
                     f"Evals={self.evaluations_run}, LoopIter={loop_iter}"
                 )
                 last_heartbeat = now
@@ -526,7 +630,7 @@ class Orchestrator:
                     best_q = self._get_best_quality_from_full_shard() if pareto else 0.0
                     self.logger.log(
                         f"🔄 Evaluations: {self.evaluations_run} | Inflight: {self._total_inflight} | "
-                        f"ExInflight: {self._examples_inflight}/{self._effective_concurrency} | "
+                        f"ExInflight: {self._example_load()} | "
                         f"Queue: {len(self.queue)} | Best: {best_q:.1%}"
                     )
                     last_progress_display = self.evaluations_run
@@ -552,7 +656,7 @@ class Orchestrator:
 
             # Mutation task management with spam prevention
             # Only spawn if: (1) no task exists OR (2) existing task is running
-            # Never spawn right after a task completes - wait for cooldown
+            # After a task that produced nothing, wait out a cooldown before retrying
             if should_spawn_mutations:
                 import time as _time_mut
                 now = _time_mut.time()
@@ -562,16 +666,19 @@ class Orchestrator:
                     _debug_log("🔄 Mutation task completed, clearing it")
                     self._mutation_task = None
                     self._last_mutation_attempt = now  # Record completion time to enforce cooldown
+                    self._mutation_yielded = self._mutations_enqueued > self._mutations_before_task
 
-                # Only spawn if no task AND cooldown has passed
-                elif self._mutation_task is None and (now - self._last_mutation_attempt > 1.0):
+                if self._mutation_task is None and self._mutation_cooldown_remaining(now) <= 0:
                     self._last_mutation_attempt = now
+                    self._mutations_before_task = self._mutations_enqueued
+                    self._mutation_attempt_evals = self.evaluations_run
                     _debug_log(
                         f"🧬 Starting mutation generation task (queue+buffer={len(self.queue) + len(self._mutation_buffer)} < {self.config.mutation_buffer_min})"
                     )
                     self._mutation_task = asyncio.create_task(
-                        self._spawn_mutations(callback=self._mutation_buffer.append)
+                        self._spawn_mutations(callback=self._buffer_mutation)
                     )
+                    self._mutation_task.add_done_callback(lambda _task: self._wakeup.set())
 
             # 5) Window completion => keep round-indexed metrics in sync
             if (
@@ -595,9 +702,9 @@ class Orchestrator:
                         task_state = "running"
                     self.logger.log(
                         f"🧭 Debug: queue=0 buffer=0 inflight={self._total_inflight} "
-                        f"examples_inflight={self._examples_inflight}/{self._effective_concurrency} "
-                        f"mutation_task={task_state} pending_fp={len(self._pending_fingerprints)} "
-                        f"inflight_fp={len(self._inflight_fingerprints)}"
+                        f"examples_inflight={self._example_load()} "
+                        f"mutation_task={task_state} pending_fp={len(self.queue)} "
+                        f"inflight_fp={self.queue.inflight_count}"
                     )
                     self._last_debug_log = now
 
@@ -627,6 +734,9 @@ class Orchestrator:
                     pass
 
                 self._shard_cache.clear()
+                self._prune_window_orders(window_id)
+                if self._example_queue is not None:
+                    self.metrics.record_example_queue(self._example_queue.stats())
 
                 if self.config.migration_period and window_id % self.config.migration_period == 0:
                     await self._maybe_migrate()
@@ -656,8 +766,12 @@ class Orchestrator:
                 and not self._mutation_buffer
             ):
                 if self._mutation_task is None:
-                    _debug_log("🛑 IDLE DETECTION: All work complete, exiting loop")
-                    break
+                    if should_spawn_mutations and self._mutation_retry_ready():
+                        # Last batch was productive, or results arrived since it ran: retry after the cooldown
+                        pass
+                    else:
+                        _debug_log("🛑 IDLE DETECTION: All work complete, exiting loop")
+                        break
                 elif self._mutation_task.done():
                     _debug_log("🛑 IDLE DETECTION: Mutation task done, exiting loop")
                     self._mutation_task = None
@@ -667,12 +781,13 @@ class Orchestrator:
                     if loop_iter % 100 == 0:
                         _debug_log(f"⏳ IDLE: Waiting for mutation task to complete (loop_iter={loop_iter})")
 
-            # Avoid busy spinning when concurrency is saturated or nothing progressed
-            if launched == 0:
-                if self._examples_inflight >= self._effective_concurrency:
-                    await asyncio.sleep(0.005)
-                elif drained == 0:
-                    await asyncio.sleep(0.01)
+            # Nothing progressed: block until a result, new mutations, freed capacity,
+            # a finished mutation task or the end of the mutation cooldown
+            if launched == 0 and drained == 0:
+                timeout = None
+                if should_spawn_mutations and self._mutation_task is None:
+                    timeout = self._mutation_cooldown_remaining(time.time())
+                await self._wait_for_wakeup(timeout)
 
         # === Cleanup ===
         # Wait for all inflight evaluations to complete
@@ -693,6 +808,7 @@ class Orchestrator:
         await self.finalize()
 
         # Print and save comprehensive metrics summary
+        self.metrics.record_cache_memory(self.cache.memory_stats())
         metrics_summary = self.metrics.format_summary()
         if self.show_progress:
             self.logger.log("\n" + metrics_summary)
@@ -738,7 +854,7 @@ class Orchestrator:
     async def _stream_launch_ready(self, window_id: int, max_evaluations: int | None) -> int:
         """Launch ready candidates using deficit-based scheduling for fair rung allocation."""
         launched = 0
-        shard_count = len(self._per_shard_queue)
+        shard_count = self.queue.n_rungs
         if shard_count == 0:
             return launched
 
@@ -749,11 +865,11 @@ class Orchestrator:
         # Debug: Log queue state on first attempt
         if attempts == 0 and len(self.queue) > 0 and self._total_inflight == 0:
             self.logger.log(f"🔍 DEBUG _stream_launch_ready: queue={len(self.queue)} total_inflight={self._total_inflight}")
-            for i, q in enumerate(self._per_shard_queue):
-                if q:
-                    self.logger.log(f"   Per-shard queue[{i}]: {len(q)} candidates")
-                    if q:
-                        cand = q[0]
+            for i, size in enumerate(self.queue.rung_sizes()):
+                if size:
+                    self.logger.log(f"   Per-shard queue[{i}]: {size} candidates")
+                    cand = self.queue.peek(i)
+                    if cand is not None:
                         sched_rung = self.scheduler.current_shard_index(cand)
                         self.logger.log(f"      First candidate rung: {sched_rung}, fp: {cand.fingerprint[:12]}...")
 
@@ -763,9 +879,8 @@ class Orchestrator:
             # Accumulate deficit for all rungs (every tick)
             # Clamp deficit for empty queues to prevent infinite credit buildup
             for shard_idx, key in enumerate(self._rung_keys):
-                if shard_idx < len(self._per_shard_queue):
-                    queue = self._per_shard_queue[shard_idx]
-                    if queue:
+                if shard_idx < shard_count:
+                    if self.queue.rung_len(shard_idx):
                         # Queue has work: accumulate deficit normally
                         self._rung_deficit[key] += self._rung_shares[key]
                     else:
@@ -784,10 +899,9 @@ class Orchestrator:
             debug_info = []
 
             for shard_idx in range(shard_count):
-                queue = self._per_shard_queue[shard_idx]
-                queue_len = len(queue) if queue else 0
+                queue_len = self.queue.rung_len(shard_idx)
 
-                if not queue:
+                if not queue_len:
                     debug_info.append(f"shard[{shard_idx}]: empty")
                     continue
 
@@ -836,20 +950,13 @@ class Orchestrator:
                 break
 
             # Try to launch from best rung
-            queue = self._per_shard_queue[best_shard_idx]
-            candidate = queue[0]
+            candidate = self.queue.peek(best_shard_idx)
 
             if self._stream_can_launch(candidate, max_evaluations):
-                # Remove from queue
-                queue.popleft()
-                try:
-                    self.queue.remove(candidate)
-                except ValueError:
-                    pass
-
-                fingerprint = candidate.fingerprint
-                self._pending_fingerprints.discard(fingerprint)
-                self._inflight_fingerprints.add(fingerprint)
+                # Move from the ready queue to in flight
+                self.queue.pop(best_shard_idx)
+                key = scheduling_key(candidate)
+                self.queue.mark_inflight(key)
 
                 # Launch the evaluation
                 launched_successfully = await self._stream_launch(candidate, window_id)
@@ -860,12 +967,9 @@ class Orchestrator:
                     launched += 1
                     continue
                 else:
-                    # Launch failed, put candidate back
-                    self._inflight_fingerprints.discard(fingerprint)
-                    self._pending_fingerprints.add(fingerprint)
-                    queue.appendleft(candidate)
-                    if candidate not in self.queue:
-                        self.queue.append(candidate)
+                    # Launch failed, put candidate back at the head of its rung
+                    self.queue.release(key)
+                    self.queue.push(candidate, best_shard_idx, priority=self._queue_priority(candidate), front=True)
                     break
             else:
                 # Can't launch this candidate (capacity or eval limit reached)
@@ -890,27 +994,58 @@ class Orchestrator:
             return False
 
         shard_fraction = self._runtime_shards[min(shard_idx, len(self._runtime_shards) - 1)]
-        shard_key = (window_id, shard_fraction)
-        shard_ids = self._shard_cache.get(shard_key)
-        if shard_ids is None:
-            shard_size = self._shard_size(shard_fraction)
-            shard_ids = self.sampler.sample_shard(window_id, shard_size)
-            self._shard_cache[shard_key] = shard_ids
-
-        # Compute fair per-candidate evaluator concurrency so total example-level
-        # work stays near the global target without oversubscription.
-        # We simulate the candidate as inflight by adding 1 to _total_inflight for the calculation.
-        active_candidates = max(1, self._total_inflight + 1)
-        per_cand_concurrency = max(1, int(self._effective_concurrency // active_candidates))
-        # Never exceed the shard size for this candidate
-        per_cand_concurrency = min(per_cand_concurrency, len(shard_ids))
-        # Respect hard global example-level cap; if not enough budget, don't launch yet
-        if self._examples_inflight + per_cand_concurrency > self._effective_concurrency:
-            return False
-
-        # Track peak example-level concurrency for metrics
-        peak_examples = self._examples_inflight + per_cand_concurrency
-        self.metrics.update_concurrent_evals(peak_examples)
+        sched_key_at_launch = scheduling_key(candidate)
+        previous_shard = self._candidate_shards.get(sched_key_at_launch)
+        if self.config.nested_shards:
+            # Stay on the permutation of the candidate's first launch so its earlier shard is a prefix
+            shard_window = previous_shard[0] if previous_shard is not None else window_id
+            shard_ids = self._nested_shard(shard_window, shard_fraction)
+        else:
+            shard_window = window_id
+            shard_key = (window_id, shard_fraction)
+            shard_ids = self._shard_cache.get(shard_key)
+            if shard_ids is None:
+                shard_size = self._shard_size(shard_fraction)
+                shard_ids = self.sampler.sample_shard(window_id, shard_size)
+                self._shard_cache[shard_key] = shard_ids
+
+        eval_options: dict[str, Any] = {}
+        if self._example_queue is not None:
+            # Examples wait for slots in the shared queue rather than reserving them, so the only
+            # budget is the backlog: launch while less than a pool's worth of examples is waiting.
+            if self._example_queue.waiting + self._examples_starting >= self._example_queue.capacity:
+                return False
+            per_cand_concurrency = len(shard_ids)
+            reserved_examples = 0
+            starting_examples = len(shard_ids)
+            eval_options["priority"] = self._example_priority(candidate, shard_idx)
+        else:
+            # Compute fair per-candidate evaluator concurrency so total example-level
+            # work stays near the global target without oversubscription.
+            # We simulate the candidate as inflight by adding 1 to _total_inflight for the calculation.
+            active_candidates = max(1, self._total_inflight + 1)
+            per_cand_concurrency = max(1, int(self._effective_concurrency // active_candidates))
+            # Never exceed the shard size for this candidate
+            per_cand_concurrency = min(per_cand_concurrency, len(shard_ids))
+            # Respect hard global example-level cap; if not enough budget, don't launch yet
+            if self._examples_inflight + per_cand_concurrency > self._effective_concurrency:
+                return False
+
+            # Track peak example-level concurrency for metrics
+            peak_examples = self._examples_inflight + per_cand_concurrency
+            self.metrics.update_concurrent_evals(peak_examples)
+            reserved_examples = per_cand_concurrency
+            starting_examples = 0
+        if self.config.racing:
+            parent_scores = await self._parent_example_scores(candidate, shard_ids)
+            parent_shard_score = (
+                sum(parent_scores.values()) / len(parent_scores)
+                if parent_scores and len(parent_scores) == len(shard_ids)
+                else None
+            )
+            race = self.scheduler.race_bound(candidate, self.config.promote_objective, parent_shard_score)
+            if race is not None:
+                eval_options["race"] = race
 
         time.time()
         cand_hash = candidate_key(candidate)
@@ -921,19 +1056,25 @@ class Orchestrator:
         # The candidate may be promoted during evaluation, changing its shard index.
         # We must use the EXACT shard fraction this launch is evaluating on.
         rung_key_at_launch = str(shard_fraction)  # Use the actual shard fraction for this evaluation
-        fingerprint_at_launch = candidate.fingerprint
         # Initialize key if not present (can happen if shards were updated mid-flight)
         if rung_key_at_launch not in self._inflight_by_rung:
             self._inflight_by_rung[rung_key_at_launch] = 0
         self._inflight_by_rung[rung_key_at_launch] += 1
-        # Reserve budget for this candidate
-        self._examples_inflight += per_cand_concurrency
+        # Reserve budget for this candidate (or count its examples as on their way to the example queue)
+        self._examples_inflight += reserved_examples
+        self._examples_starting += starting_examples
         self._launch_start_times[cand_hash] = time.time()
         if 0 <= shard_idx < len(self._rung_launches):
             self._rung_launches[shard_idx] += 1
+        if previous_shard is not None and shard_idx > previous_shard[1]:
+            seen = set(previous_shard[2])
+            self.metrics.record_promotion_reuse(sum(1 for ex_id in shard_ids if ex_id in seen))
+        self._candidate_shards[sched_key_at_launch] = (shard_window, shard_idx, shard_ids)
 
         async def runner() -> None:
             eval_start = time.time()
+            # The evaluator queues this launch's examples as soon as it starts
+            self._examples_starting -= starting_examples
             try:
                 if self.show_progress:
                     generation = self._get_generation(candidate)
@@ -948,6 +1089,7 @@ class Orchestrator:
                     concurrency=per_cand_concurrency,
                     shard_fraction=shard_fraction,
                     show_progress=self.show_progress,  # Show progress for all evaluations
+                    **eval_options,
                 )
                 eval_duration = time.time() - eval_start
                 self.metrics.record_evaluation(shard_fraction, eval_duration)
@@ -978,17 +1120,49 @@ class Orchestrator:
                 if rung_key_at_launch in self._inflight_by_rung:
                     self._inflight_by_rung[rung_key_at_launch] -= 1
                 # Release global example-level budget
-                self._examples_inflight = max(0, self._examples_inflight - per_cand_concurrency)
-                # Clear inflight fingerprint using the captured value from launch time
+                self._examples_inflight = max(0, self._examples_inflight - reserved_examples)
+                # Release the scheduling key captured at launch time
                 # This prevents the candidate from being launched again until this evaluation completes
-                self._inflight_fingerprints.discard(fingerprint_at_launch)
+                self.queue.release(sched_key_at_launch)
+                # Result queued and capacity released: let the main loop react
+                self._wakeup.set()
 
         task = asyncio.create_task(runner())
         self._inflight_tasks[cand_hash] = task
-        task.add_done_callback(lambda _: self._inflight_tasks.pop(cand_hash, None))
+        self._inflight_candidates[cand_hash] = candidate
+
+        def _clear_inflight(_: asyncio.Task) -> None:
+            self._inflight_tasks.pop(cand_hash, None)
+            self._inflight_candidates.pop(cand_hash, None)
+
+        task.add_done_callback(_clear_inflight)
         return True
 
-    async def _stream_drain_results(self, timeout: float = 0.1) -> int:
+    def _buffer_mutation(self, candidate: Candidate) -> None:
+        self._mutation_buffer.append(candidate)
+        self._wakeup.set()
+
+    def _mutation_retry_ready(self) -> bool:
+        """Whether another mutation task could produce something the last one did not."""
+        # Results ingested after an unproductive task started may have made new parents eligible
+        return self._mutation_yielded or self.evaluations_run > self._mutation_attempt_evals
+
+    def _mutation_cooldown_remaining(self, now: float) -> float:
+        """Seconds until another mutation task may start (only unproductive tasks back off)."""
+        if self._mutation_yielded:
+            return 0.0
+        return max(0.0, self._last_mutation_attempt + _MUTATION_COOLDOWN_SECONDS - now)
+
+    async def _wait_for_wakeup(self, timeout: float | None = None) -> None:
+        """Block the main loop until one of the events it reacts to fires."""
+        if timeout is None:
+            timeout = _WAKEUP_FALLBACK_SECONDS
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, timeout))
+        except asyncio.TimeoutError:
+            pass
+
+    async def _stream_drain_results(self, timeout: float = 0.0) -> int:
         import asyncio as _asyncio
         import time as _time
 
@@ -1061,10 +1235,21 @@ class Orchestrator:
         else:
             self._promotion_pending.discard(candidate_with_meta.fingerprint)
         self.latest_results[cand_hash] = result
+        self.score_matrix.record(
+            sched_key if isinstance(sched_key, str) else candidate_with_meta.fingerprint,
+            result,
+            self.config.promote_objective,
+        )
         self.evaluations_run += 1
 
         prev_idx = min(self.scheduler.current_shard_index(candidate_with_meta), len(self._runtime_shards) - 1)
-        decision = self.scheduler.record(candidate_with_meta, result, self.config.promote_objective)
+        parent_scores = await self._parent_example_scores(candidate_with_meta, result.example_ids or ())
+        paired = self.scheduler.paired_delta(result, parent_scores, self.config.promote_objective)
+        if paired is not None:
+            self.metrics.record_paired_comparison(paired[1])
+        decision = self.scheduler.record(
+            candidate_with_meta, result, self.config.promote_objective, parent_example_scores=parent_scores
+        )
 
         # Track scheduler decisions in metrics
         if decision == "promoted":
@@ -1073,6 +1258,8 @@ class Orchestrator:
             self.metrics.record_pruning()
         elif decision == "completed":
             self.metrics.record_completion()
+        if decision in ("pruned", "completed"):
+            self._candidate_shards.pop(scheduling_key(candidate), None)
 
         if decision in ("promoted", "completed") and 0 <= prev_idx < len(self._rung_promotions):
             self._rung_promotions[prev_idx] += 1
@@ -1117,7 +1304,7 @@ class Orchestrator:
                     f"   ⬆️  {source} promoted to shard {rung} ({shard_frac:.0%}) [fp={p.fingerprint[:12]}...]"
                 )
             self.enqueue(promotions)
-            self.logger.log(f"   📋 Queue after promotion: total={len(self.queue)}, per-shard={[len(q) for q in self._per_shard_queue]}")
+            self.logger.log(f"   📋 Queue after promotion: total={len(self.queue)}, per-shard={self.queue.rung_sizes()}")
 
         if decision == "promoted":
             if isinstance(sched_key, str):
@@ -1128,8 +1315,8 @@ class Orchestrator:
         if generation_method and hasattr(self.mutator, "report_outcome"):
             self.mutator.report_outcome(generation_method, delta_quality)
 
-        # NOTE: Do NOT clear _inflight_fingerprints here! The finally block in _stream_launch
-        # is responsible for clearing it after all bookkeeping is complete. Clearing it here
+        # NOTE: Do NOT release in-flight keys here! The finally block in _stream_launch
+        # is responsible for releasing it after all bookkeeping is complete. Releasing it here
         # would allow the same candidate to be launched twice before the finally block runs.
 
         return candidate_with_meta, decision
@@ -1172,7 +1359,7 @@ class Orchestrator:
             if isinstance(sched_key, str):
                 self._promotion_pending.discard(sched_key)
             self._promotion_pending.discard(candidate.fingerprint)
-            # NOTE: Do NOT clear _inflight_fingerprints here - the finally block handles it
+            # NOTE: Do NOT release in-flight keys here - the finally block handles it
             return
 
         result: EvalResult = payload
@@ -1206,7 +1393,10 @@ class Orchestrator:
     async def _seed_archive(self, seeds: Sequence[Candidate]) -> None:
         shard_fraction = self._runtime_shards[0]
         shard_size = self._shard_size(shard_fraction)
-        shard = self.sampler.sample_shard(self.round_index, shard_size)
+        if self.config.nested_shards:
+            shard = self._nested_shard(self.round_index, shard_fraction)
+        else:
+            shard = self.sampler.sample_shard(self.round_index, shard_size)
 
         if self.show_progress:
             self.logger.log(
@@ -1214,26 +1404,41 @@ class Orchestrator:
             )
             self.logger.log("   This establishes the baseline for optimization.")
 
-        seeds_count = max(1, len(seeds))
-        per_seed_budget = self._effective_concurrency // seeds_count if self._effective_concurrency >= seeds_count else 1
-        seed_concurrency = max(1, min(len(shard), per_seed_budget or 1))
-
         results: list[EvalResult] = []
-        for seed in seeds:
-            result = await self._evaluate_candidate(
-                seed,
-                shard,
-                shard_fraction,
-                show_progress=self.show_progress,
-                concurrency_override=seed_concurrency,
+        if self._example_queue is not None:
+            # Seeds share the example queue's slots, so evaluate them side by side (as many
+            # at a time as the streaming loop would keep in flight)
+            seed_slots = asyncio.Semaphore(self._max_total_inflight)
+
+            async def evaluate_seed(seed: Candidate) -> EvalResult:
+                async with seed_slots:
+                    return await self._evaluate_candidate(
+                        seed, shard, shard_fraction, show_progress=self.show_progress, concurrency_override=len(shard)
+                    )
+
+            results = list(await asyncio.gather(*(evaluate_seed(seed) for seed in seeds)))
+        else:
+            seeds_count = max(1, len(seeds))
+            per_seed_budget = (
+                self._effective_concurrency // seeds_count if self._effective_concurrency >= seeds_count else 1
             )
-            results.append(result)
+            seed_concurrency = max(1, min(len(shard), per_seed_budget or 1))
+            for seed in seeds:
+                result = await self._evaluate_candidate(
+                    seed,
+                    shard,
+                    shard_fraction,
+                    show_progress=self.show_progress,
+                    concurrency_override=seed_concurrency,
+                )
+                results.append(result)
 
         if self.show_progress:
             self.logger.log("   ✓ Seed evaluation complete!")
 
         enriched: list[Candidate] = []
         for seed, result in zip(seeds, results, strict=False):
+            self._candidate_shards[scheduling_key(seed)] = (self.round_index, 0, shard)
             quality = result.objectives.get(self.config.promote_objective, 0.0)
             if self.show_progress:
                 self.logger.log(
@@ -1267,14 +1472,14 @@ class Orchestrator:
         if self.show_progress:
             self.logger.log(
                 f"   🎯 Seeds ready for next evaluation: queue={len(self.queue)}, "
-                f"per_shard={[len(q) for q in self._per_shard_queue]}"
+                f"per_shard={self.queue.rung_sizes()}"
             )
 
     def _select_batch(self) -> list[Candidate]:
         batch: list[Candidate] = []
         seen: set[str] = set()
         while self.queue and len(batch) < self.config.batch_size:
-            candidate = self.queue.popleft()
+            candidate = self.queue.pop()
             if candidate.fingerprint in seen:
                 continue
             batch.append(candidate)
@@ -1469,8 +1674,12 @@ class Orchestrator:
                 # This shows reflection LLM both what works and what needs fixing
                 all_traces = list(cached_result.traces)
 
-                # Prioritize failures (more informative), but include some successes too
+                # Prioritize failures (more informative), but include some successes too.
+                # Failures other candidates already solve come first: they show what is fixable.
                 failure_traces = [t for t in all_traces if t.get("quality", 0.0) < 1.0]
+                if len(failure_traces) > 4:
+                    solved = self.score_matrix.example_means()
+                    failure_traces.sort(key=lambda t: -solved.get(t.get("example_id"), (0.0, 0))[0])
                 success_traces = [t for t in all_traces if t.get("quality", 0.0) >= 1.0]
 
                 # Take mostly failures (4) + some successes (1) if available
@@ -1517,6 +1726,7 @@ class Orchestrator:
         # IMPORTANT: Use latest_results instead of entry.result to get the most recent
         # (and typically full-dataset) evaluation, not the archived partial-shard result
         parent_contexts: list[dict[str, object]] = []
+        self._prune_released_candidates()
 
         # Determine minimum shard for mutation eligibility
         # Don't mutate from candidates only evaluated on the tiny first shard.
@@ -1551,6 +1761,7 @@ class Orchestrator:
             parent_key = parent_meta.get("_sched_key") if isinstance(parent_meta, dict) else None
             if not isinstance(parent_key, str):
                 parent_key = entry.candidate.fingerprint
+            self._parent_candidates[parent_key] = entry.candidate
 
             # Note: We used to skip parents in _promotion_pending, but this caused issues
             # when all parents are pending promotion (e.g., early in optimization).
@@ -1611,6 +1822,7 @@ class Orchestrator:
 
             if parent_key:
                 self._parent_children[parent_key].add(child_key)
+                self._parent_children.touch(parent_key)
                 parent_gen = self._candidate_generations.get(parent_key, 0)
                 self._candidate_generations[child_key] = parent_gen + 1
             else:
@@ -1634,6 +1846,7 @@ class Orchestrator:
         self._children_seen.add(child_key)
         self._sched_to_fingerprint[child_key] = child_fp
         self._parent_children[parent_key].add(child_key)
+        self._parent_children.touch(parent_key)
         # Track generation if not already tracked
         if child_key not in self._candidate_generations:
             parent_gen = self._candidate_generations.get(parent_key, 0)
@@ -1826,11 +2039,7 @@ class Orchestrator:
 
     def _register_failures(self, result: EvalResult) -> None:
         hard_examples: list[str] = []
-        for trace in result.traces:
-            example_id = trace.get("example_id") if isinstance(trace, dict) else None
-            quality = trace.get("quality") if isinstance(trace, dict) else None
-            if example_id is None or quality is None:
-                continue
+        for example_id, quality in result.example_scores("quality").items():
             if quality < result.objectives.get("quality", quality):
                 hard_examples.append(example_id)
         if hard_examples:
@@ -1860,14 +2069,8 @@ class Orchestrator:
                 self._sched_to_fingerprint[child_sched] = child.fingerprint
 
         failure_summaries: list[dict[str, object]] = []
-        for trace in result.traces:
-            if not isinstance(trace, dict):
-                continue
-            example_id = trace.get("example_id")
-            if example_id is None:
-                continue
-            trace_quality = trace.get("quality")
-            if isinstance(trace_quality, (int, float)) and trace_quality >= child_quality:
+        for example_id, trace_quality in result.example_scores(promote_obj).items():
+            if trace_quality >= child_quality:
                 continue
             failure_summaries.append(
                 {
@@ -1890,6 +2093,105 @@ class Orchestrator:
             "failures": failure_summaries,
         }
         history.appendleft(entry)
+        self._lineage_history.touch(parent_key)
+
+    def _prune_released_candidates(self) -> None:
+        """
+        Forget candidates that left the archive and are no longer awaited.
+
+        A candidate stays while it is queued, buffered, in flight or pending
+        promotion, or is the parent of such a candidate. The others lose their
+        parent entry and their score-matrix row.
+        """
+        live = {scheduling_key(entry.candidate) for entry in self.archive.pareto.values()}
+        live.update(scheduling_key(entry.candidate) for entry in self.archive.qd_grid.values())
+        live.update(self._promotion_pending)
+        waiting = [*self.queue, *self._mutation_buffer, *self._inflight_candidates.values()]
+        for child in waiting:
+            live.add(scheduling_key(child))
+            meta = child.meta if isinstance(child.meta, dict) else {}
+            parent_key = meta.get("parent_sched_key", meta.get("parent"))
+            if isinstance(parent_key, str):
+                live.add(parent_key)
+        self._parent_candidates = {key: parent for key, parent in self._parent_candidates.items() if key in live}
+        for key in self.score_matrix.candidates:
+            if key not in live:
+                self.score_matrix.remove(key)
+
+    async def _parent_example_scores(self, candidate: Candidate, example_ids: Sequence[str]) -> dict[str, float] | None:
+        """
+        The parent's known per-example scores on ``example_ids``, for paired comparisons.
+
+        Scores come from the score matrix, then from the evaluation cache for
+        examples the parent was scored on outside this run; no new calls are
+        made. None when pairing is off or the candidate has no parent.
+        """
+        if self.config.paired_min_examples <= 0 or not isinstance(candidate.meta, dict):
+            return None
+        parent_key = candidate.meta.get("parent_sched_key", candidate.meta.get("parent"))
+        if not isinstance(parent_key, str):
+            return None
+        scores = self.score_matrix.scores(parent_key, example_ids)
+        parent = self._parent_candidates.get(parent_key)
+        if parent is None or len(scores) == len(example_ids):
+            return scores
+        lookup = self.evaluator.cached_result if isinstance(self.evaluator, AsyncEvaluator) else self.cache.get
+        for example_id in example_ids:
+            if example_id in scores:
+                continue
+            cached = await lookup(parent, example_id, objectives_only=True)
+            value = cached.objectives.get(self.config.promote_objective) if cached is not None else None
+            if isinstance(value, (int, float)):
+                scores[example_id] = float(value)
+                self.score_matrix.set(parent_key, example_id, float(value))
+        return scores
+
+    def _example_priority(self, candidate: Candidate, shard_idx: int) -> tuple[float, float]:
+        """
+        Order of this launch's examples in the shared example queue (lower first).
+
+        Higher rungs go first: those candidates are closest to a final decision,
+        and the deficit scheduler already rations how many of them launch. Within
+        a rung, candidates whose score is hardest to predict go first, measured
+        by the variance ``q * (1 - q)`` of a per-example score with mean ``q``,
+        where ``q`` is the candidate's :meth:`_score_estimate`.
+        """
+        estimate = self._score_estimate(candidate)
+        if estimate is not None:
+            q = min(1.0, max(0.0, estimate))
+            uncertainty = 4.0 * q * (1.0 - q)
+        else:
+            uncertainty = 1.0  # Nothing known yet: as uncertain as it gets
+        return (-float(shard_idx), -uncertainty)
+
+    def _score_estimate(self, candidate: Candidate) -> float | None:
+        """Best guess at ``candidate``'s promote-objective score: its previous-rung score, else its parent's."""
+        meta = candidate.meta if isinstance(candidate.meta, dict) else {}
+        estimate = meta.get("quality")  # Promote-objective score on the previous rung
+        if not isinstance(estimate, (int, float)):
+            estimate = meta.get("parent_score")
+        if not isinstance(estimate, (int, float)):
+            parent_objectives = meta.get("parent_objectives")
+            if isinstance(parent_objectives, dict):
+                estimate = parent_objectives.get(self.config.promote_objective)
+        return float(estimate) if isinstance(estimate, (int, float)) else None
+
+    def _nested_shard(self, window_id: int, shard_fraction: float) -> list[str]:
+        """Prefix of ``window_id``'s example permutation sized for ``shard_fraction``."""
+        order = self._window_orders.get(window_id)
+        if order is None:
+            order = self.sampler.sample_permutation(window_id)
+            self._window_orders[window_id] = order
+        return order[: self._shard_size(shard_fraction)]
+
+    def _prune_window_orders(self, window_id: int) -> None:
+        """Drop permutations of past windows that no candidate still has to climb."""
+        if not self._window_orders:
+            return
+        live = {window for window, _, _ in self._candidate_shards.values()}
+        live.add(window_id)
+        for window in [window for window in self._window_orders if window not in live]:
+            del self._window_orders[window]
 
     def _shard_size(self, shard_fraction: float) -> int:
         total = max(len(self.sampler.example_ids), 1)
@@ -1968,6 +2270,11 @@ class Orchestrator:
 
     async def finalize(self, delta: float | None = None) -> None:
         """Finalize the run before returning results."""
+        if self._example_queue is not None:
+            self.metrics.record_example_queue(self._example_queue.stats())
+        # Persist any write-behind cache records before the run is considered done
+        if getattr(self.evaluator, "write_behind_records", 0):
+            await self.evaluator.close()
         if hasattr(self, "_save_task") and not self._save_task.done():
             try:
                 await self._save_task
@@ -1978,54 +2285,236 @@ class Orchestrator:
 
     async def _save_state(self) -> None:
         """Save current orchestrator state to cache for resumability (non-blocking)."""
-        # Cancel any previous save that's still running to avoid queue buildup
-        if hasattr(self, "_save_task") and not self._save_task.done():
-            self._save_task.cancel()
-
         pareto_candidates = self.archive.pareto_candidates()
         qd_candidates = self.archive.sample_qd(limit=len(self.archive.qd_grid))
 
-        # Run save in background - don't block the optimization loop
-        self._save_task = asyncio.create_task(
-            asyncio.to_thread(
-                self.cache.save_state,
-                round_num=self.round_index,
-                evaluations=self.evaluations_run,
-                pareto_candidates=pareto_candidates,
-                qd_candidates=qd_candidates,
-                queue=list(self.queue),
-            )
+        # Snapshot on the event loop so the background write sees a consistent state
+        self._pending_save = {
+            "round_num": self.round_index,
+            "evaluations": self.evaluations_run,
+            "pareto_candidates": pareto_candidates,
+            "qd_candidates": qd_candidates,
+            "queue": list(self.queue),
+            "checkpoint": self._checkpoint_state(),
+            "compact_every": self.config.checkpoint_compact_every,
+        }
+
+        # Saves are journal deltas against the previous save, so they must land in
+        # order; a save requested while one is running replaces any still waiting.
+        if not hasattr(self, "_save_task") or self._save_task.done():
+            self._save_task = asyncio.create_task(self._write_pending_saves())
+
+    async def _write_pending_saves(self) -> None:
+        while self._pending_save is not None:
+            payload, self._pending_save = self._pending_save, None
+            await asyncio.to_thread(self.cache.save_checkpoint, **payload)
+
+    def _compute_run_signature(self, seeds: Sequence[Candidate]) -> str:
+        """Identify a run by its seeds, dataset and shard schedule."""
+        payload = json.dumps(
+            {
+                "seeds": sorted(seed.fingerprint for seed in seeds),
+                "examples": list(self.sampler.example_ids),
+                "shards": list(self._base_shards),
+            },
+            sort_keys=True,
         )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _checkpoint_state(self) -> dict[str, Any]:
+        """
+        Snapshot everything needed to resume without re-evaluation.
+
+        Candidates still being evaluated are checkpointed at the front of their
+        rung's queue; after a restart they are relaunched (and mostly served
+        from the evaluation cache).
+        """
+        per_shard = [self.queue.rung_items(idx) for idx in range(self.queue.n_rungs)]
+        for candidate in self._inflight_candidates.values():
+            idx = min(self.scheduler.current_shard_index(candidate), len(per_shard) - 1)
+            if candidate not in self.queue:
+                per_shard[idx].insert(0, candidate)
+        return {
+            "signature": self._run_signature,
+            "round": self.round_index,
+            "evaluations": self.evaluations_run,
+            "rounds_completed": self.rounds_completed,
+            "eval_batches_completed": self.eval_batches_completed,
+            "total_tokens_spent": self.total_tokens_spent,
+            "runtime_shards": list(self._runtime_shards),
+            "max_mutations_per_round": self.config.max_mutations_per_round,
+            "max_total_inflight": self._max_total_inflight,
+            "per_shard_queue": [[serialize_candidate(c) for c in queue] for queue in per_shard],
+            "latest_results": self._serialize_latest_results(),
+            "qd_cells_seen": [list(cell) for cell in self.qd_cells_seen],
+            "nested_shards": self._nested_shard_state(),
+            "score_matrix": self.score_matrix.get_state(),
+            "runtime": {
+                "rung_launches": list(self._rung_launches),
+                "rung_promotions": list(self._rung_promotions),
+                "promotion_ema": list(self._promotion_ema),
+                "rung_deficit": dict(self._rung_deficit),
+                "latency_ema": self._latency_ema,
+                "latency_samples": self._latency_samples,
+                "eval_samples": self._eval_samples,
+                "timeout_count": self._timeout_count,
+                "mutation_throttle": self._mutation_throttle,
+                "concurrency_limit": self._concurrency.limit if self._concurrency is not None else None,
+            },
+            "lineage": {
+                "mutations_requested": self._mutations_requested,
+                "mutations_generated": self._mutations_generated,
+                "mutations_enqueued": self._mutations_enqueued,
+                # Tracked sections: only entries changed since the last checkpoint are rebuilt and compared
+                "parent_children": self._parent_children.snapshot(sorted),
+                "children_seen": self._children_seen.snapshot(),
+                "promoted_children": self._promoted_children.snapshot(),
+                "candidate_generations": self._candidate_generations.snapshot(),
+                "lineage_history": self._lineage_history.snapshot(list),
+                "sched_to_fingerprint": self._sched_to_fingerprint.snapshot(),
+                "promotion_pending": sorted(self._promotion_pending),
+            },
+            "scheduler": self.scheduler.get_state(),
+            "sampler": self.sampler.get_state(),
+            "archive": self.archive.get_state(),
+            "stop_governor": self.stop_governor.get_state() if self.stop_governor is not None else None,
+        }
+
+    def _serialize_latest_results(self) -> dict[str, Any]:
+        # Only results replaced since the last checkpoint are serialized (traces included)
+        serialized = {key: self._result_memo(key, result) for key, result in self.latest_results.items()}
+        self._result_memo.prune()
+        return serialized
+
+    def _nested_shard_state(self) -> dict[str, Any] | None:
+        """Window permutations and each candidate's last launch (as a prefix length) for nested shards."""
+        if not self.config.nested_shards:
+            return None
+        return {
+            "orders": {str(window): list(order) for window, order in self._window_orders.items()},
+            "candidates": {
+                key: [window, rung, len(shard_ids)] for key, (window, rung, shard_ids) in self._candidate_shards.items()
+            },
+        }
+
+    def _restore_nested_shard_state(self, state: dict[str, Any] | None) -> None:
+        self._window_orders = {}
+        self._candidate_shards = {}
+        if not self.config.nested_shards or not state:
+            return
+        self._window_orders = {int(window): list(order) for window, order in state.get("orders", {}).items()}
+        for key, (window, rung, size) in state.get("candidates", {}).items():
+            order = self._window_orders.get(window)
+            if order is not None:
+                self._candidate_shards[key] = (window, rung, order[:size])
+
+    def _restore_checkpoint(self, checkpoint: dict[str, Any]) -> None:
+        """Restore a snapshot produced by :meth:`_checkpoint_state`."""
+        self.round_index = checkpoint["round"]
+        self.evaluations_run = checkpoint["evaluations"]
+        self.rounds_completed = checkpoint.get("rounds_completed", self.round_index)
+        self.eval_batches_completed = checkpoint.get("eval_batches_completed", self.round_index)
+        self.total_tokens_spent = checkpoint.get("total_tokens_spent", 0)
+
+        self.scheduler.set_state(checkpoint["scheduler"])
+        self.sampler.set_state(checkpoint["sampler"])
+        self.archive.set_state(checkpoint["archive"])
+        if self.stop_governor is not None and checkpoint.get("stop_governor") is not None:
+            self.stop_governor.set_state(checkpoint["stop_governor"])
+
+        self._runtime_shards = list(checkpoint["runtime_shards"])
+        self.config.shards = tuple(self._runtime_shards)
+        if checkpoint.get("max_mutations_per_round") is not None:
+            self.config.max_mutations_per_round = checkpoint["max_mutations_per_round"]
+        self._max_total_inflight = max(1, int(checkpoint.get("max_total_inflight", self._max_total_inflight)))
+        self._recompute_capacities()
+
+        runtime = checkpoint.get("runtime", {})
+        self._rung_launches = list(runtime.get("rung_launches", self._rung_launches))
+        self._rung_promotions = list(runtime.get("rung_promotions", self._rung_promotions))
+        self._promotion_ema = list(runtime.get("promotion_ema", self._promotion_ema))
+        self._rung_deficit.update(runtime.get("rung_deficit", {}))
+        self._latency_ema = runtime.get("latency_ema", 0.0)
+        self._latency_samples = runtime.get("latency_samples", 0)
+        self._eval_samples = runtime.get("eval_samples", 0)
+        self._timeout_count = runtime.get("timeout_count", 0)
+        self._mutation_throttle = runtime.get("mutation_throttle", False)
+        if self._concurrency is not None and runtime.get("concurrency_limit"):
+            limit = int(runtime["concurrency_limit"])
+            self._concurrency.limit = min(self._concurrency.maximum, max(self._concurrency.minimum, limit))
+            self._recompute_capacities()
+
+        self.queue = ReadyQueue(len(self._runtime_shards), maxlen=self.config.queue_limit)
+        for shard_idx, items in enumerate(checkpoint["per_shard_queue"]):
+            for data in items:
+                candidate = deserialize_candidate(data)
+                self.queue.push(candidate, shard_idx, priority=self._queue_priority(candidate))
+
+        self.latest_results = {
+            key: deserialize_result(result) for key, result in checkpoint.get("latest_results", {}).items()
+        }
+        self.qd_cells_seen = {tuple(cell) for cell in checkpoint.get("qd_cells_seen", [])}
+        self._restore_nested_shard_state(checkpoint.get("nested_shards"))
+        self.score_matrix = ScoreMatrix(self.sampler.example_ids)
+        self.score_matrix.set_state(checkpoint.get("score_matrix", {}))
+        self.sampler.score_matrix = self.score_matrix
+
+        lineage = checkpoint.get("lineage", {})
+        self._mutations_requested = lineage.get("mutations_requested", 0)
+        self._mutations_generated = lineage.get("mutations_generated", 0)
+        self._mutations_enqueued = lineage.get("mutations_enqueued", 0)
+        self._parent_children = TrackedDict(
+            ((key, set(children)) for key, children in lineage.get("parent_children", {}).items()),
+            default_factory=set,
+        )
+        self._children_seen = TrackedSet(lineage.get("children_seen", []))
+        self._promoted_children = TrackedSet(lineage.get("promoted_children", []))
+        self._candidate_generations = TrackedDict(lineage.get("candidate_generations", {}))
+        self._lineage_history = TrackedDict(
+            ((key, deque(history, maxlen=8)) for key, history in lineage.get("lineage_history", {}).items()),
+            default_factory=_new_lineage_history,
+        )
+        self._sched_to_fingerprint = TrackedDict(lineage.get("sched_to_fingerprint", {}))
+        self._promotion_pending = set(lineage.get("promotion_pending", []))
 
     async def _restore_state(self, state: dict) -> None:
         """Restore orchestrator state from saved checkpoint."""
+        checkpoint = state.get("checkpoint")
+        if state.get("version") == CHECKPOINT_VERSION and isinstance(checkpoint, dict):
+            self._restore_checkpoint(checkpoint)
+            return
+
+        # Legacy checkpoints only list candidates; rebuild their results below
         self.round_index = state["round"]
         self.evaluations_run = state["evaluations"]
 
-        # Restore archive by re-inserting candidates with concurrency limit
-        # to avoid "too many open files" errors when reading from cache
-        # Note: We don't have the full EvalResult objects, so we'll need to
-        # re-evaluate them (but cache will make this instant)
+        # Rebuild archive results straight from cached per-example records: one
+        # bulk preload on a thread pool instead of a full-dataset evaluation per
+        # candidate. Candidates whose records don't cover the whole dataset fall
+        # back to the evaluator (cached examples are then served from memory).
+        all_candidates = state["pareto"] + state["qd"]
+        example_ids = list(self.sampler.example_ids)
+        preloaded = await self.cache.preload(all_candidates)
 
-        # Limit concurrent restorations to avoid file descriptor exhaustion
-        # Use a conservative limit since each restoration may open multiple files
+        # Limit concurrent fallback evaluations to avoid file descriptor exhaustion
         restore_semaphore = asyncio.Semaphore(5)
 
         async def restore_candidate(candidate: Candidate) -> None:
-            async with restore_semaphore:
-                # Re-evaluate to get full result (will hit cache)
-                shard = self.sampler.sample_shard(self.round_index, len(self.sampler.example_ids))
-                result = await self.evaluator.eval_on_shard(
-                    candidate,
-                    shard,
-                    concurrency=self._effective_concurrency,
-                    shard_fraction=1.0,
-                )
-                await self.archive.insert(candidate, result)
+            records = preloaded.get(evaluation_key(candidate), {})
+            if example_ids and all(example_id in records for example_id in example_ids):
+                result = aggregate_results((records[example_id] for example_id in example_ids), 1.0)
+            else:
+                async with restore_semaphore:
+                    shard = self.sampler.sample_shard(self.round_index, len(example_ids))
+                    result = await self.evaluator.eval_on_shard(
+                        candidate,
+                        shard,
+                        concurrency=self._effective_concurrency,
+                        shard_fraction=1.0,
+                    )
+            await self.archive.insert(candidate, result)
 
-        # Restore all candidates with controlled parallelism
-        all_candidates = state["pareto"] + state["qd"]
         await asyncio.gather(*(restore_candidate(c) for c in all_candidates))
 
-        # Restore queue
-        self.queue = deque(state["queue"], maxlen=self.config.queue_limit)
+        # Restore queue (through enqueue so per-shard queues and fingerprints stay consistent)
+        self.enqueue(state["queue"])
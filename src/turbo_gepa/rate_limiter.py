@@ -0,0 +1,206 @@
+"""
+Process-wide request and token rate limiting for LLM calls.
+
+Every island runs its own evaluator with its own ``eval_concurrency`` slots,
+so concurrency limits alone let ``n_islands`` times the intended load reach
+the provider at once. A :class:`RateLimiter` instead meters calls against the
+provider's real budgets: requests per minute (RPM) and tokens per minute
+(TPM), each a token bucket that refills continuously and may burst up to one
+minute's worth.
+
+Callers ``await acquire(estimated_tokens)`` before a call and ``settle`` the
+estimate with the usage the provider reports afterwards; an overrun becomes
+debt that delays the next callers. Like providers that count ``max_tokens``
+against TPM, estimates include the completion budget. A caller cancelled
+while queued gets its reservation back. Reservations are made synchronously in
+arrival order, so waiters are served first come first served without a lock
+and a limiter can be shared across event loops (``optimize`` runs several
+``asyncio.run`` phases).
+
+Use :func:`shared_rate_limiter` to get the one limiter for a name, so every
+adapter, island and mutator in the process draws from the same budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable
+
+
+class _Bucket:
+    """Continuously refilling bucket; the level may go negative (debt)."""
+
+    __slots__ = ("capacity", "level", "rate", "updated")
+
+    def __init__(self, per_minute: float, now: float) -> None:
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        if now > self.updated:
+            self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` and return the seconds until the bucket is out of debt again."""
+        self.refill(now)
+        self.level -= amount
+        return max(0.0, -self.level / self.rate)
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter over requests per minute and tokens per minute.
+
+    Either budget may be None (unlimited). ``clock`` and ``sleep`` are
+    injectable for tests.
+    """
+
+    def __init__(
+        self,
+        rpm: float | None = None,
+        tpm: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()  # Reservations are tiny; guards against executor threads
+        self._requests: _Bucket | None = None
+        self._tokens: _Bucket | None = None
+        self.configure(rpm, tpm)
+        self.acquired = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.tokens_estimated = 0.0
+        self.tokens_used = 0.0
+
+    @property
+    def rpm(self) -> float | None:
+        return self._requests.capacity if self._requests is not None else None
+
+    @property
+    def tpm(self) -> float | None:
+        return self._tokens.capacity if self._tokens is not None else None
+
+    @property
+    def enabled(self) -> bool:
+        return self._requests is not None or self._tokens is not None
+
+    def configure(self, rpm: float | None, tpm: float | None) -> None:
+        """Set (or lift, with None) the budgets; current levels are kept where a budget already existed."""
+        for value, label in ((rpm, "rpm"), (tpm, "tpm")):
+            if value is not None and value <= 0:
+                raise ValueError(f"{label} must be positive or None, got {value}")
+        now = self._clock()
+        with self._lock:
+            self._requests = self._rebuild(self._requests, rpm, now)
+            self._tokens = self._rebuild(self._tokens, tpm, now)
+
+    def reserve(self, tokens: float = 0.0) -> float:
+        """Reserve one request and ``tokens`` tokens now; returns how long the caller must wait before sending."""
+        now = self._clock()
+        with self._lock:
+            delay = 0.0
+            if self._requests is not None:
+                delay = self._requests.reserve(1.0, now)
+            if self._tokens is not None and tokens > 0:
+                delay = max(delay, self._tokens.reserve(float(tokens), now))
+            self.acquired += 1
+            self.tokens_estimated += max(0.0, float(tokens))
+            if delay > 0:
+                self.waited += 1
+                self.wait_seconds += delay
+                self.max_wait_seconds = max(self.max_wait_seconds, delay)
+        return delay
+
+    async def acquire(self, tokens: float = 0.0) -> float:
+        """Wait until a call estimated at ``tokens`` tokens fits both budgets; returns the queueing delay."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            try:
+                await self._sleep(delay)
+            except asyncio.CancelledError:
+                # The call will never be sent; hand its share back to the callers queued behind it
+                self.release(tokens)
+                raise
+        return delay
+
+    def release(self, tokens: float = 0.0) -> None:
+        """Return a reservation made by :meth:`reserve` for a call that was never sent."""
+        now = self._clock()
+        with self._lock:
+            if self._requests is not None:
+                self._requests.refill(now)
+                self._requests.level = min(self._requests.capacity, self._requests.level + 1.0)
+            if self._tokens is not None and tokens > 0:
+                self._tokens.refill(now)
+                self._tokens.level = min(self._tokens.capacity, self._tokens.level + float(tokens))
+            self.acquired -= 1
+            self.tokens_estimated -= max(0.0, float(tokens))
+
+    def settle(self, estimated: float, actual: float | None) -> None:
+        """Replace a call's token estimate with the usage the provider reported (refund or extra debt)."""
+        if actual is None:
+            return
+        with self._lock:
+            self.tokens_used += float(actual)
+            if self._tokens is not None:
+                self._tokens.refill(self._clock())
+                self._tokens.level += float(estimated) - float(actual)
+                self._tokens.level = min(self._tokens.capacity, self._tokens.level)
+
+    def stats(self) -> dict[str, float]:
+        """Counters for metrics: calls admitted, calls delayed and the total/longest queueing delay."""
+        return {
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "wait_seconds": self.wait_seconds,
+            "max_wait_seconds": self.max_wait_seconds,
+            "tokens_estimated": self.tokens_estimated,
+            "tokens_used": self.tokens_used,
+        }
+
+    @staticmethod
+    def _rebuild(bucket: _Bucket | None, per_minute: float | None, now: float) -> _Bucket | None:
+        if per_minute is None:
+            return None
+        if bucket is not None and bucket.capacity == float(per_minute):
+            return bucket
+        fresh = _Bucket(per_minute, now)
+        if bucket is not None:
+            bucket.refill(now)
+            fresh.level = min(fresh.capacity, bucket.level)
+        return fresh
+
+
+_SHARED: dict[str, RateLimiter] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_rate_limiter(name: str, rpm: float | None = None, tpm: float | None = None) -> RateLimiter:
+    """
+    Return the process-wide limiter called ``name``, creating it on first use.
+
+    Later calls with different budgets reconfigure the same limiter, so every
+    holder sees the new limits.
+    """
+    with _SHARED_LOCK:
+        limiter = _SHARED.get(name)
+        if limiter is None:
+            limiter = _SHARED[name] = RateLimiter(rpm, tpm)
+            return limiter
+    if limiter.rpm != rpm or limiter.tpm != tpm:
+        limiter.configure(rpm, tpm)
+    return limiter
+
+
+def estimate_tokens(*texts: str, completion_tokens: float = 0.0) -> float:
+    """Rough pre-call token estimate (~4 characters per token) plus expected completion tokens."""
+    return sum(len(text) for text in texts if text) / 4.0 + completion_tokens
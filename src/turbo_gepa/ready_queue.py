@@ -0,0 +1,175 @@
+"""
+Indexed ready queue for candidates waiting to be evaluated.
+
+Every queued candidate is indexed by its scheduling key (see
+:func:`turbo_gepa.scheduler.scheduling_key`) and sits in the heap of the rung
+it will be evaluated on. Heaps are ordered by ``(priority, insertion order)``
+and use lazy deletion, so membership tests, removal and eviction are O(1) and
+launching from a rung is O(log n) amortised, independent of how large the
+backlog grows. Keys that have been launched stay reserved until released, so a
+candidate is never queued while it is still being evaluated.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Iterator, NamedTuple
+
+from .interfaces import Candidate
+from .scheduler import scheduling_key
+
+
+class _Entry(NamedTuple):
+    candidate: Candidate
+    rung: int
+    priority: float
+    seq: int
+
+
+class ReadyQueue:
+    """Candidates awaiting launch, bucketed by rung and deduplicated by scheduling key."""
+
+    def __init__(self, n_rungs: int, maxlen: int | None = None) -> None:
+        self.maxlen = maxlen
+        self._entries: dict[str, _Entry] = {}  # Insertion ordered: the first key is the oldest
+        self._heaps: list[list[tuple[float, int, str]]] = [[] for _ in range(max(1, n_rungs))]
+        self._sizes: list[int] = [0] * max(1, n_rungs)
+        self._inflight: set[str] = set()
+        self._seq = 0
+        self._front_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Candidate]:
+        """Iterate queued candidates from oldest to newest."""
+        return (entry.candidate for entry in list(self._entries.values()))
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, Candidate):
+            key = scheduling_key(key)
+        return key in self._entries
+
+    @property
+    def n_rungs(self) -> int:
+        return len(self._heaps)
+
+    @property
+    def inflight_count(self) -> int:
+        return len(self._inflight)
+
+    def is_inflight(self, key: str) -> bool:
+        return key in self._inflight
+
+    def rung_len(self, rung: int) -> int:
+        return self._sizes[rung] if 0 <= rung < len(self._sizes) else 0
+
+    def rung_sizes(self) -> list[int]:
+        return list(self._sizes)
+
+    def push(self, candidate: Candidate, rung: int, *, priority: float = 0.0, front: bool = False) -> bool:
+        """
+        Queue ``candidate`` on ``rung`` (clamped to the configured rungs).
+
+        Lower ``priority`` launches first; ties launch in insertion order, and
+        ``front`` places the candidate ahead of every equal-priority entry.
+        Returns False when the key is already queued or in flight. When the
+        queue is full the oldest entry is evicted to make room.
+        """
+        key = scheduling_key(candidate)
+        if key in self._entries or key in self._inflight:
+            return False
+        if self.maxlen is not None and len(self._entries) >= self.maxlen:
+            if self.maxlen <= 0:
+                return False
+            self.remove(next(iter(self._entries)))
+        rung = min(max(rung, 0), len(self._heaps) - 1)
+        if front:
+            self._front_seq -= 1
+            seq = self._front_seq
+        else:
+            self._seq += 1
+            seq = self._seq
+        self._entries[key] = _Entry(candidate, rung, priority, seq)
+        heapq.heappush(self._heaps[rung], (priority, seq, key))
+        self._sizes[rung] += 1
+        return True
+
+    def remove(self, key: str) -> Candidate | None:
+        """Drop a queued key; its heap slot is discarded lazily."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._sizes[entry.rung] -= 1
+        heap = self._heaps[entry.rung]
+        if len(heap) > 2 * self._sizes[entry.rung] + 64:
+            self._rebuild(entry.rung)
+        return entry.candidate
+
+    def peek(self, rung: int) -> Candidate | None:
+        """Next candidate to launch from ``rung`` without removing it."""
+        if not 0 <= rung < len(self._heaps):
+            return None
+        heap = self._heaps[rung]
+        while heap:
+            _, seq, key = heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry.seq == seq:
+                return entry.candidate
+            heapq.heappop(heap)
+        return None
+
+    def pop(self, rung: int | None = None) -> Candidate | None:
+        """Remove and return the next candidate of ``rung``, or the oldest overall when ``rung`` is None."""
+        if rung is None:
+            if not self._entries:
+                return None
+            return self.remove(next(iter(self._entries)))
+        candidate = self.peek(rung)
+        if candidate is None:
+            return None
+        _, _, key = heapq.heappop(self._heaps[rung])
+        entry = self._entries.pop(key)
+        self._sizes[entry.rung] -= 1
+        return candidate
+
+    def rung_items(self, rung: int) -> list[Candidate]:
+        """Queued candidates of ``rung`` in launch order."""
+        if not 0 <= rung < len(self._heaps):
+            return []
+        live = [item for item in self._heaps[rung] if self._is_live(item)]
+        return [self._entries[key].candidate for _, _, key in sorted(live)]
+
+    def mark_inflight(self, key: str) -> None:
+        self._inflight.add(key)
+
+    def release(self, key: str) -> None:
+        self._inflight.discard(key)
+
+    def resize(self, n_rungs: int) -> None:
+        """Change the rung count; entries on dropped rungs move to the new last rung."""
+        n_rungs = max(1, n_rungs)
+        while len(self._heaps) < n_rungs:
+            self._heaps.append([])
+            self._sizes.append(0)
+        if len(self._heaps) == n_rungs:
+            return
+        last = n_rungs - 1
+        moved = [item for heap in self._heaps[n_rungs:] for item in heap if self._is_live(item)]
+        del self._heaps[n_rungs:]
+        del self._sizes[n_rungs:]
+        for item in moved:
+            key = item[2]
+            self._entries[key] = self._entries[key]._replace(rung=last)
+        self._sizes[last] += len(moved)
+        self._heaps[last].extend(moved)
+        self._rebuild(last)
+
+    def _is_live(self, item: tuple[float, int, str]) -> bool:
+        entry = self._entries.get(item[2])
+        return entry is not None and entry.seq == item[1]
+
+    def _rebuild(self, rung: int) -> None:
+        heap = [item for item in self._heaps[rung] if self._is_live(item)]
+        heapq.heapify(heap)
+        self._heaps[rung] = heap
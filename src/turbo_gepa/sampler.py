@@ -2,27 +2,40 @@
 Instance sampling utilities for shard selection.
 
 The sampler balances coverage between a rotating coreset and a queue of hard
-examples identified via disagreement among top candidates.
+examples identified via disagreement among top candidates. When a score matrix
+is attached, hard examples on which scored candidates split are drawn first.
 """
 
 from __future__ import annotations
 
 import collections
 import random
-from typing import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+
+if TYPE_CHECKING:
+    from .score_matrix import ScoreMatrix
 
 
 class InstanceSampler:
     """Coreset plus hardness-aware sampler."""
 
-    def __init__(self, example_ids: Sequence[str], seed: int | None = None) -> None:
+    def __init__(
+        self,
+        example_ids: Sequence[str],
+        seed: int | None = None,
+        *,
+        score_matrix: ScoreMatrix | None = None,
+    ) -> None:
         self.example_ids = list(example_ids)
         if not self.example_ids:
             raise ValueError("InstanceSampler requires at least one example id")
-        self._order = list(self.example_ids)
+        # A tuple, so get_state() can hand out the same object until it is replaced
+        self._order = tuple(self.example_ids)
         self._pointer = 0
         self.hardness: collections.deque[str] = collections.deque(maxlen=128)
         self.random = random.Random(seed)
+        # Run-wide per-example scores (the orchestrator attaches its own) used to rank hard examples
+        self.score_matrix = score_matrix
 
     def sample_shard(self, round_id: int, k: int) -> list[str]:
         """
@@ -48,10 +61,14 @@ class InstanceSampler:
         # Sample from hardness deque (take from the end for most recent hard examples)
         hard_ids = []
         if hardness_count > 0:
-            # Sample without replacement from hardness deque
             # Convert to list first to enable random sampling
             hardness_list = list(self.hardness)
-            hard_ids = self.random.sample(hardness_list, min(hardness_count, len(hardness_list)))
+            if self.score_matrix is not None:
+                self.random.shuffle(hardness_list)
+                hard_ids = self._rank_hardness(hardness_list)[:hardness_count]
+            else:
+                # Sample without replacement from hardness deque
+                hard_ids = self.random.sample(hardness_list, min(hardness_count, len(hardness_list)))
 
         # Fill remaining slots with random sampling from non-hardness examples
         remaining = k - len(hard_ids)
@@ -92,12 +109,72 @@ class InstanceSampler:
         shard = hard_ids + random_ids
         return shard
 
+    def sample_permutation(self, round_id: int) -> list[str]:
+        """
+        Return every example identifier in a random order for the current round.
+
+        Each prefix is a valid shard, so nested rungs can take the first ``k``
+        entries and a promoted candidate only meets examples it has not seen.
+        Hard examples are interleaved at every fourth position (while they
+        last), giving each prefix roughly the same 25% hardness share that
+        :meth:`sample_shard` reserves.
+        """
+        hard_ids = list(self.hardness)
+        self.random.shuffle(hard_ids)
+        if self.score_matrix is not None:
+            hard_ids = self._rank_hardness(hard_ids)
+        hardness_set = set(hard_ids)
+        rest = [ex_id for ex_id in self.example_ids if ex_id not in hardness_set]
+        self.random.shuffle(rest)
+
+        order: list[str] = []
+        hard_pos = rest_pos = 0
+        for position in range(len(hard_ids) + len(rest)):
+            if hard_pos < len(hard_ids) and (position % 4 == 0 or rest_pos >= len(rest)):
+                order.append(hard_ids[hard_pos])
+                hard_pos += 1
+            else:
+                order.append(rest[rest_pos])
+                rest_pos += 1
+        return order
+
     def register_hard_examples(self, example_ids: Iterable[str]) -> None:
         """Record examples that triggered failures for increased sampling."""
         for example_id in example_ids:
             if example_id in self.example_ids and example_id not in self.hardness:
                 self.hardness.append(example_id)
 
+    def _rank_hardness(self, example_ids: list[str]) -> list[str]:
+        """Order ``example_ids`` by how evenly scored candidates split on them (stable, so ties keep their order)."""
+        means = self.score_matrix.example_means() if self.score_matrix is not None else {}
+
+        def spread(example_id: str) -> float:
+            # mean * (1 - mean) peaks when candidates disagree; examples seen by fewer than two count as undecided
+            mean, count = means.get(example_id, (0.5, 0))
+            return 0.25 if count < 2 else mean * (1.0 - mean)
+
+        return sorted(example_ids, key=spread, reverse=True)
+
+    def get_state(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot (hardness queue, coreset pointer, RNG state)."""
+        version, internal, gauss = self.random.getstate()
+        return {
+            "order": self._order,
+            "pointer": self._pointer,
+            "hardness": list(self.hardness),
+            "random": [version, list(internal), gauss],
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Restore a snapshot produced by :meth:`get_state`."""
+        self._order = tuple(state.get("order", self._order))
+        self._pointer = int(state.get("pointer", 0))
+        self.hardness = collections.deque(state.get("hardness", []), maxlen=self.hardness.maxlen)
+        rng_state = state.get("random")
+        if rng_state is not None:
+            version, internal, gauss = rng_state
+            self.random.setstate((version, tuple(internal), gauss))
+
     def hardness_size(self) -> int:
         """Number of hardness-prioritized examples queued."""
         return len(self.hardness)
@@ -7,13 +7,15 @@ promotion heuristics while keeping default behavior light-weight.
 
 from __future__ import annotations
 
+import bisect
 import logging
+import math
 import statistics
 from collections import deque
 from dataclasses import dataclass, field, replace
-from typing import Any, Sequence
+from typing import Any, Iterable, Mapping, Sequence
 
-from .cache import candidate_key
+from .cache import TrackedDict, TrackedSet, candidate_key, deserialize_candidate, serialize_candidate
 from .interfaces import Candidate, EvalResult
 from .stop_governor import EpochMetrics, StopGovernor, StopGovernorConfig
 
@@ -22,19 +24,59 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class Rung:
-    """Tracks candidates evaluated on a specific shard."""
+    """
+    Tracks candidates evaluated on a specific shard.
+
+    Alongside each candidate's score history the rung keeps the per-candidate
+    means in a sorted list, updated incrementally, so quantile lookups never
+    rescan the rung. With a ``window`` only the most recently scored
+    candidates count; older ones age out.
+    """
 
     shard_fraction: float
-    results: dict[str, deque[float]] = field(default_factory=dict)
+    results: dict[str, deque[float]] = field(default_factory=TrackedDict)
     max_history: int = 64
+    window: int | None = None
+    _means: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _sorted_means: list[float] = field(default_factory=list, init=False, repr=False)
 
     def update(self, key: str, score: float) -> None:
-        history = self.results.setdefault(key, deque(maxlen=self.max_history))
+        history = self.results.pop(key, None)  # Re-insert so dict order tracks recency
+        if history is None:
+            history = deque(maxlen=self.max_history)
         history.append(score)
+        self._store(key, history)
+
+    def restore(self, key: str, values: Iterable[float]) -> None:
+        """Load a checkpointed score history (oldest candidates first)."""
+        self.results.pop(key, None)
+        self._store(key, deque(values, maxlen=self.max_history))
+
+    def remove(self, key: str) -> None:
+        self.results.pop(key, None)
+        mean = self._means.pop(key, None)
+        if mean is not None:
+            del self._sorted_means[bisect.bisect_left(self._sorted_means, mean)]
 
     def summary(self, key: str) -> float:
-        values = self.results.get(key, [])
-        return statistics.fmean(values) if values else float("-inf")
+        return self._means.get(key, float("-inf"))
+
+    def sorted_means(self) -> list[float]:
+        """Per-candidate mean scores in ascending order (read-only view)."""
+        return self._sorted_means
+
+    def _store(self, key: str, history: deque[float]) -> None:
+        old = self._means.pop(key, None)
+        if old is not None:
+            del self._sorted_means[bisect.bisect_left(self._sorted_means, old)]
+        self.results[key] = history
+        if history:
+            mean = statistics.fmean(history)
+            self._means[key] = mean
+            bisect.insort(self._sorted_means, mean)
+        if self.window is not None:
+            while len(self.results) > max(self.window, 1):
+                self.remove(next(iter(self.results)))
 
 
 @dataclass
@@ -45,6 +87,110 @@ class SchedulerConfig:
     enable_convergence: bool = False
     lineage_patience: int = 0
     lineage_min_improve: float = 0.01
+    rung_window: int | None = None  # Recently scored candidates per rung used for thresholds (None = all)
+    racing: str | None = None  # Confidence bound for racing evaluations: "hoeffding", "bernstein", "beta" (None = off)
+    racing_confidence: float = 0.95
+    racing_min_examples: int = 5
+    paired_min_examples: int = 5  # Common examples needed to judge a child by paired differences (0 = never)
+
+
+RACING_BOUNDS = ("hoeffding", "bernstein", "beta")
+
+
+@dataclass(frozen=True)
+class RaceBound:
+    """
+    Sequential test that settles a shard evaluation before every example is scored.
+
+    ``target`` is the shard mean at which the scheduler will promote the
+    candidate. After each scored example :meth:`settle` returns ``"promote"``
+    once the full-shard mean reaches ``target`` with probability at least
+    ``confidence``, ``"prune"`` once it falls short with that probability, and
+    None while the outcome is open. Per-example scores must lie in [0, 1].
+
+    Outcomes that no remaining example can change are settled with any
+    ``method``. Before that point the bound decides:
+
+    * ``hoeffding``: Hoeffding-Serfling, for sampling the shard without replacement.
+    * ``bernstein``: empirical Bernstein (Maurer-Pontil), tighter when scores vary little.
+    * ``beta``: Beta-binomial posterior predictive of the remaining examples, for 0/1 scores.
+
+    The frequentist bounds are Bonferroni-corrected over every look a race can
+    take, so repeated checking keeps the stated confidence.
+    """
+
+    target: float
+    method: str = "hoeffding"
+    confidence: float = 0.95
+    min_examples: int = 5
+    allow_promote: bool = True  # False on the final rung: its score is the reported result, so only prune early
+
+    def settle(self, total: float, total_sq: float, n: int, shard_size: int) -> str | None:
+        """Decide from ``n`` scored examples with score sum ``total`` and sum of squares ``total_sq``."""
+        if n <= 0 or shard_size <= 0:
+            return None
+        remaining = max(0, shard_size - n)
+        lowest = total / shard_size  # Every remaining example scores 0
+        highest = (total + remaining) / shard_size  # Every remaining example scores 1
+        if self.allow_promote and lowest >= self.target:
+            return "promote"
+        if highest < self.target:
+            return "prune"
+        if remaining == 0 or n < self.min_examples:
+            return None
+
+        if self.method == "beta":
+            needed = math.ceil(self.target * shard_size - total - 1e-9)
+            reach = _beta_binomial_tail(total, n, remaining, needed)
+            if self.allow_promote and reach >= self.confidence:
+                return "promote"
+            if 1.0 - reach >= self.confidence:
+                return "prune"
+            return None
+
+        looks = max(1, shard_size - self.min_examples + 1)
+        log_term = math.log(looks / max(1.0 - self.confidence, 1e-12))
+        mean = total / n
+        if self.method == "bernstein":
+            variance = max(0.0, (total_sq - total * total / n) / (n - 1)) if n > 1 else 0.25
+            radius = math.sqrt(2.0 * variance * log_term / n) + 7.0 * log_term / (3.0 * max(n - 1, 1))
+        else:
+            radius = math.sqrt((1.0 - (n - 1) / shard_size) * log_term / (2.0 * n))
+        if self.allow_promote and max(lowest, mean - radius) >= self.target:
+            return "promote"
+        if min(highest, mean + radius) < self.target:
+            return "prune"
+        return None
+
+
+def _beta_binomial_tail(successes: float, n: int, remaining: int, needed: int) -> float:
+    """P(at least ``needed`` of ``remaining`` examples succeed) under a uniform-prior Beta posterior."""
+    if needed <= 0:
+        return 1.0
+    if needed > remaining:
+        return 0.0
+    a = 1.0 + successes
+    b = 1.0 + max(0.0, n - successes)
+    # Beta-binomial pmf at k = needed, then the ratio recurrence up to k = remaining
+    k = needed
+    log_pmf = (
+        math.lgamma(remaining + 1)
+        - math.lgamma(k + 1)
+        - math.lgamma(remaining - k + 1)
+        + math.lgamma(k + a)
+        + math.lgamma(remaining - k + b)
+        - math.lgamma(remaining + a + b)
+        - math.lgamma(a)
+        - math.lgamma(b)
+        + math.lgamma(a + b)
+    )
+    pmf = math.exp(log_pmf)
+    tail = pmf
+    while k < remaining:
+        pmf *= (remaining - k) / (k + 1) * (k + a) / (remaining - k - 1 + b)
+        k += 1
+        tail += pmf
+    return min(1.0, tail)
 
 
 @dataclass
@@ -59,28 +205,26 @@ class BudgetedScheduler:
     """Manage shard promotion and pruning for asynchronous evaluations."""
 
     def __init__(self, config: SchedulerConfig) -> None:
+        if config.racing is not None and config.racing not in RACING_BOUNDS:
+            raise ValueError(f"Unknown racing bound: '{config.racing}'. Choose from: {', '.join(RACING_BOUNDS)}")
         self.config = config
-        self.rungs = [Rung(shard) for shard in config.shards]
-        self._candidate_levels: dict[str, int] = {}
+        self.rungs = [Rung(shard, window=config.rung_window) for shard in config.shards]
+        # Tracked containers let get_state() rebuild only the entries changed since the last checkpoint
+        self._candidate_levels: dict[str, int] = TrackedDict()
         self._pending_promotions: list[Candidate] = []
-        self._parent_scores: dict[str, float] = {}
-        self._convergence: dict[str, dict[int, _ConvergenceState]] = {}
+        self._parent_scores: dict[str, float] = TrackedDict()
+        self._convergence: TrackedDict = TrackedDict()
         self._convergence_config = StopGovernorConfig(
             alpha=0.5,
             hysteresis_window=3,
             stop_threshold=0.2,
             max_no_improvement_epochs=4,
         )
-        self._lineage_failures: dict[tuple[str, int], int] = {}
-        self._lineage_seen_children: set[tuple[str, int]] = set()
+        self._lineage_failures: dict[tuple[str, int], int] = TrackedDict()
+        self._lineage_seen_children: set[tuple[str, int]] = TrackedSet()
 
     def _sched_key(self, candidate: Candidate) -> str:
-        meta = candidate.meta if isinstance(candidate.meta, dict) else None
-        if meta:
-            key = meta.get("_sched_key")
-            if isinstance(key, str):
-                return key
-        return candidate_hash(candidate)
+        return scheduling_key(candidate)
 
     def current_shard_index(self, candidate: Candidate) -> int:
         return self._candidate_levels.get(self._sched_key(candidate), 0)
@@ -88,7 +232,7 @@ class BudgetedScheduler:
     def update_shards(self, shards: Sequence[float]) -> None:
         """Update rung configuration while preserving candidate levels."""
         self.config = replace(self.config, shards=tuple(shards))
-        self.rungs = [Rung(shard) for shard in self.config.shards]
+        self.rungs = [Rung(shard, window=self.config.rung_window) for shard in self.config.shards]
         max_idx = max(len(self.rungs) - 1, 0)
         for key, level in list(self._candidate_levels.items()):
             if level > max_idx:
@@ -102,6 +246,7 @@ class BudgetedScheduler:
         if state is None:
             state = _ConvergenceState(governor=StopGovernor(replace(self._convergence_config)))
             cand_states[rung_idx] = state
+            self._convergence.touch(key)
         return state
 
     def _clear_convergence(self, key: str, rung_idx: int | None = None) -> None:
@@ -112,6 +257,7 @@ class BudgetedScheduler:
             self._convergence.pop(key, None)
             return
         states.pop(rung_idx, None)
+        self._convergence.touch(key)
         if not states:
             self._convergence.pop(key, None)
 
@@ -126,6 +272,7 @@ class BudgetedScheduler:
         """Update convergence tracker and decide whether to promote."""
         key = self._sched_key(candidate)
         state = self._get_convergence_state(key, rung_idx)
+        self._convergence.touch(key)
         state.evals += 1
         state.tokens += result.objectives.get("tokens", 0.0)
 
@@ -153,8 +300,21 @@ class BudgetedScheduler:
         idx = self.current_shard_index(candidate)
         return self.rungs[idx].shard_fraction
 
-    def record(self, candidate: Candidate, result: EvalResult, objective_key: str) -> str:
-        """Record fresh metrics and queue promotions when the candidate excels."""
+    def record(
+        self,
+        candidate: Candidate,
+        result: EvalResult,
+        objective_key: str,
+        parent_example_scores: Mapping[str, float] | None = None,
+    ) -> str:
+        """
+        Record fresh metrics and queue promotions when the candidate excels.
+
+        ``parent_example_scores`` maps example ids to the parent's per-example
+        score. When it covers at least ``paired_min_examples`` of this result's
+        examples, the parent comparison uses the mean per-example difference on
+        those common examples instead of two means over different shards.
+        """
         decision = "pending"
         score = result.objective(objective_key, default=None)
         if score is None:
@@ -180,26 +340,27 @@ class BudgetedScheduler:
             if force_promote and convergence_debug and convergence_debug.get("reason"):
                 force_reason = f"convergence:{convergence_debug['reason']}"
 
-        parent_objectives = candidate.meta.get("parent_objectives") if isinstance(candidate.meta, dict) else None
-        parent_score = None
-        if isinstance(parent_objectives, dict):
-            parent_score = parent_objectives.get(objective_key)
-        elif "parent_score" in candidate.meta:
-            parent_score = candidate.meta.get("parent_score")
+        parent_score = self._parent_score(candidate, objective_key)
         parent_fp = candidate.meta.get("parent") if isinstance(candidate.meta, dict) else None
+        paired = self.paired_delta(result, parent_example_scores, objective_key) if parent_score is not None else None
+        if paired is not None:
+            parent_delta: float | None = paired[0]
+        elif parent_score is not None:
+            parent_delta = score - parent_score
+        else:
+            parent_delta = None
 
         if (
             parent_fp
             and self.config.lineage_patience > 0
-            and parent_score is not None
+            and parent_delta is not None
             and idx < final_rung_index
         ):
             child_seen_key = (sched_key, idx)
             if child_seen_key not in self._lineage_seen_children:
                 self._lineage_seen_children.add(child_seen_key)
                 lineage_key = (parent_fp, idx)
-                delta = score - parent_score
-                if delta >= self.config.lineage_min_improve:
+                if parent_delta >= self.config.lineage_min_improve:
                     self._lineage_failures.pop(lineage_key, None)
                 else:
                     failures = self._lineage_failures.get(lineage_key, 0) + 1
@@ -222,8 +383,7 @@ class BudgetedScheduler:
             self._candidate_levels[sched_key] = min(idx + 1, final_rung_index)
             self._pending_promotions.append(candidate)
             self._parent_scores[sched_key] = score
-            if sched_key in rung.results:
-                del rung.results[sched_key]
+            rung.remove(sched_key)
             self._clear_convergence(sched_key, idx)
             if parent_fp and self.config.lineage_patience > 0:
                 self._lineage_failures.pop((parent_fp, idx), None)
@@ -231,15 +391,16 @@ class BudgetedScheduler:
             return "promoted"
 
         # Check parent comparison: prune if worse, promote if better
-        if parent_score is not None:
-            if score < parent_score + self.config.eps_improve:
+        if parent_delta is not None:
+            basis = f"paired over {paired[1]} examples" if paired is not None else f"{score:.1%} vs {parent_score:.1%}"
+            if parent_delta < self.config.eps_improve:
                 # Worse than parent - prune immediately
                 self._parent_scores[sched_key] = score
                 logger.debug(
-                    "   ❌ ASHA: Pruned (worse than parent: %s < %s + %s)",
-                    f"{score:.1%}",
-                    f"{parent_score:.1%}",
+                    "   ❌ ASHA: Pruned (worse than parent: Δ=%s < %s, %s)",
+                    f"{parent_delta:+.1%}",
                     f"{self.config.eps_improve:.2%}",
+                    basis,
                 )
                 self._clear_convergence(sched_key)
                 self._lineage_seen_children.discard((sched_key, idx))
@@ -247,10 +408,10 @@ class BudgetedScheduler:
             elif idx < final_rung_index:
                 # Better than parent - promote immediately (skip quantile check)
                 logger.debug(
-                    "   ⬆️  ASHA: PROMOTED! (better than parent: %s >= %s + %s, rung %s -> %s)",
-                    f"{score:.1%}",
-                    f"{parent_score:.1%}",
+                    "   ⬆️  ASHA: PROMOTED! (better than parent: Δ=%s >= %s, %s, rung %s -> %s)",
+                    f"{parent_delta:+.1%}",
                     f"{self.config.eps_improve:.2%}",
+                    basis,
                     idx,
                     idx + 1,
                 )
@@ -319,6 +480,135 @@ class BudgetedScheduler:
             self._lineage_seen_children.discard((sched_key, idx))
         return decision
 
+    def race_bound(
+        self,
+        candidate: Candidate,
+        objective_key: str,
+        parent_shard_score: float | None = None,
+    ) -> RaceBound | None:
+        """
+        Sequential test for ``candidate``'s next evaluation, or None when racing is off or no score matters.
+
+        The target mirrors :meth:`record`: a child must reach its parent's score
+        plus ``eps_improve``; otherwise the rung's current promotion threshold
+        applies (a snapshot, so the final decision can differ slightly once the
+        score joins the rung). Final-rung evaluations only race against a parent.
+        ``parent_shard_score`` is the parent's mean on exactly this shard; racing
+        against it makes the test paired, like the decision in :meth:`record`.
+        """
+        if self.config.racing is None:
+            return None
+        idx = self.current_shard_index(candidate)
+        is_final = idx >= len(self.rungs) - 1
+        parent_score = self._parent_score(candidate, objective_key)
+        if parent_score is not None and parent_shard_score is not None:
+            parent_score = parent_shard_score
+        if parent_score is not None:
+            target = parent_score + self.config.eps_improve
+        elif is_final:
+            return None  # Every score completes
+        else:
+            target = self._promotion_threshold(self.rungs[idx])
+            if target == float("-inf"):
+                return None  # First candidate on the rung promotes whatever it scores
+        return RaceBound(
+            target=min(target, 1.0),
+            method=self.config.racing,
+            confidence=self.config.racing_confidence,
+            min_examples=self.config.racing_min_examples,
+            allow_promote=not is_final,
+        )
+
+    def paired_delta(
+        self,
+        result: EvalResult,
+        parent_example_scores: Mapping[str, float] | None,
+        objective_key: str,
+    ) -> tuple[float, int] | None:
+        """
+        Mean per-example (child - parent) difference over the examples both were scored on.
+
+        Returns ``(mean_difference, common_examples)``, or None when fewer than
+        ``paired_min_examples`` examples are shared.
+        """
+        min_common = self.config.paired_min_examples
+        if min_common <= 0 or not parent_example_scores:
+            return None
+        total = 0.0
+        common = 0
+        for example_id, value in result.example_scores(objective_key).items():
+            parent_value = parent_example_scores.get(example_id)
+            if parent_value is None:
+                continue
+            total += value - parent_value
+            common += 1
+        if common < min_common:
+            return None
+        return total / common, common
+
+    def _parent_score(self, candidate: Candidate, objective_key: str) -> float | None:
+        meta = candidate.meta if isinstance(candidate.meta, dict) else {}
+        parent_objectives = meta.get("parent_objectives")
+        if isinstance(parent_objectives, dict):
+            return parent_objectives.get(objective_key)
+        return meta.get("parent_score")
+
+    def get_state(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot of rung histories and per-candidate bookkeeping."""
+        return {
+            "shards": list(self.config.shards),
+            "rungs": {
+                str(idx): {
+                    "shard_fraction": rung.shard_fraction,
+                    "max_history": rung.max_history,
+                    "results": rung.results.snapshot(list),
+                }
+                for idx, rung in enumerate(self.rungs)
+            },
+            "candidate_levels": self._candidate_levels.snapshot(),
+            "pending_promotions": [serialize_candidate(c) for c in self._pending_promotions],
+            "parent_scores": self._parent_scores.snapshot(),
+            "convergence": self._convergence.snapshot(_serialize_convergence),
+            "lineage_failures": self._lineage_failures.snapshot(nested=True),
+            "lineage_seen_children": self._lineage_seen_children.snapshot(nested=True),
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Restore a snapshot produced by :meth:`get_state`."""
+        self.config = replace(self.config, shards=tuple(state["shards"]))
+        self.rungs = []
+        for _, rung_state in sorted(state["rungs"].items(), key=lambda item: int(item[0])):
+            rung = Rung(
+                rung_state["shard_fraction"],
+                max_history=rung_state.get("max_history", 64),
+                window=self.config.rung_window,
+            )
+            for key, values in rung_state["results"].items():
+                rung.restore(key, values)
+            self.rungs.append(rung)
+        self._candidate_levels = TrackedDict(state["candidate_levels"])
+        self._pending_promotions = [deserialize_candidate(c) for c in state.get("pending_promotions", [])]
+        self._parent_scores = TrackedDict(state.get("parent_scores", {}))
+        self._convergence = TrackedDict()
+        for key, states in state.get("convergence", {}).items():
+            for rung_idx, conv in states.items():
+                governor = StopGovernor(replace(self._convergence_config))
+                governor.set_state(conv["governor"])
+                self._convergence.setdefault(key, {})[int(rung_idx)] = _ConvergenceState(
+                    governor=governor,
+                    evals=conv.get("evals", 0),
+                    tokens=conv.get("tokens", 0.0),
+                    last_debug=conv.get("last_debug"),
+                )
+        self._lineage_failures = TrackedDict(
+            ((parent, int(idx)), int(count))
+            for parent, counts in state.get("lineage_failures", {}).items()
+            for idx, count in counts.items()
+        )
+        self._lineage_seen_children = TrackedSet(
+            (key, int(idx)) for key, indices in state.get("lineage_seen_children", {}).items() for idx in indices
+        )
+
     def shard_fraction_for_index(self, index: int) -> float:
         index = max(0, min(index, len(self.rungs) - 1))
         return self.rungs[index].shard_fraction
@@ -336,7 +626,7 @@ class BudgetedScheduler:
         This prevents the chicken-and-egg problem where all candidates are equally
         bad (e.g., all 0%) but we still need to keep the best ones for reflection.
         """
-        samples = [statistics.fmean(list(values)) for values in rung.results.values() if values]
+        samples = rung.sorted_means()  # Ascending, maintained incrementally by the rung
         if not samples:
             return float("-inf")
         if len(samples) == 1:
@@ -351,12 +641,12 @@ class BudgetedScheduler:
         min_to_promote = min(2, len(samples))  # Keep at least 1-2 best
         rank = min(quantile_rank, len(samples) - min_to_promote)
 
-        samples.sort(reverse=True)
-        threshold_score = samples[rank]
+        # rank counts from the best score down
+        threshold_score = samples[len(samples) - 1 - rank]
 
         # Only add eps_improve if there's actually variation in scores
         # When all candidates are tied (e.g., all 0%), don't add epsilon or we'll prune everyone
-        if len(set(samples)) > 1:
+        if samples[0] != samples[-1]:
             # Multiple distinct scores - require improvement over threshold
             return threshold_score + self.config.eps_improve
         else:
@@ -366,3 +656,25 @@ class BudgetedScheduler:
 
 def candidate_hash(candidate: Candidate) -> str:
     return candidate_key(candidate)
+
+
+def scheduling_key(candidate: Candidate) -> str:
+    """Key the scheduler tracks a candidate under; stable across promotions that rewrite meta."""
+    meta = candidate.meta if isinstance(candidate.meta, dict) else None
+    if meta:
+        key = meta.get("_sched_key")
+        if isinstance(key, str):
+            return key
+    return candidate_hash(candidate)
+
+
+def _serialize_convergence(states: dict[int, _ConvergenceState]) -> dict[str, Any]:
+    return {
+        str(rung_idx): {
+            "evals": state.evals,
+            "tokens": state.tokens,
+            "last_debug": state.last_debug,
+            "governor": state.governor.get_state(),
+        }
+        for rung_idx, state in states.items()
+    }
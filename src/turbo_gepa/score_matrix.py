@@ -0,0 +1,272 @@
+"""
+Run-wide matrix of per-example scores.
+
+Rows are candidates (keyed by scheduling key, so metadata rewrites during
+promotion keep their row) and columns are example ids. Cells hold the
+promotion objective of one (candidate, example) evaluation; unscored cells
+are NaN. The matrix is filled as results are ingested, so questions like
+"how hard is this example", "how often do these two prompts agree" or "which
+examples has this prompt seen" are answered by array lookups instead of scans
+over trace dicts.
+
+NumPy is used when installed (it is not a hard dependency); without it the
+same API is served from plain Python lists.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable, Mapping, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Graceful degradation: list-of-rows storage
+
+from .interfaces import EvalResult
+
+_NAN = float("nan")
+
+
+class ScoreMatrix:
+    """Candidates x examples score matrix that grows as new rows and columns appear."""
+
+    def __init__(self, example_ids: Sequence[str] = (), *, use_numpy: bool | None = None) -> None:
+        self._numpy = np is not None if use_numpy is None else use_numpy and np is not None
+        self._row_index: dict[str, int] = {}
+        self._col_index: dict[str, int] = {}
+        self._col_ids: list[str] = []
+        # Rows freed by remove(), reused before the storage grows
+        self._free_rows: list[int] = []
+        self._n_rows = 0
+        # Per-row snapshots reused by get_state() until the row changes
+        self._row_state: dict[str, dict[str, float]] = {}
+        if self._numpy:
+            self._data = np.full((8, max(8, len(example_ids))), np.nan)
+        else:
+            self._rows: list[list[float]] = []
+        for example_id in example_ids:
+            self._column(example_id)
+
+    @property
+    def candidates(self) -> list[str]:
+        """Row keys in insertion order."""
+        return list(self._row_index)
+
+    @property
+    def examples(self) -> list[str]:
+        """Column ids in insertion order."""
+        return list(self._col_ids)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self._row_index), len(self._col_ids)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._row_index
+
+    def __len__(self) -> int:
+        return len(self._row_index)
+
+    # ------------------------------------------------------------------ updates
+
+    def set(self, key: str, example_id: str, score: float) -> None:
+        """Store one score, adding the row and column if needed."""
+        row = self._row(key)
+        col = self._column(example_id)
+        self._row_state.pop(key, None)
+        if self._numpy:
+            self._data[row, col] = score
+        else:
+            values = self._rows[row]
+            if len(values) <= col:
+                values.extend([_NAN] * (col + 1 - len(values)))
+            values[col] = float(score)
+
+    def record(self, key: str, result: EvalResult, objective: str = "quality") -> int:
+        """
+        Store every per-example ``objective`` score in ``result``; returns how many were stored.
+
+        Scores come from :meth:`EvalResult.example_scores`, i.e. the mapped
+        objectives that ``result.objectives`` averages, not raw task metrics.
+        """
+        scores = result.example_scores(objective)
+        for example_id, value in scores.items():
+            self.set(key, example_id, value)
+        return len(scores)
+
+    def remove(self, key: str) -> None:
+        """Drop a candidate's row; its storage is reused by the next new candidate."""
+        row = self._row_index.pop(key, None)
+        if row is None:
+            return
+        self._row_state.pop(key, None)
+        if self._numpy:
+            self._data[row, :] = np.nan
+        else:
+            self._rows[row] = []
+        self._free_rows.append(row)
+
+    # ------------------------------------------------------------------ queries
+
+    def get(self, key: str, example_id: str) -> float | None:
+        row = self._row_index.get(key)
+        col = self._col_index.get(example_id)
+        if row is None or col is None:
+            return None
+        if self._numpy:
+            value = float(self._data[row, col])
+        else:
+            values = self._rows[row]
+            value = values[col] if col < len(values) else _NAN
+        return None if math.isnan(value) else value
+
+    def scores(self, key: str, example_ids: Iterable[str] | None = None) -> dict[str, float]:
+        """Known scores of ``key`` (restricted to ``example_ids`` when given)."""
+        row = self._row_index.get(key)
+        if row is None:
+            return {}
+        if example_ids is None:
+            cols = range(len(self._col_ids))
+            ids = self._col_ids
+        else:
+            ids = [example_id for example_id in example_ids if example_id in self._col_index]
+            cols = [self._col_index[example_id] for example_id in ids]
+        if self._numpy:
+            values = self._data[row, list(cols)].tolist() if len(ids) else []
+        else:
+            stored = self._rows[row]
+            values = [stored[col] if col < len(stored) else _NAN for col in cols]
+        return {example_id: value for example_id, value in zip(ids, values, strict=True) if not math.isnan(value)}
+
+    def coverage(self, key: str) -> int:
+        """Number of examples ``key`` has been scored on."""
+        row = self._row_index.get(key)
+        if row is None:
+            return 0
+        if self._numpy:
+            return int(np.count_nonzero(~np.isnan(self._data[row, : len(self._col_ids)])))
+        return sum(1 for value in self._rows[row] if not math.isnan(value))
+
+    def example_means(self, keys: Iterable[str] | None = None) -> dict[str, tuple[float, int]]:
+        """Per example: (mean score, number of candidates scored) over ``keys`` (default: every row)."""
+        rows = self._rows_for(keys)
+        n_cols = len(self._col_ids)
+        if self._numpy:
+            block = self._data[rows, :n_cols] if rows else np.empty((0, n_cols))
+            scored = ~np.isnan(block)
+            counts = scored.sum(axis=0)
+            sums = np.where(scored, block, 0.0).sum(axis=0)
+            return {
+                example_id: (float(sums[col]) / int(counts[col]), int(counts[col]))
+                for col, example_id in enumerate(self._col_ids)
+                if counts[col]
+            }
+        sums_list = [0.0] * n_cols
+        counts_list = [0] * n_cols
+        for row in rows:
+            for col, value in enumerate(self._rows[row]):
+                if not math.isnan(value):
+                    sums_list[col] += value
+                    counts_list[col] += 1
+        return {
+            example_id: (sums_list[col] / counts_list[col], counts_list[col])
+            for col, example_id in enumerate(self._col_ids)
+            if counts_list[col]
+        }
+
+    def difficulty(self, keys: Iterable[str] | None = None) -> dict[str, float]:
+        """Per example: ``1 - mean score`` across candidates (scores assumed in [0, 1])."""
+        return {example_id: 1.0 - mean for example_id, (mean, _) in self.example_means(keys).items()}
+
+    def agreement(self, key_a: str, key_b: str) -> tuple[float, int] | None:
+        """
+        Fraction of commonly scored examples on which two candidates score the same.
+
+        Returns ``(agreement, common_examples)``, or None when they share none.
+        """
+        left = self.scores(key_a)
+        right = self.scores(key_b)
+        common = [example_id for example_id in left if example_id in right]
+        if not common:
+            return None
+        same = sum(1 for example_id in common if math.isclose(left[example_id], right[example_id]))
+        return same / len(common), len(common)
+
+    def to_numpy(self, keys: Sequence[str] | None = None) -> Any:
+        """Dense copy (rows in ``keys`` order, default all) with NaN for unscored cells; needs NumPy."""
+        if np is None:
+            raise ImportError("numpy is required for ScoreMatrix.to_numpy(). Install with: pip install numpy")
+        rows = self._rows_for(keys)
+        n_cols = len(self._col_ids)
+        if self._numpy:
+            return self._data[rows, :n_cols].copy()
+        dense = np.full((len(rows), n_cols), np.nan)
+        for out_row, row in enumerate(rows):
+            values = self._rows[row]
+            dense[out_row, : len(values)] = values
+        return dense
+
+    # ------------------------------------------------------------------ state
+
+    def get_state(self) -> dict[str, dict[str, float]]:
+        """
+        Sparse JSON-serializable snapshot: ``{candidate: {example_id: score}}``.
+
+        Rows that did not change since the previous snapshot are returned as
+        the same dict objects, so checkpoint journals can skip them unread.
+        """
+        state = {}
+        for key in self._row_index:
+            row = self._row_state.get(key)
+            if row is None:
+                row = self._row_state[key] = self.scores(key)
+            state[key] = row
+        return state
+
+    def set_state(self, state: Mapping[str, Mapping[str, float]]) -> None:
+        """Add the scores of a snapshot produced by :meth:`get_state`."""
+        for key, row in state.items():
+            for example_id, score in row.items():
+                self.set(key, example_id, score)
+
+    # ------------------------------------------------------------------ internals
+
+    def _rows_for(self, keys: Iterable[str] | None) -> list[int]:
+        if keys is None:
+            return list(self._row_index.values())
+        return [self._row_index[key] for key in keys if key in self._row_index]
+
+    def _row(self, key: str) -> int:
+        row = self._row_index.get(key)
+        if row is not None:
+            return row
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = self._n_rows
+            self._n_rows += 1
+            if self._numpy:
+                if row >= self._data.shape[0]:
+                    self._grow(rows=2 * self._data.shape[0])
+            else:
+                self._rows.append([])
+        self._row_index[key] = row
+        return row
+
+    def _column(self, example_id: str) -> int:
+        col = self._col_index.get(example_id)
+        if col is not None:
+            return col
+        col = len(self._col_ids)
+        self._col_index[example_id] = col
+        self._col_ids.append(example_id)
+        if self._numpy and col >= self._data.shape[1]:
+            self._grow(cols=2 * self._data.shape[1])
+        return col
+
+    def _grow(self, rows: int | None = None, cols: int | None = None) -> None:
+        old_rows, old_cols = self._data.shape
+        grown = np.full((rows or old_rows, cols or old_cols), np.nan)
+        grown[:old_rows, :old_cols] = self._data
+        self._data = grown
@@ -11,6 +11,7 @@ import re
 from typing import Any
 
 from .interfaces import Candidate
+from .llm_backend import LiteLLMBackend, LLMBackend
 
 
 async def initialize_seeds_from_examples(
@@ -20,6 +21,7 @@ async def initialize_seeds_from_examples(
     reflection_lm: str,
     user_seed: str | None = None,
     reflection_lm_temperature: float | None = None,
+    backend: LLMBackend | None = None,
 ) -> list[Candidate]:
     """Generate optimized seed prompts from task examples using PROMPT-MII approach.
 
@@ -37,6 +39,7 @@ async def initialize_seeds_from_examples(
         reflection_lm: Model to use for spec induction
         user_seed: Optional user-provided seed to optimize/expand
         reflection_lm_temperature: Optional temperature for reflection LLM
+        backend: LLM backend to call (default: litellm)
 
     Returns:
         List of Candidate objects with generated seed prompts
@@ -54,10 +57,7 @@ async def initialize_seeds_from_examples(
         >>> print(seeds[0].text)
         # Structured prompt with TASK, OUTPUT_FORMAT, etc.
     """
-    try:
-        from litellm import acompletion
-    except ImportError:
-        raise ImportError("litellm required for seed initialization. Install with: pip install litellm")
+    backend = backend if backend is not None else LiteLLMBackend()
 
     # Build examples text
     examples_text = _format_examples_for_induction(examples[:5])  # Use up to 5 examples
@@ -78,7 +78,7 @@ async def initialize_seeds_from_examples(
     if reflection_lm_temperature is not None:
         completion_kwargs["temperature"] = reflection_lm_temperature
 
-    response = await acompletion(**completion_kwargs)
+    response = await backend.acompletion(**completion_kwargs)
     content = response.choices[0].message.content
 
     # Parse the generated specs
@@ -250,6 +250,7 @@ async def maybe_initialize_seeds(
     num_generated_seeds: int = 3,
     reflection_lm: str | None = None,
     reflection_lm_temperature: float | None = None,
+    backend: LLMBackend | None = None,
 ) -> list[Candidate]:
     """Optionally generate smart seeds from task examples, or use user-provided seeds.
 
@@ -260,6 +261,7 @@ async def maybe_initialize_seeds(
         num_generated_seeds: How many seeds to generate if initializing
         reflection_lm: Model for spec induction (required if enable_seed_initialization=True)
         reflection_lm_temperature: Optional temperature for reflection LLM
+        backend: LLM backend to call (default: litellm)
 
     Returns:
         List of Candidate objects (either user seeds or generated seeds)
@@ -335,6 +337,7 @@ async def maybe_initialize_seeds(
         reflection_lm=reflection_lm,
         user_seed=user_seed,
         reflection_lm_temperature=reflection_lm_temperature,
+        backend=backend,
     )
 
     return generated
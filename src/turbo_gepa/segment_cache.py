@@ -0,0 +1,169 @@
+"""
+Log-structured evaluation cache backend.
+
+Instead of one JSONL file per candidate, records are appended to a small number
+of large segment files. An in-memory offset index maps each
+(evaluation key, example ID) pair to ``(segment, offset, length)`` and is rebuilt
+on startup by scanning record headers, so lookups read only the bytes they need
+and no per-lookup ``mkdir``/``open`` is required.
+
+Segment lines have the layout ``<eval_key>\\t<json example_id>\\t<json record>\\n``;
+the two header fields let the index be rebuilt without decoding record bodies.
+The backend assumes a single writing process per cache directory.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import BinaryIO
+
+from .cache import DiskCache
+from .interfaces import EvalResult
+
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".log"
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+
+
+class SegmentCache(DiskCache):
+    """
+    Append-only segment store exposing the :class:`DiskCache` API.
+
+    Superseded records stay in their segment until :meth:`clear`; the index
+    always points at the most recent write for each key.
+    """
+
+    def __init__(self, cache_dir: str, *, segment_bytes: int = DEFAULT_SEGMENT_BYTES, **options) -> None:
+        super().__init__(cache_dir, **options)
+        self.segment_dir = self.cache_dir / "segments"
+        self.segment_bytes = max(1, int(segment_bytes))
+        self._index: dict[str, dict[str, tuple[int, int, int]]] = {}
+        self._io_lock = threading.Lock()
+        self._writer: BinaryIO | None = None
+        self._writer_id = 0
+        self._writer_offset = 0
+        self._readers: dict[int, BinaryIO] = {}
+        self._rebuild_index()
+
+    # Segment bookkeeping
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.segment_dir / f"{_SEGMENT_PREFIX}{segment_id:06d}{_SEGMENT_SUFFIX}"
+
+    def _segment_ids(self) -> list[int]:
+        if not self.segment_dir.exists():
+            return []
+        ids: list[int] = []
+        for path in self.segment_dir.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}"):
+            try:
+                ids.append(int(path.name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)]))
+            except ValueError:
+                continue
+        return sorted(ids)
+
+    def _rebuild_index(self) -> None:
+        """Scan segment headers to rebuild the offset index."""
+        segment_ids = self._segment_ids()
+        for segment_id in segment_ids:
+            path = self._segment_path(segment_id)
+            offset = 0
+            with path.open("rb") as handle:
+                for line in handle:
+                    length = len(line)
+                    if not line.endswith(b"\n"):
+                        # Torn write from a crash; drop the partial record
+                        logging.warning("Truncating partial cache record in %s at offset %d", path, offset)
+                        with path.open("r+b") as fixer:
+                            fixer.truncate(offset)
+                        break
+                    parts = line.split(b"\t", 2)
+                    if len(parts) == 3:
+                        cand_hash = parts[0].decode("utf-8")
+                        example_id = json.loads(parts[1])
+                        self._index.setdefault(cand_hash, {})[example_id] = (segment_id, offset, length)
+                    offset += length
+        if segment_ids:
+            self._writer_id = segment_ids[-1]
+            self._writer_offset = self._segment_path(self._writer_id).stat().st_size
+
+    def _ensure_writer(self) -> BinaryIO:
+        if self._writer is not None and self._writer_offset >= self.segment_bytes:
+            self._writer.close()
+            self._writer = None
+            self._writer_id += 1
+            self._writer_offset = 0
+        if self._writer is None:
+            self.segment_dir.mkdir(parents=True, exist_ok=True)
+            if self._writer_id == 0:
+                self._writer_id = 1
+            path = self._segment_path(self._writer_id)
+            self._writer = path.open("ab")
+            self._writer_offset = self._writer.tell()
+        return self._writer
+
+    def _read_span(self, segment_id: int, offset: int, length: int) -> bytes:
+        reader = self._readers.get(segment_id)
+        if reader is None:
+            reader = self._segment_path(segment_id).open("rb")
+            self._readers[segment_id] = reader
+        if hasattr(os, "pread"):
+            return os.pread(reader.fileno(), length, offset)
+        reader.seek(offset)
+        return reader.read(length)
+
+    # DiskCache storage hooks
+
+    def _has_stored(self, cand_hash: str) -> bool:
+        return cand_hash in self._index
+
+    def _load_stored(self, cand_hash: str) -> dict[str, EvalResult]:
+        records: dict[str, EvalResult] = {}
+        with self._io_lock:
+            entries = list(self._index.get(cand_hash, {}).items())
+            if self._writer is not None:
+                self._writer.flush()
+            spans = [(example_id, self._read_span(*location)) for example_id, location in entries]
+        for example_id, line in spans:
+            record = json.loads(line.split(b"\t", 2)[2])
+            record["example_id"] = example_id
+            records[example_id] = self._result_from_record(record)
+        return records
+
+    def _append_stored(self, cand_hash: str, records: list[dict[str, object]]) -> None:
+        key_bytes = cand_hash.encode("utf-8")
+        with self._io_lock:
+            for record in records:
+                example_id = record["example_id"]
+                line = b"\t".join(
+                    (key_bytes, json.dumps(example_id).encode("utf-8"), json.dumps(record).encode("utf-8"))
+                ) + b"\n"
+                writer = self._ensure_writer()
+                offset = self._writer_offset
+                writer.write(line)
+                self._writer_offset += len(line)
+                self._index.setdefault(cand_hash, {})[example_id] = (self._writer_id, offset, len(line))
+            if self._writer is not None:
+                self._writer.flush()
+
+    def close(self) -> None:
+        """Close open segment handles."""
+        with self._io_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            for reader in self._readers.values():
+                reader.close()
+            self._readers.clear()
+
+    def clear(self) -> None:
+        """Remove all segments and reset the index."""
+        self.close()
+        with self._io_lock:
+            self._index.clear()
+            self._writer_id = 0
+            self._writer_offset = 0
+        super().clear()
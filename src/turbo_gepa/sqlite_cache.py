@@ -0,0 +1,140 @@
+"""
+SQLite-backed evaluation cache.
+
+Stores one row per (evaluation key, example ID) in a WAL-mode database so
+several optimizer processes on the same machine can share evaluation results.
+WAL lets readers proceed while a writer commits, ``batch_set`` groups rows into
+a single transaction, and ``busy_timeout`` serialises competing writers instead
+of failing. Each worker thread uses its own connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+
+from .cache import DiskCache
+from .interfaces import Candidate, EvalResult
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS eval_records (
+    cand_key TEXT NOT NULL,
+    example_id TEXT NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (cand_key, example_id)
+) WITHOUT ROWID
+"""
+
+
+class SqliteCache(DiskCache):
+    """
+    :class:`DiskCache` implementation on top of a shared SQLite database.
+
+    Misses always consult the database (rather than a per-candidate snapshot)
+    so results written by other processes become visible immediately.
+    """
+
+    def __init__(self, cache_dir: str, *, busy_timeout_ms: int = 30_000, **options) -> None:
+        super().__init__(cache_dir, **options)
+        self.db_path = self.cache_dir / "eval_cache.sqlite3"
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._connection()  # Create schema eagerly so concurrent processes don't race on it
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            with conn:
+                conn.execute(_SCHEMA)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _fetch(self, cand_hash: str, example_id: str) -> EvalResult | None:
+        row = self._connection().execute(
+            "SELECT record FROM eval_records WHERE cand_key = ? AND example_id = ?",
+            (cand_hash, example_id),
+        ).fetchone()
+        if row is None:
+            return None
+        record = json.loads(row[0])
+        record["example_id"] = example_id
+        return self._result_from_record(record)
+
+    # DiskCache storage hooks
+
+    def _has_stored(self, cand_hash: str) -> bool:
+        row = self._connection().execute(
+            "SELECT 1 FROM eval_records WHERE cand_key = ? LIMIT 1",
+            (cand_hash,),
+        ).fetchone()
+        return row is not None
+
+    def _load_stored(self, cand_hash: str) -> dict[str, EvalResult]:
+        records: dict[str, EvalResult] = {}
+        rows = self._connection().execute(
+            "SELECT example_id, record FROM eval_records WHERE cand_key = ?",
+            (cand_hash,),
+        )
+        for example_id, payload in rows:
+            record = json.loads(payload)
+            record["example_id"] = example_id
+            records[example_id] = self._result_from_record(record)
+        return records
+
+    def _append_stored(self, cand_hash: str, records: list[dict[str, object]]) -> None:
+        self._insert_rows([(cand_hash, str(record["example_id"]), json.dumps(record)) for record in records])
+
+    def _insert_rows(self, rows: list[tuple[str, str, str]]) -> None:
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO eval_records (cand_key, example_id, record) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    # DiskCache API
+
+    async def get(self, candidate: Candidate, example_id: str, *, objectives_only: bool = False) -> EvalResult | None:
+        """Fetch a cached result, consulting the shared database on a local miss."""
+        cand_hash = self._record_key(candidate)
+        result = self._lookup_memory(cand_hash, example_id, objectives_only)
+        if result is not None:
+            return result
+        result = await asyncio.to_thread(self._fetch, cand_hash, example_id)
+        if result is not None:
+            self._remember(cand_hash, example_id, result)
+        return result
+
+    async def batch_set(self, writes: list[tuple[Candidate, str, EvalResult]]) -> None:
+        """Write all results in a single transaction."""
+        rows: list[tuple[str, str, str]] = []
+        for candidate, example_id, result in writes:
+            cand_hash = self._record_key(candidate)
+            rows.append((cand_hash, example_id, json.dumps(self._record_from_result(example_id, result))))
+            self._remember(cand_hash, example_id, self._clone_result(result, example_id))
+        if rows:
+            await asyncio.to_thread(self._insert_rows, rows)
+
+    def close(self) -> None:
+        """Close every connection opened by this cache."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def clear(self) -> None:
+        """Remove all cached records and the database files."""
+        self.close()
+        super().clear()
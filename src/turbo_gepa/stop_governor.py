@@ -14,7 +14,8 @@ It stops when all signals indicate plateau, with hysteresis to avoid premature s
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from typing import Any
 
 
 @dataclass
@@ -299,6 +300,45 @@ class StopGovernor:
         self.epochs_below_threshold = 0
         self.epochs_no_improvement = 0
 
+    def get_state(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot of the governor's history and smoothing state."""
+        return {
+            "epochs": [_epoch_to_dict(epoch) for epoch in self.epochs],
+            "prev_metrics": _epoch_to_dict(self.prev_metrics) if self.prev_metrics is not None else None,
+            "ewma_hv_rate": self.ewma_hv_rate,
+            "ewma_quality_delta": self.ewma_quality_delta,
+            "ewma_cost_delta": self.ewma_cost_delta,
+            "ewma_roi": self.ewma_roi,
+            "epochs_below_threshold": self.epochs_below_threshold,
+            "epochs_no_improvement": self.epochs_no_improvement,
+            "last_best_quality": self.last_best_quality,
+            "last_best_cost": self.last_best_cost,
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Restore a snapshot produced by :meth:`get_state`."""
+        self.epochs = [_epoch_from_dict(epoch) for epoch in state.get("epochs", [])]
+        prev = state.get("prev_metrics")
+        self.prev_metrics = _epoch_from_dict(prev) if prev is not None else None
+        self.ewma_hv_rate = state.get("ewma_hv_rate", 0.0)
+        self.ewma_quality_delta = state.get("ewma_quality_delta", 0.0)
+        self.ewma_cost_delta = state.get("ewma_cost_delta", 0.0)
+        self.ewma_roi = state.get("ewma_roi", 0.0)
+        self.epochs_below_threshold = state.get("epochs_below_threshold", 0)
+        self.epochs_no_improvement = state.get("epochs_no_improvement", 0)
+        self.last_best_quality = state.get("last_best_quality", 0.0)
+        self.last_best_cost = state.get("last_best_cost", float("-inf"))
+
+
+def _epoch_to_dict(epoch: EpochMetrics) -> dict[str, Any]:
+    data = asdict(epoch)
+    data["frontier_ids"] = sorted(epoch.frontier_ids)
+    return data
+
+
+def _epoch_from_dict(data: dict[str, Any]) -> EpochMetrics:
+    return EpochMetrics(**{**data, "frontier_ids": set(data.get("frontier_ids", ()))})
+
 
 def compute_hypervolume_2d(
     points: list[tuple[float, float]],
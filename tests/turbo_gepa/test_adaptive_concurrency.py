@@ -0,0 +1,159 @@
+"""
+Tests for the AIMD adaptive concurrency controller.
+
+These tests verify that:
+1. The limit grows by one per saturated, steady window and halves once per congestion event
+2. Wrapped provider errors are classified as rate limits, timeouts or plain errors
+3. Against a simulated rate-limited backend the limit converges under the provider's capacity
+   from both a too-high and a too-low start
+4. The orchestrator applies limit changes to its example queue live, even one supplied with the evaluator
+"""
+
+import asyncio
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from turbo_gepa.archive import Archive
+from turbo_gepa.cache import DiskCache
+from turbo_gepa.concurrency import AIMDController, classify_call_error
+from turbo_gepa.config import Config
+from turbo_gepa.evaluator import AsyncEvaluator
+from turbo_gepa.example_queue import ExampleQueue
+from turbo_gepa.interfaces import Candidate
+from turbo_gepa.orchestrator import Orchestrator
+from turbo_gepa.sampler import InstanceSampler
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def test_additive_increase_and_single_cut_per_congestion_event():
+    controller = AIMDController(8, window=10, maximum=12)
+    for _ in range(10):
+        controller.observe(1.0, in_use=8)
+    assert controller.limit == 9
+
+    for _ in range(10):  # Limit not reached: no reason to grow
+        controller.observe(1.0, in_use=3)
+    assert controller.limit == 9
+
+    for _ in range(10):  # Latency doubled: hold
+        controller.observe(2.0, in_use=9)
+    assert controller.limit == 9
+
+    assert controller.observe(1.0, "rate_limit", in_use=9)
+    assert controller.limit == 4
+    for _ in range(8):  # Failures of calls launched under the old limit are the same event
+        assert not controller.observe(1.0, "timeout")
+    assert controller.limit == 4 and controller.decreases == 1
+
+    with pytest.raises(ValueError, match="Unknown call outcome"):
+        controller.observe(1.0, "slow")
+
+
+def test_classify_wrapped_errors():
+    def wrapped(inner: BaseException) -> RuntimeError:
+        try:
+            try:
+                raise inner
+            except BaseException as exc:
+                raise RuntimeError("Task LLM call failed. This may indicate API rate limits.") from exc
+        except RuntimeError as outer:
+            return outer
+
+    assert classify_call_error(wrapped(RateLimitError("slow down"))) == "rate_limit"
+    assert classify_call_error(wrapped(asyncio.TimeoutError())) == "timeout"
+    assert classify_call_error(RuntimeError("Error code: 429 - Too Many Requests")) == "rate_limit"
+    assert classify_call_error(wrapped(ValueError("bad request"))) == "error"
+
+
+class SimulatedBackend:
+    """At most ``capacity`` concurrent calls; beyond ``knee`` the calls slow down, beyond capacity they get 429s."""
+
+    def __init__(self, capacity: int, knee: int, seed: int = 0) -> None:
+        self.capacity = capacity
+        self.knee = knee
+        self.running = 0
+        self.rejected = 0
+        self.calls = 0
+        self.rng = random.Random(seed)
+
+    async def call(self) -> None:
+        self.calls += 1
+        if self.running >= self.capacity:
+            await asyncio.sleep(0.0005)
+            self.rejected += 1
+            raise RateLimitError("429")
+        self.running += 1
+        try:
+            overload = max(0, self.running - self.knee)
+            await asyncio.sleep(0.001 * (1 + overload) * self.rng.uniform(0.8, 1.2))
+        finally:
+            self.running -= 1
+
+
+async def _drive(backend: SimulatedBackend, controller: AIMDController, calls: int) -> list[int]:
+    queue = ExampleQueue(controller.limit)
+    limits: list[int] = []
+
+    async def one() -> None:
+        async with queue.slot():
+            started = asyncio.get_running_loop().time()
+            try:
+                await backend.call()
+                outcome = "ok"
+            except Exception as exc:
+                outcome = classify_call_error(exc)
+            latency = asyncio.get_running_loop().time() - started
+            if controller.observe(latency, outcome, in_use=queue.busy):
+                queue.resize(controller.limit)
+            limits.append(controller.limit)
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+    return limits
+
+
+@pytest.mark.parametrize("initial", [40, 2])
+def test_converges_under_simulated_rate_limits(initial):
+    backend = SimulatedBackend(capacity=12, knee=10)
+    controller = AIMDController(initial, window=10, maximum=64)
+
+    limits = asyncio.run(_drive(backend, controller, 1500))
+
+    settled = limits[len(limits) // 2 :]
+    assert max(settled) <= backend.capacity + 2  # AIMD probes just past capacity, then cuts
+    assert 6 <= sum(settled) / len(settled) <= backend.capacity
+    assert backend.rejected < 0.05 * backend.calls
+    assert controller.decreases >= 1 if initial > backend.capacity else controller.increases >= 3
+
+
+@pytest.mark.parametrize("external_queue", [False, True])
+def test_orchestrator_applies_the_limit_live(tmp_path, external_queue):
+    cache = DiskCache(str(tmp_path))
+
+    async def task_runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        return {"quality": 1.0}
+
+    evaluator = AsyncEvaluator(cache=cache, task_runner=task_runner)
+    if external_queue:
+        evaluator.example_queue = ExampleQueue(16)
+    orchestrator = Orchestrator(
+        config=Config(eval_concurrency=16, shards=(0.5, 1.0), adaptive_concurrency=True),
+        evaluator=evaluator,
+        archive=Archive(bins_length=8, bins_bullets=6),
+        sampler=InstanceSampler(["ex1", "ex2"], seed=0),
+        mutator=Mock(),
+        cache=cache,
+        show_progress=False,
+    )
+    assert evaluator.call_observer == orchestrator._observe_call
+    assert orchestrator._effective_concurrency == 16
+
+    evaluator.call_observer(0.5, "rate_limit")
+    assert orchestrator._effective_concurrency == 8
+    assert orchestrator._example_queue.capacity == 8
+    assert evaluator.example_queue is orchestrator._example_queue  # Also when supplied with the evaluator
+    assert orchestrator.metrics.concurrency_limit == 8 and orchestrator.metrics.concurrency_decreases == 1
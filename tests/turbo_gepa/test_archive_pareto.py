@@ -0,0 +1,146 @@
+"""
+Tests for the archive's per-instance (GEPA-style) Pareto frontier.
+
+These tests verify that:
+1. Complementary candidates survive in instance mode while aggregate mode keeps only the best mean
+2. Candidates out-won on a superset of their examples are dropped, also after re-scoring
+3. The bitset frontier matches a brute-force computation and survives a state round-trip
+4. Partial-shard evaluations only compete on their aggregate
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from turbo_gepa.archive import Archive
+from turbo_gepa.interfaces import Candidate, EvalResult
+
+
+def _result(scores: dict[str, float], shard_fraction: float = 1.0) -> EvalResult:
+    return EvalResult(
+        objectives={"quality": sum(scores.values()) / len(scores)},
+        traces=[{"example_id": example_id, "quality": score} for example_id, score in scores.items()],
+        n_examples=len(scores),
+        shard_fraction=shard_fraction,
+        example_ids=list(scores),
+    )
+
+
+def _frontier(archive: Archive) -> set[str]:
+    return {entry.candidate.text for entry in archive.pareto_entries()}
+
+
+def test_instance_mode_keeps_complementary_candidates():
+    generalist = {"e0": 1.0, "e1": 1.0, "e2": 1.0, "e3": 0.0}
+    specialist = {"e0": 0.0, "e1": 0.0, "e2": 0.0, "e3": 1.0}
+    weaker = {"e0": 1.0, "e1": 0.0, "e2": 0.0, "e3": 0.0}
+
+    async def fill(archive: Archive) -> Archive:
+        for text, scores in (("generalist", generalist), ("specialist", specialist), ("weaker", weaker)):
+            await archive.insert(Candidate(text=text), _result(scores))
+        return archive
+
+    aggregate = asyncio.run(fill(Archive(bins_length=8, bins_bullets=6)))
+    instance = asyncio.run(fill(Archive(bins_length=8, bins_bullets=6, pareto_mode="instance")))
+
+    assert _frontier(aggregate) == {"generalist"}
+    # "weaker" only ties the generalist on e0, a subset of what the generalist wins
+    assert _frontier(instance) == {"generalist", "specialist"}
+    wins = {instance.pareto[key].candidate.text: count for key, count in instance.instance_wins().items()}
+    assert wins == {"generalist": 3, "specialist": 1}
+
+    with pytest.raises(ValueError, match="Unknown pareto mode"):
+        Archive(bins_length=8, bins_bullets=6, pareto_mode="per_example")
+
+
+def test_rescoring_a_winner_lower_rebuilds_its_examples():
+    async def scenario() -> Archive:
+        archive = Archive(bins_length=8, bins_bullets=6, pareto_mode="instance")
+        a, b = Candidate(text="a"), Candidate(text="b")
+        await archive.insert(a, _result({"e0": 1.0, "e1": 0.0}))
+        await archive.insert(b, _result({"e0": 0.5, "e1": 1.0}))
+        assert _frontier(archive) == {"a", "b"}
+        # A re-evaluation of "a" scores e0 lower than "b" did: "b" now wins everything
+        await archive.insert(a, _result({"e0": 0.0, "e1": 0.0}))
+        return archive
+
+    assert _frontier(asyncio.run(scenario())) == {"b"}
+
+
+def test_rescoring_a_winner_lower_brings_back_the_runner_up():
+    async def scenario() -> Archive:
+        archive = Archive(bins_length=8, bins_bullets=6, pareto_mode="instance")
+        a, b = Candidate(text="a"), Candidate(text="b")
+        await archive.insert(a, _result({"e0": 1.0, "e1": 1.0}))
+        await archive.insert(b, _result({"e0": 0.9, "e1": 0.0}))
+        assert _frontier(archive) == {"a"}
+        # "b" now has the best e0 score left, so it returns to the frontier
+        await archive.insert(a, _result({"e0": 0.0, "e1": 1.0}))
+        return archive
+
+    archive = asyncio.run(scenario())
+    assert _frontier(archive) == {"a", "b"}
+    wins = {archive.pareto[key].candidate.text: count for key, count in archive.instance_wins().items()}
+    assert wins == {"a": 1, "b": 1}
+
+
+def test_bitset_frontier_matches_brute_force_and_round_trips():
+    rng = random.Random(7)
+    examples = [f"e{i}" for i in range(30)]
+    inserted: dict[str, dict[str, float]] = {}
+
+    async def scenario() -> Archive:
+        archive = Archive(bins_length=8, bins_bullets=6, pareto_mode="instance")
+        for i in range(60):
+            scores = {ex: rng.choice([0.0, 0.5, 1.0]) for ex in rng.sample(examples, rng.randint(5, 30))}
+            inserted[f"c{i}"] = scores
+            await archive.insert(Candidate(text=f"c{i}"), _result(scores))
+        # Re-score some candidates on the same examples, lowering winners and raising runners-up
+        for c in rng.sample(sorted(inserted), 20):
+            scores = {ex: rng.choice([0.0, 0.5, 1.0]) for ex in inserted[c]}
+            inserted[c] = scores
+            await archive.insert(Candidate(text=c), _result(scores))
+        return archive
+
+    archive = asyncio.run(scenario())
+
+    # Brute force: per-column winners (aggregate included), then drop candidates out-won by a kept one
+    columns = {ex: {c: s[ex] for c, s in inserted.items() if ex in s} for ex in examples}
+    columns[""] = {c: sum(s.values()) / len(s) for c, s in inserted.items()}
+    wins: dict[str, set[str]] = {}
+    for column, scores in columns.items():
+        if scores:
+            best = max(scores.values())
+            for c, score in scores.items():
+                if score == best:
+                    wins.setdefault(c, set()).add(column)
+    order = sorted(wins, key=lambda c: (-len(wins[c]), int(c[1:])))  # Equal win sets: the older one stays
+    kept: list[str] = []
+    for c in order:
+        if not any(wins[c] <= wins[k] for k in kept):
+            kept.append(c)
+
+    assert _frontier(archive) == set(kept)
+    assert len(kept) > 1
+
+    restored = Archive(bins_length=8, bins_bullets=6, pareto_mode="instance")
+    restored.set_state(archive.get_state())
+    assert _frontier(restored) == _frontier(archive)
+    assert restored.instance_wins() == archive.instance_wins()
+
+
+def test_partial_shards_do_not_claim_examples():
+    async def scenario() -> Archive:
+        archive = Archive(bins_length=8, bins_bullets=6, pareto_mode="instance")
+        await archive.insert(Candidate(text="full"), _result({"e0": 1.0, "e1": 1.0, "e2": 0.0}))
+        # Best on e2, but only on a shard nobody else was compared on
+        await archive.insert(Candidate(text="lucky"), _result({"e2": 1.0, "e3": 0.0}, shard_fraction=0.25))
+        assert _frontier(archive) == {"full"}
+        await archive.insert(Candidate(text="lucky"), _result({"e0": 0.0, "e1": 0.0, "e2": 1.0}))
+        return archive
+
+    archive = asyncio.run(scenario())
+    assert _frontier(archive) == {"full", "lucky"}
+    wins = {archive.pareto[key].candidate.text: count for key, count in archive.instance_wins().items()}
+    assert wins == {"full": 2, "lucky": 1}
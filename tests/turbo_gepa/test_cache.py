@@ -0,0 +1,423 @@
+"""
+Tests for the evaluation cache.
+
+These tests verify that:
+1. Cached results survive orchestrator metadata rewrites (promotion)
+2. Fields that change model output produce distinct cache keys
+3. Candidate fingerprints are memoized and unchanged by the flat-meta fast path
+4. The evaluator reports cross-rung cache reuse
+5. The segment backend round-trips records and rebuilds its index on reopen
+6. The SQLite backend shares results between independent cache instances
+7. The in-memory index respects its memory budget (LRU or trace-only eviction)
+8. Write-behind buffering serves reads before flushing, survives flush errors and persists on close
+9. The binary backend decodes traces lazily and reads/migrates legacy JSONL caches
+   (shard results, the scheduler, score matrix and archive read scores without decoding)
+10. Namespaced caches share one directory without reading each other's records
+"""
+
+import asyncio
+
+import pytest
+
+from turbo_gepa.binary_cache import BinaryCache
+from turbo_gepa.cache import DiskCache, cache_namespace, create_cache, evaluation_key
+from turbo_gepa.evaluator import AsyncEvaluator
+from turbo_gepa.interfaces import Candidate, EvalResult
+from turbo_gepa.metrics import Metrics
+from turbo_gepa.segment_cache import SegmentCache
+from turbo_gepa.sqlite_cache import SqliteCache
+
+
+def _result(quality: float, example_id: str, shard_fraction: float | None = None) -> EvalResult:
+    return EvalResult(
+        objectives={"quality": quality},
+        traces=[{"example_id": example_id, "quality": quality}],
+        n_examples=1,
+        shard_fraction=shard_fraction,
+        example_ids=[example_id],
+    )
+
+
+def test_evaluation_key_ignores_bookkeeping_meta():
+    base = Candidate(text="Solve it.", meta={"source": "seed"})
+    promoted = base.with_meta(quality=0.8, quality_shard_fraction=0.05, _sched_key=base.fingerprint)
+
+    assert base.fingerprint != promoted.fingerprint
+    assert evaluation_key(base) == evaluation_key(promoted)
+
+
+def test_evaluation_key_tracks_output_affecting_fields():
+    base = Candidate(text="Solve it.", meta={})
+
+    assert evaluation_key(base) != evaluation_key(base.with_meta(temperature=0.5))
+    assert evaluation_key(base) != evaluation_key(base.with_meta(reasoning_effort="high"))
+    assert evaluation_key(base) != evaluation_key(Candidate(text="Solve it carefully.", meta={}))
+
+
+def test_fingerprint_is_memoized_and_stable():
+    flat = Candidate(text="Solve it.", meta={"source": "seed"})
+    spaced = Candidate(
+        text="  spaced   text\n\nhere ",
+        meta={"a": "x  y\n z", "b": 1, "c": 2.5, "d": True, "e": None, "_sched_key": "abc"},
+    )
+    nested = Candidate(text="Solve it.", meta={"nested": {"b": " q  r", "a": [1, "x  y"]}, "s": {"b", "a"}})
+
+    # Values computed before memoization; the flat-meta fast path must not change them
+    assert flat.fingerprint == "f89efea50ff33a1d"
+    assert spaced.fingerprint == "7f077925f5cf6c21"
+    assert nested.fingerprint == "42818ac9cc59b950"
+    assert spaced.fingerprint == Candidate(text="spaced text here", meta={**spaced.meta, "a": "x y z"}).fingerprint
+    assert flat.fingerprint is flat.fingerprint
+    assert flat.eval_key is flat.eval_key
+
+
+def test_cache_hit_after_meta_rewrite(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    seed = Candidate(text="Solve it.", meta={"source": "seed"})
+
+    asyncio.run(cache.set(seed, "ex1", _result(1.0, "ex1", shard_fraction=0.05)))
+    promoted = seed.with_meta(quality=1.0, quality_shard_fraction=0.05, _sched_key=seed.fingerprint)
+
+    # Fresh cache instance forces a disk read rather than the in-memory index
+    reopened = DiskCache(str(tmp_path))
+    cached = asyncio.run(reopened.get(promoted, "ex1"))
+    assert cached is not None
+    assert cached.objectives["quality"] == 1.0
+
+
+def test_evaluator_counts_cross_rung_reuse(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    calls: list[str] = []
+
+    async def task_runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        calls.append(example_id)
+        return {"quality": 1.0}
+
+    metrics = Metrics()
+    evaluator = AsyncEvaluator(cache=cache, task_runner=task_runner, metrics=metrics)
+    seed = Candidate(text="Solve it.", meta={})
+
+    promoted = seed.with_meta(quality=1.0, quality_shard_fraction=0.2, _sched_key=seed.fingerprint)
+
+    async def run() -> None:
+        await evaluator.eval_on_shard(seed, ["ex1", "ex2"], concurrency=2, shard_fraction=0.2)
+        await evaluator.eval_on_shard(promoted, ["ex1", "ex2", "ex3", "ex4"], concurrency=2, shard_fraction=1.0)
+
+    asyncio.run(run())
+
+    assert sorted(calls) == ["ex1", "ex2", "ex3", "ex4"]
+    assert metrics.cache_hits == 2
+    assert metrics.cache_cross_rung_hits == 2
+
+
+def test_create_cache_selects_backend(tmp_path):
+    assert type(create_cache(str(tmp_path / "a"))) is DiskCache
+    assert isinstance(create_cache(str(tmp_path / "b"), "segment"), SegmentCache)
+    assert isinstance(create_cache(str(tmp_path / "d"), "sqlite"), SqliteCache)
+    assert isinstance(create_cache(str(tmp_path / "e"), "binary"), BinaryCache)
+    with pytest.raises(ValueError):
+        create_cache(str(tmp_path / "c"), "nope")
+
+
+def test_segment_cache_round_trip_and_reopen(tmp_path):
+    cache = SegmentCache(str(tmp_path), segment_bytes=256)
+    candidates = [Candidate(text=f"prompt {i}") for i in range(5)]
+
+    async def write() -> None:
+        for cand in candidates:
+            await cache.batch_set([(cand, f"ex{j}", _result(j / 10, f"ex{j}", 0.2)) for j in range(4)])
+        # Later writes supersede earlier ones for the same key
+        await cache.set(candidates[0], "ex0", _result(0.9, "ex0", 1.0))
+
+    asyncio.run(write())
+    cache.close()
+
+    # Many records but only a handful of files
+    segments = list((tmp_path / "segments").iterdir())
+    assert 1 < len(segments) < 20
+
+    reopened = SegmentCache(str(tmp_path), segment_bytes=256)
+    first = asyncio.run(reopened.get(candidates[0], "ex0"))
+    assert first is not None and first.objectives["quality"] == 0.9
+    assert first.shard_fraction == 1.0
+    last = asyncio.run(reopened.get(candidates[4], "ex3"))
+    assert last is not None and last.objectives["quality"] == 0.3
+    assert asyncio.run(reopened.get(Candidate(text="unknown"), "ex0")) is None
+    reopened.close()
+
+
+def test_segment_cache_drops_torn_tail(tmp_path):
+    cache = SegmentCache(str(tmp_path))
+    cand = Candidate(text="prompt")
+    asyncio.run(cache.set(cand, "ex1", _result(1.0, "ex1")))
+    cache.close()
+
+    segment = next((tmp_path / "segments").iterdir())
+    with segment.open("ab") as handle:
+        handle.write(b"partial\t\"ex2\"\t{")
+
+    reopened = SegmentCache(str(tmp_path))
+    assert asyncio.run(reopened.get(cand, "ex1")) is not None
+    assert asyncio.run(reopened.get(cand, "ex2")) is None
+
+    async def append() -> None:
+        await reopened.set(cand, "ex2", _result(0.0, "ex2"))
+
+    asyncio.run(append())
+    reopened.close()
+    again = SegmentCache(str(tmp_path))
+    assert asyncio.run(again.get(cand, "ex2")) is not None
+    again.clear()
+    assert not (tmp_path / "segments").exists()
+
+
+def test_sqlite_cache_shared_between_instances(tmp_path):
+    writer = SqliteCache(str(tmp_path))
+    reader = SqliteCache(str(tmp_path))
+    cand = Candidate(text="prompt")
+
+    async def scenario() -> None:
+        await writer.batch_set([(cand, f"ex{i}", _result(i / 10, f"ex{i}", 0.2)) for i in range(3)])
+        first = await reader.get(cand, "ex1")
+        assert first is not None and first.objectives["quality"] == 0.1
+        # Rows written after the reader has touched this candidate are still visible
+        await writer.set(cand, "ex9", _result(1.0, "ex9", 1.0))
+        late = await reader.get(cand, "ex9")
+        assert late is not None and late.shard_fraction == 1.0
+        assert await reader.get(cand, "missing") is None
+
+    asyncio.run(scenario())
+    mode = writer._connection().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+    reader.close()
+    writer.clear()
+    assert not (tmp_path / "eval_cache.sqlite3").exists()
+
+
+def _traced_result(quality: float, example_id: str) -> EvalResult:
+    return EvalResult(
+        objectives={"quality": quality},
+        traces=[{"example_id": example_id, "quality": quality, "output": "x" * 4000}],
+        n_examples=1,
+        example_ids=[example_id],
+    )
+
+
+def test_memory_budget_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(str(tmp_path), memory_budget_bytes=30_000)
+    candidates = [Candidate(text=f"prompt {i}") for i in range(4)]
+
+    async def scenario() -> None:
+        for cand in candidates[:3]:
+            await cache.batch_set([(cand, f"ex{j}", _traced_result(1.0, f"ex{j}")) for j in range(2)])
+        # Touch the oldest candidate so the second one becomes least recently used
+        assert await cache.get(candidates[0], "ex0") is not None
+        await cache.batch_set([(candidates[3], f"ex{j}", _traced_result(1.0, f"ex{j}")) for j in range(2)])
+
+        assert evaluation_key(candidates[0]) in cache._record_cache
+        assert evaluation_key(candidates[1]) not in cache._record_cache
+        assert cache.memory_stats()["resident_bytes"] <= 30_000
+        # Evicted candidates reload from disk on the next miss
+        reloaded = await cache.get(candidates[1], "ex1")
+        assert reloaded is not None and reloaded.traces[0]["output"] == "x" * 4000
+
+    asyncio.run(scenario())
+    stats = cache.memory_stats()
+    assert stats["evictions"] >= 2
+    assert stats["hits"] >= 1 and stats["misses"] >= 1
+
+    metrics = Metrics()
+    metrics.record_cache_memory(stats)
+    assert metrics.cache_evictions == stats["evictions"]
+
+
+def test_memory_budget_trace_only_keeps_objectives(tmp_path):
+    cache = create_cache(str(tmp_path), "segment", memory_budget_bytes=15_000, evict_traces_only=True)
+    candidates = [Candidate(text=f"prompt {i}") for i in range(4)]
+
+    async def scenario() -> None:
+        for cand in candidates:
+            await cache.batch_set([(cand, f"ex{j}", _traced_result(0.5, f"ex{j}")) for j in range(2)])
+        # All candidates stay resident; the oldest ones lost their trace text only
+        assert len(cache._record_cache) == 4
+        slim = await cache.get(candidates[0], "ex1", objectives_only=True)
+        assert slim is not None
+        assert slim.objectives["quality"] == 0.5
+        assert slim.traces == [{"example_id": "ex1", "quality": 0.5}]
+        # Callers that need traces never see the slimmed entry; it is reloaded from storage
+        reloaded = await cache.get(candidates[0], "ex1")
+        assert reloaded is not None and reloaded.traces[0]["output"] == "x" * 4000
+        full = await cache.get(candidates[3], "ex1")
+        assert full is not None and "output" in full.traces[0]
+
+    asyncio.run(scenario())
+    stats = cache.memory_stats()
+    assert stats["evictions"] == 0
+    assert stats["trace_evictions"] >= 2
+    assert stats["resident_bytes"] <= 15_000
+    cache.close()
+
+
+def test_evaluator_write_behind_buffers_and_flushes(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    calls: list[str] = []
+
+    async def task_runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        calls.append(example_id)
+        return {"quality": 1.0}
+
+    evaluator = AsyncEvaluator(
+        cache=cache, task_runner=task_runner, write_behind_records=3, write_behind_interval=60.0
+    )
+    cand = Candidate(text="Solve it.")
+
+    async def run() -> None:
+        await evaluator.eval_on_shard(cand, ["ex1", "ex2"], concurrency=2)
+        # Below the record threshold nothing has reached the cache yet...
+        assert evaluator.pending_writes == 2
+        assert not list(tmp_path.rglob("*.jsonl"))
+        # ...but buffered results still count as cache hits
+        await evaluator.eval_on_shard(cand, ["ex1", "ex2"], concurrency=2)
+        assert sorted(calls) == ["ex1", "ex2"]
+        # Reaching the threshold flushes inline
+        await evaluator.eval_on_shard(cand, ["ex3"], concurrency=1)
+        assert evaluator.pending_writes == 0
+        await evaluator.eval_on_shard(cand, ["ex4"], concurrency=1)
+        assert evaluator.pending_writes == 1
+        await evaluator.close()
+        assert evaluator.pending_writes == 0
+
+    asyncio.run(run())
+    reopened = DiskCache(str(tmp_path))
+    for example_id in ("ex1", "ex2", "ex3", "ex4"):
+        assert asyncio.run(reopened.get(cand, example_id)) is not None
+
+
+def test_evaluator_write_behind_flush_failure_keeps_scores(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    real_batch_set = cache.batch_set
+    failures = [RuntimeError("disk full")]
+
+    async def flaky_batch_set(writes):
+        if failures:
+            raise failures.pop()
+        await real_batch_set(writes)
+
+    cache.batch_set = flaky_batch_set
+
+    async def task_runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        return {"quality": 1.0}
+
+    evaluator = AsyncEvaluator(
+        cache=cache, task_runner=task_runner, write_behind_records=1, write_behind_interval=60.0
+    )
+    cand = Candidate(text="Solve it.")
+
+    async def run() -> None:
+        # The inline flush fails, but the example keeps its real score and stays buffered
+        result = await evaluator.eval_on_shard(cand, ["ex1"], concurrency=1)
+        assert result.objectives["quality"] == 1.0
+        assert evaluator.pending_writes == 1
+        await evaluator.close()
+        assert evaluator.pending_writes == 0
+
+    asyncio.run(run())
+    assert asyncio.run(DiskCache(str(tmp_path)).get(cand, "ex1")) is not None
+
+
+def test_binary_cache_lazy_traces_and_legacy_jsonl(tmp_path):
+    legacy = DiskCache(str(tmp_path))
+    cand = Candidate(text="prompt")
+    asyncio.run(legacy.batch_set([(cand, f"ex{i}", _traced_result(i / 10, f"ex{i}")) for i in range(3)]))
+
+    async def scenario(cache: BinaryCache) -> None:
+        # Legacy JSONL records are readable; new writes go to the binary file and win
+        assert (await cache.get(cand, "ex1")).objectives["quality"] == 0.1
+        await cache.set(cand, "ex1", _traced_result(0.9, "ex1"))
+        await cache.set(cand, "ex5", EvalResult(objectives={"quality": 1.0, "label": "ok"}, traces=[], n_examples=1))
+
+    asyncio.run(scenario(BinaryCache(str(tmp_path))))
+
+    reopened = BinaryCache(str(tmp_path))
+    first = asyncio.run(reopened.get(cand, "ex1"))
+    assert first.objectives == {"quality": 0.9}
+    assert first.shard_fraction is None
+    assert not first.traces_decoded  # Scores are readable without decoding traces
+    undecoded_bytes = reopened.memory_stats()["resident_bytes"]
+    assert first.traces[0]["output"] == "x" * 4000
+    # Decoding is charged to the memory budget
+    assert reopened.memory_stats()["resident_bytes"] > undecoded_bytes
+    assert reopened.memory_stats()["resident_bytes"] == sum(
+        reopened._approx_result_bytes(r) for r in reopened._record_cache[reopened._record_key(cand)].values()
+    )
+    assert asyncio.run(reopened.get(cand, "ex5")).objectives == {"quality": 1.0, "label": "ok"}
+
+    assert reopened.migrate() == 1
+    assert not list(tmp_path.rglob("*.jsonl"))
+    migrated = BinaryCache(str(tmp_path))
+    results = {eid: asyncio.run(migrated.get(cand, eid)) for eid in ("ex0", "ex1", "ex2")}
+    assert {eid: r.objectives["quality"] for eid, r in results.items()} == {"ex0": 0.0, "ex1": 0.9, "ex2": 0.2}
+
+    # A torn tail is dropped and later appends stay readable
+    binary = next(tmp_path.rglob("*.bin"))
+    with binary.open("ab") as handle:
+        handle.write(b"\xff\x00\x00\x00partial")
+    torn = BinaryCache(str(tmp_path))
+    asyncio.run(torn.set(cand, "ex7", _result(0.7, "ex7")))
+    assert asyncio.run(BinaryCache(str(tmp_path)).get(cand, "ex7")).objectives["quality"] == 0.7
+
+
+def test_binary_cache_scores_cached_shards_without_decoding_traces(tmp_path):
+    from turbo_gepa.archive import Archive
+    from turbo_gepa.scheduler import BudgetedScheduler, SchedulerConfig
+    from turbo_gepa.score_matrix import ScoreMatrix
+
+    cand = Candidate(text="prompt")
+    examples = [f"ex{i}" for i in range(4)]
+
+    async def task_runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        return {"quality": 1.0 if example_id in ("ex0", "ex1") else 0.0, "output": "x" * 1000}
+
+    def evaluator(cache: BinaryCache) -> AsyncEvaluator:
+        return AsyncEvaluator(cache, task_runner, metrics_mapper=lambda metrics: {"quality": metrics["quality"]})
+
+    asyncio.run(evaluator(BinaryCache(str(tmp_path))).eval_on_shard(cand, examples, concurrency=2))
+
+    cache = BinaryCache(str(tmp_path))
+    result = asyncio.run(evaluator(cache).eval_on_shard(cand, examples, concurrency=2, shard_fraction=1.0))
+    records = cache._record_cache[cache._record_key(cand)]
+    assert result.example_errors() == {}
+    assert result.example_scores("quality") == {"ex0": 1.0, "ex1": 1.0, "ex2": 0.0, "ex3": 0.0}
+    assert ScoreMatrix(examples).record("a", result) == 4
+    scheduler = BudgetedScheduler(SchedulerConfig(shards=[1.0], eps_improve=0.01, quantile=0.6, paired_min_examples=2))
+    assert scheduler.paired_delta(result, {"ex0": 0.0, "ex1": 0.0}, "quality") == (1.0, 2)
+    archive = Archive(bins_length=4, bins_bullets=4, pareto_mode="instance")
+    asyncio.run(archive.insert(cand, result))
+    assert not any(record.traces_decoded for record in records.values())
+
+    # Reading the shard's traces decodes the records, in example order
+    assert [trace["example_id"] for trace in result.traces] == examples
+    assert all(record.traces_decoded for record in records.values())
+
+
+def test_namespaced_caches_share_directory_without_collisions(tmp_path):
+    shared = str(tmp_path / "shared")
+    cand = Candidate(text="prompt")
+    model_a = cache_namespace("model-a", 0.0, 1024, "1")
+    model_b = cache_namespace("model-b", 0.0, 1024, "1")
+    assert model_a != cache_namespace("model-a", 0.0, 2048, "1")
+
+    writer = create_cache(shared, "jsonl", namespace=model_a, state_dir=str(tmp_path / "run_a"))
+    asyncio.run(writer.set(cand, "ex1", _result(1.0, "ex1")))
+    writer.save_state(1, 1, [], [], [])
+
+    # Another run with the same model and metric reuses the record ...
+    same = create_cache(shared, "jsonl", namespace=model_a, state_dir=str(tmp_path / "run_b"))
+    assert asyncio.run(same.get(cand, "ex1")).objectives["quality"] == 1.0
+    assert list(asyncio.run(same.preload([cand]))[evaluation_key(cand)]) == ["ex1"]
+    # ... but keeps its own resume state
+    assert not same.has_state() and writer.has_state()
+
+    # A different model never sees it, nor does an un-namespaced cache
+    assert asyncio.run(create_cache(shared, "jsonl", namespace=model_b).get(cand, "ex1")) is None
+    assert asyncio.run(DiskCache(shared).get(cand, "ex1")) is None
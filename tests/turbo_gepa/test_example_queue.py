@@ -0,0 +1,134 @@
+"""
+Tests for the global example-level work queue.
+
+These tests verify that:
+1. Slots are handed out by priority, then arrival order, never beyond capacity
+2. Cancelled waiters neither leak nor strand slots
+3. Concurrent evaluations share one pool and the higher-priority call runs first
+"""
+
+import asyncio
+
+import pytest
+
+from turbo_gepa.cache import DiskCache
+from turbo_gepa.evaluator import AsyncEvaluator
+from turbo_gepa.example_queue import ExampleQueue
+from turbo_gepa.interfaces import Candidate
+
+
+@pytest.mark.asyncio
+async def test_dispatch_order_and_capacity():
+    queue = ExampleQueue(2)
+    order: list[str] = []
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def job(name: str, priority: tuple[float, ...]) -> None:
+        nonlocal running, peak
+        async with queue.slot(priority):
+            order.append(name)
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+    tasks = [asyncio.create_task(job("first", (0.0,))), asyncio.create_task(job("second", (0.0,)))]
+    await asyncio.sleep(0)
+    tasks += [
+        asyncio.create_task(job("low-a", (1.0,))),
+        asyncio.create_task(job("high", (-1.0,))),
+        asyncio.create_task(job("low-b", (1.0,))),
+    ]
+    await asyncio.sleep(0)
+    assert queue.busy == 2 and queue.waiting == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == ["first", "second", "high", "low-a", "low-b"]
+    assert peak == 2
+    assert queue.busy == 0 and queue.waiting == 0
+    assert queue.stats()["dispatched"] == 5
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_release_cleanly():
+    queue = ExampleQueue(1)
+    hold = asyncio.Event()
+
+    async def holder() -> None:
+        async with queue.slot():
+            await hold.wait()
+
+    async def waiter() -> str:
+        async with queue.slot():
+            return "ran"
+
+    first = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(waiter())
+    survivor = asyncio.create_task(waiter())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert queue.waiting == 1
+
+    hold.set()
+    assert await survivor == "ran"
+    await first
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert queue.busy == 0 and queue.waiting == 0
+
+    # A waiter cancelled right after being handed a slot passes it on
+    hold.clear()
+    first = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    handed = asyncio.create_task(waiter())
+    survivor = asyncio.create_task(waiter())
+    await asyncio.sleep(0)
+    hold.set()
+    await asyncio.sleep(0)  # The holder exits and hands its slot over
+    handed.cancel()
+    assert await survivor == "ran"
+    with pytest.raises(asyncio.CancelledError):
+        await handed
+    await first
+    assert queue.busy == 0
+
+
+@pytest.mark.asyncio
+async def test_evaluations_share_the_pool_by_priority(tmp_path):
+    queue = ExampleQueue(2)
+    running = 0
+    peak = 0
+    started: list[str] = []
+
+    async def task_runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        nonlocal running, peak
+        started.append(candidate.text)
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"quality": 1.0}
+
+    evaluator = AsyncEvaluator(DiskCache(str(tmp_path)), task_runner, example_queue=queue)
+    examples = [f"ex{i}" for i in range(4)]
+    blocker = asyncio.create_task(
+        evaluator.eval_on_shard(Candidate(text="blocker"), examples[:2], concurrency=4, priority=(0.0,))
+    )
+    await asyncio.sleep(0)
+    low = asyncio.create_task(
+        evaluator.eval_on_shard(Candidate(text="low"), examples, concurrency=4, priority=(1.0,))
+    )
+    high = asyncio.create_task(
+        evaluator.eval_on_shard(Candidate(text="high"), examples, concurrency=4, priority=(-1.0,))
+    )
+    results = await asyncio.gather(blocker, low, high)
+
+    assert [result.n_examples for result in results] == [2, 4, 4]
+    assert peak == 2
+    assert started[2:6] == ["high"] * 4
+    assert queue.stats()["busy_seconds"] > 0
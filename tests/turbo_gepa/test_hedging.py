@@ -0,0 +1,85 @@
+"""
+Tests for hedged task calls in the async evaluator.
+
+These tests verify that:
+1. A straggling call gets a duplicate request, the first reply wins and the loser is cancelled
+2. Every example of the shard is still scored (stragglers are hedged, not abandoned)
+3. Hedges never exceed the configured fraction of task calls
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from turbo_gepa.cache import DiskCache
+from turbo_gepa.evaluator import AsyncEvaluator
+from turbo_gepa.interfaces import Candidate
+from turbo_gepa.metrics import Metrics
+
+
+@pytest.mark.asyncio
+async def test_straggler_is_hedged_and_loser_cancelled(tmp_path):
+    calls: dict[str, int] = {}
+    cancelled: list[str] = []
+
+    async def runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        calls[example_id] = calls.get(example_id, 0) + 1
+        try:
+            # The first request for "slow" hangs; its duplicate answers like every other call
+            await asyncio.sleep(5.0 if example_id == "slow" and calls[example_id] == 1 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(example_id)
+            raise
+        return {"quality": 1.0}
+
+    evaluator = AsyncEvaluator(
+        cache=DiskCache(str(tmp_path)),
+        task_runner=runner,
+        hedge_percentile=0.9,
+        hedge_budget=0.5,
+        hedge_min_samples=5,
+    )
+    evaluator.metrics = Metrics()
+    warmup = [f"w{i}" for i in range(6)]
+    await evaluator.eval_on_shard(Candidate(text="p"), warmup, concurrency=6)
+
+    started = time.perf_counter()
+    examples = [f"e{i}" for i in range(9)] + ["slow"]
+    result = await evaluator.eval_on_shard(Candidate(text="p"), examples, concurrency=10)
+
+    assert time.perf_counter() - started < 1.0
+    assert sorted(result.example_ids) == sorted(examples)
+    assert result.objectives["quality"] == 1.0
+    assert calls["slow"] == 2 and cancelled == ["slow"]
+    assert evaluator.hedges_won == 1
+    assert evaluator.metrics.hedges_launched == evaluator.hedges_launched >= 1
+    assert evaluator.metrics.hedges_won == 1
+
+
+@pytest.mark.asyncio
+async def test_hedges_are_capped_by_budget(tmp_path):
+    calls = 0
+
+    async def runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        nonlocal calls
+        calls += 1
+        # Every fourth request is slow, so far more calls straggle than the budget allows
+        await asyncio.sleep(0.1 if calls % 4 == 0 else 0.005)
+        return {"quality": 0.5}
+
+    evaluator = AsyncEvaluator(
+        cache=DiskCache(str(tmp_path)),
+        task_runner=runner,
+        hedge_percentile=0.5,
+        hedge_budget=0.1,
+        hedge_min_samples=5,
+    )
+    result = await evaluator.eval_on_shard(Candidate(text="p"), [f"e{i}" for i in range(60)], concurrency=8)
+
+    assert result.n_examples == 60
+    assert 1 <= evaluator.hedges_launched <= 0.1 * 60
+    assert calls == 60 + evaluator.hedges_launched
+
+    with pytest.raises(ValueError, match="hedge_percentile"):
+        AsyncEvaluator(cache=DiskCache(str(tmp_path)), task_runner=runner, hedge_percentile=95)
@@ -0,0 +1,120 @@
+"""
+Tests for the pluggable LLM backend and the in-process simulator.
+
+These tests verify that:
+1. Simulated correctness is deterministic per (prompt, example) and follows the accuracy function
+2. Injected 429s, errors and the concurrency cap surface as rate-limit / provider errors
+3. Prompt-generating calls answer in the format each caller parses
+4. DefaultAdapter and seed initialization run end to end on the simulator, with no network
+"""
+
+import asyncio
+
+import pytest
+
+from turbo_gepa.adapters.default_adapter import DefaultAdapter, DefaultDataInst
+from turbo_gepa.concurrency import classify_call_error
+from turbo_gepa.config import Config
+from turbo_gepa.llm_backend import LLMBackend, SimulatedAPIError, SimulatedBackend, SimulatedRateLimitError
+from turbo_gepa.seed_initializer import maybe_initialize_seeds
+
+
+def _task(prompt: str, question: str) -> dict:
+    return {"model": "sim", "messages": [{"role": "system", "content": prompt}, {"role": "user", "content": question}]}
+
+
+def test_correctness_is_deterministic_and_follows_accuracy():
+    questions = [f"q{i}" for i in range(200)]
+    backend = SimulatedBackend(
+        answers={q: f"A{q}" for q in questions},
+        accuracy=lambda prompt, example: 0.9 if "good" in prompt else 0.2,
+    )
+    assert isinstance(backend, LLMBackend)
+
+    async def accuracy(prompt: str) -> float:
+        replies = [await backend.acompletion(**_task(prompt, q)) for q in questions]
+        return sum(f"A{q}" in r.choices[0].message.content for q, r in zip(questions, replies)) / len(questions)
+
+    async def scenario() -> list[float]:
+        return list(await asyncio.gather(accuracy("good prompt"), accuracy("bad prompt"), accuracy("good prompt")))
+
+    good, bad, again = asyncio.run(scenario())
+    assert good == again
+    assert good > 0.8 > 0.3 > bad
+
+    reply = asyncio.run(backend.acompletion(**_task("good prompt", "q0")))
+    assert reply.usage.total_tokens == reply.usage.prompt_tokens + reply.usage.completion_tokens > 0
+    assert backend.stats()["calls"] == 601
+
+
+def test_failures_and_concurrency_cap():
+    flaky = SimulatedBackend(rate_limit_rate=0.2, error_rate=0.1, seed=3)
+
+    async def outcomes(backend: SimulatedBackend, n: int) -> list[str]:
+        async def one() -> str:
+            try:
+                await backend.acompletion(**_task("p", "q"))
+                return "ok"
+            except (SimulatedRateLimitError, SimulatedAPIError) as exc:
+                return classify_call_error(exc)
+
+        return list(await asyncio.gather(*(one() for _ in range(n))))
+
+    results = asyncio.run(outcomes(flaky, 500))
+    assert 60 < results.count("rate_limit") < 140
+    assert 25 < results.count("error") < 80
+    assert flaky.rate_limited == results.count("rate_limit")
+
+    capped = SimulatedBackend(latency=0.01, max_concurrency=4)
+    results = asyncio.run(outcomes(capped, 10))
+    assert results.count("ok") == 4 and results.count("rate_limit") == 6
+
+
+@pytest.mark.parametrize(
+    "request_text, marker",
+    [("Wrap each in <PROMPT></PROMPT> tags", "<PROMPT>"), ('Separate with "---SPEC---"', "---SPEC---"), ("", "---")],
+)
+def test_prompt_replies_match_the_requested_format(request_text, marker):
+    backend = SimulatedBackend(variants=3)
+    reply = asyncio.run(backend.acompletion(model="sim", messages=[{"role": "user", "content": request_text}]))
+    content = reply.choices[0].message.content
+    assert marker in content
+    if marker == "<PROMPT>":
+        assert content.count("<PROMPT>") == 3
+    else:
+        assert len([part for part in content.split(f"\n{marker}\n") if part.strip()]) == 3
+
+
+def test_adapter_and_seed_initialization_run_on_the_simulator(tmp_path):
+    dataset = [DefaultDataInst(input=f"What is {i} + {i}?", answer=str(2 * i), id=f"q{i}") for i in range(20)]
+    backend = SimulatedBackend.from_dataset(dataset)
+    config = Config(
+        eval_concurrency=8,
+        n_islands=1,
+        shards=(0.25, 1.0),
+        cache_path=str(tmp_path / "cache"),
+        log_path=str(tmp_path / "logs"),
+        log_level="ERROR",
+    )
+    adapter = DefaultAdapter(
+        dataset, config=config, task_lm="sim/task", reflection_lm="sim/reflection", auto_config=False, backend=backend
+    )
+
+    result = adapter.optimize(seeds=["Solve the problem."], max_evaluations=40, display_progress=False)
+
+    assert result["pareto_entries"]
+    assert backend.calls > 20
+    assert backend.answers["What is 3 + 3?"] == "6"
+
+    seeds = asyncio.run(
+        maybe_initialize_seeds(
+            dataset,
+            None,
+            enable_seed_initialization=True,
+            num_generated_seeds=2,
+            reflection_lm="sim/reflection",
+            backend=SimulatedBackend(variants=2),
+        )
+    )
+    assert len(seeds) == 2
+    assert all(seed.meta["generation_method"] == "prompt_mii_seed_initialization" for seed in seeds)
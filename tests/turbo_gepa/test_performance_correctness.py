@@ -8,6 +8,8 @@ These tests verify that the system performs as intended with no hidden bottlenec
 4. Mutation generation doesn't spam
 5. ASHA pruning is efficient
 6. Inflight bookkeeping is accurate
+7. Nested shards let promoted candidates reuse their lower-rung examples
+8. Children are judged against their parent's cached scores on common examples
 """
 
 import asyncio
@@ -26,6 +28,13 @@ from turbo_gepa.orchestrator import Orchestrator
 from turbo_gepa.sampler import InstanceSampler
 
 
+@pytest.fixture(autouse=True)
+def _fresh_run_state():
+    """Tests share a cache directory; don't let one test resume another's checkpoint."""
+    DiskCache(".turbo_gepa/test_cache").clear_state()
+    yield
+
+
 class MockEvaluator(AsyncEvaluator):
     """Mock evaluator that tracks calls and returns configurable results."""
 
@@ -44,6 +53,7 @@ class MockEvaluator(AsyncEvaluator):
         concurrency: int,
         shard_fraction: float | None = None,
         show_progress: bool = False,
+        priority: tuple[float, ...] = (),
     ) -> EvalResult:
         self.concurrent_evals += 1
         self.max_concurrent = max(self.max_concurrent, self.concurrent_evals)
@@ -427,6 +437,100 @@ async def test_promoted_candidates_reevaluated():
     assert 1.0 in shards_evaluated, "Promoted seed not re-evaluated on final shard"
 
 
+@pytest.mark.asyncio
+async def test_nested_shards_extend_the_previous_rung():
+    """With nested shards a promoted candidate's shard is a prefix extension of its previous one."""
+    config = Config(
+        eval_concurrency=4,
+        shards=(0.2, 0.5, 1.0),
+        nested_shards=True,
+        max_mutations_per_round=3,
+        mutation_buffer_min=2,
+    )
+
+    evaluator = MockEvaluator()
+    seed_fp = Candidate(text="perfect seed", meta={}).fingerprint
+    evaluator.quality_map[seed_fp] = 1.0
+
+    example_ids = [f"ex{i}" for i in range(20)]
+    sampler = InstanceSampler(example_ids, seed=0)
+    sampler.register_hard_examples(["ex3", "ex7"])
+    permutation = sampler.sample_permutation(0)
+    assert sorted(permutation) == sorted(example_ids)
+    assert permutation[0] in {"ex3", "ex7"}  # Hard examples lead every fourth slot
+
+    orchestrator = Orchestrator(
+        config=config,
+        evaluator=evaluator,
+        archive=Archive(bins_length=8, bins_bullets=6),
+        sampler=sampler,
+        mutator=MockMutator(),
+        cache=DiskCache(".turbo_gepa/test_cache"),
+        show_progress=False,
+    )
+
+    await orchestrator.run([Candidate(text="perfect seed", meta={})], max_evaluations=10)
+
+    seed_shards = [
+        list(call["example_ids"])
+        for call in evaluator.calls
+        if call["candidate"].text == "perfect seed"
+    ]
+    assert [len(shard) for shard in seed_shards] == [4, 10, 20]
+    for lower, higher in zip(seed_shards, seed_shards[1:]):
+        assert higher[: len(lower)] == lower
+
+    metrics = orchestrator.metrics
+    assert metrics.promotion_evaluations >= 2
+    assert metrics.promotion_examples_saved >= 4 + 10
+    assert metrics.examples_saved_per_promotion > 0
+
+
+@pytest.mark.asyncio
+async def test_parent_scores_come_from_cache(tmp_path):
+    """The parent is re-scored from cache on the child's examples, without new calls."""
+    calls: list[str] = []
+
+    async def task_runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        calls.append(example_id)
+        return {"quality": 1.0 if example_id in ("ex0", "ex1") else 0.0}
+
+    cache = DiskCache(str(tmp_path))
+    evaluator = AsyncEvaluator(cache, task_runner)
+    orchestrator = Orchestrator(
+        config=Config(eval_concurrency=4, shards=(0.5, 1.0)),
+        evaluator=evaluator,
+        archive=Archive(bins_length=8, bins_bullets=6),
+        sampler=InstanceSampler([f"ex{i}" for i in range(8)], seed=0),
+        mutator=MockMutator(),
+        cache=cache,
+        show_progress=False,
+    )
+    parent = Candidate(text="parent", meta={"_sched_key": "parent-key"})
+    await evaluator.eval_on_shard(parent, ["ex0", "ex1", "ex2", "ex3"], concurrency=4)
+    orchestrator._parent_candidates["parent-key"] = parent
+    calls.clear()
+
+    child = Candidate(text="child", meta={"parent": "other-fp", "parent_sched_key": "parent-key"})
+    scores = await orchestrator._parent_example_scores(child, ["ex1", "ex2", "ex5"])
+    assert scores == {"ex1": 1.0, "ex2": 0.0}  # ex5 was never scored for the parent
+    assert calls == []
+    assert await orchestrator._parent_example_scores(Candidate(text="seed"), ["ex1"]) is None
+
+    # A parent outside the archive is kept only while one of its children still awaits evaluation
+    orchestrator._parent_candidates["gone-key"] = Candidate(text="gone")
+    orchestrator.score_matrix.set("gone-key", "ex0", 1.0)
+    orchestrator.score_matrix.set("parent-key", "ex0", 1.0)
+    orchestrator.enqueue([child])
+    orchestrator._prune_released_candidates()
+    assert set(orchestrator._parent_candidates) == {"parent-key"}
+    assert orchestrator.score_matrix.candidates == ["parent-key"]
+    orchestrator.queue.pop(0)
+    orchestrator._prune_released_candidates()
+    assert orchestrator._parent_candidates == {}
+    assert len(orchestrator.score_matrix) == 0
+
+
 @pytest.mark.asyncio
 async def test_examples_inflight_accuracy():
     """Test that example-level concurrency tracking is accurate."""
@@ -0,0 +1,224 @@
+"""
+Tests for the shared RPM/TPM rate limiter.
+
+These tests verify that:
+1. Requests burst up to the per-minute budget, then queue in arrival order at the refill rate
+2. Token estimates are settled against reported usage, so overruns delay later calls
+3. Limiters are shared process-wide by name, and the evaluator's admission wait is not timed out
+4. Adapter task and reflection calls draw from their own shared budgets and report queueing delay
+5. Cancelled waiters get their reservation back
+6. Admissions follow the evaluation key and never outlive their call; estimates include max_tokens
+"""
+
+import asyncio
+import types
+
+import pytest
+
+from turbo_gepa.adapters.default_adapter import DefaultAdapter, DefaultDataInst
+from turbo_gepa.cache import DiskCache
+from turbo_gepa.config import Config
+from turbo_gepa.evaluator import AsyncEvaluator
+from turbo_gepa.interfaces import Candidate
+from turbo_gepa.metrics import Metrics
+from turbo_gepa.rate_limiter import RateLimiter, shared_rate_limiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_requests_burst_then_queue_at_refill_rate():
+    clock = FakeClock()
+    limiter = RateLimiter(rpm=60, clock=clock)
+
+    delays = [limiter.reserve() for _ in range(63)]
+    assert delays[:60] == [0.0] * 60
+    assert delays[60:] == pytest.approx([1.0, 2.0, 3.0])  # One request per second, first come first served
+
+    clock.now = 10.0  # Refilled 10 requests, 3 of which pay off the debt
+    assert limiter.reserve() == 0.0
+    assert limiter.stats()["waited"] == 3
+    assert limiter.stats()["wait_seconds"] == pytest.approx(6.0)
+
+    with pytest.raises(ValueError, match="rpm must be positive"):
+        RateLimiter(rpm=0)
+
+
+def test_token_usage_is_settled_against_the_estimate():
+    clock = FakeClock()
+    limiter = RateLimiter(tpm=600, clock=clock)  # 10 tokens per second
+
+    assert limiter.reserve(100) == 0.0
+    limiter.settle(100, 700)  # The call used far more than estimated: 100 tokens of debt
+    assert limiter.reserve(50) == pytest.approx(15.0)
+
+    refunded = RateLimiter(tpm=600, clock=clock)
+    refunded.reserve(600)
+    refunded.settle(600, 100)  # Refund of the unused estimate
+    assert refunded.reserve(400) == 0.0
+    assert refunded.stats()["tokens_used"] == 100
+
+
+def test_cancelled_waiter_returns_its_reservation():
+    clock = FakeClock()
+    gate = asyncio.Event()
+
+    async def blocked_sleep(seconds: float) -> None:
+        await gate.wait()
+
+    limiter = RateLimiter(rpm=60, tpm=600, clock=clock, sleep=blocked_sleep)
+    assert limiter.reserve(600) == 0.0  # Spends the token budget
+
+    async def scenario() -> None:
+        waiter = asyncio.create_task(limiter.acquire(300))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(scenario())
+    # Only the first call still holds tokens, so the next one waits for 300 tokens, not 600
+    assert limiter.reserve(300) == pytest.approx(30.0)
+    assert limiter.stats()["acquired"] == 2
+    assert limiter.stats()["tokens_estimated"] == 900
+
+
+def test_shared_limiters_and_admission_outside_the_timeout(tmp_path):
+    first = shared_rate_limiter("test:shared", rpm=100)
+    assert shared_rate_limiter("test:shared", rpm=100) is first
+    assert shared_rate_limiter("test:shared", rpm=200) is first and first.rpm == 200
+
+    async def admission(candidate: Candidate, example_id: str) -> None:
+        await asyncio.sleep(0.2)  # Longer than the evaluation timeout
+
+    async def runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        return {"quality": 1.0}
+
+    evaluator = AsyncEvaluator(
+        cache=DiskCache(str(tmp_path)),
+        task_runner=runner,
+        timeout_seconds=0.1,
+        admission=admission,
+    )
+    result = asyncio.run(evaluator.eval_on_shard(Candidate(text="p"), ["a", "b"], concurrency=2))
+    assert result.objectives["quality"] == 1.0
+    assert not any(trace.get("error") for trace in result.traces)
+
+
+def test_adapter_calls_share_budgets_and_record_queueing(tmp_path):
+    clock = FakeClock()
+    sleeps: list[float] = []
+    requests: list[str] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    async def acompletion(**kwargs):
+        requests.append(kwargs["model"])
+        message = types.SimpleNamespace(content="the answer is 4")
+        return types.SimpleNamespace(
+            choices=[types.SimpleNamespace(message=message)], usage=types.SimpleNamespace(total_tokens=10)
+        )
+
+    config = Config(task_rpm=2, reflection_rpm=1, cache_path=str(tmp_path / "cache"), log_path=str(tmp_path / "logs"))
+    adapters = [
+        DefaultAdapter(
+            [DefaultDataInst(input="2+2?", answer="4", id="q0")],
+            config=config,
+            task_lm="test/limited-task",
+            reflection_lm="test/limited-reflection",
+            auto_config=False,
+            backend=types.SimpleNamespace(acompletion=acompletion),
+        )
+        for _ in range(2)
+    ]
+    # Two adapters (as two islands would) hold the same limiter per model
+    assert adapters[0].task_limiter is adapters[1].task_limiter
+    assert adapters[0].task_limiter is not adapters[0].reflection_limiter
+    for limiter in (adapters[0].task_limiter, adapters[0].reflection_limiter):
+        limiter._clock = clock
+        limiter._sleep = fake_sleep
+        limiter.configure(None, None)  # Reset the buckets onto the fake clock
+    adapters[0].task_limiter.configure(2, None)
+    adapters[0].reflection_limiter.configure(1, None)
+    metrics = Metrics()
+    for adapter in adapters:
+        adapter._metrics = metrics
+
+    async def scenario() -> None:
+        candidate = Candidate(text="Answer briefly.")
+        for adapter in adapters:
+            await adapter._admit_task_call(candidate, "q0")
+            result = await adapter._task_runner(candidate, "q0")
+            assert result["quality"] == 1.0
+        await adapters[1]._admit_task_call(candidate, "q0")  # Third task call within the minute queues
+        messages = [{"role": "user", "content": "improve"}]
+        await adapters[0]._limited_completion("reflection", {"model": "r", "messages": messages}, timeout=1.0)
+
+    asyncio.run(scenario())
+
+    assert requests == ["test/limited-task", "test/limited-task", "r"]
+    assert sleeps == [pytest.approx(30.0)]
+    assert metrics.rate_limit_waits == {"task": 1}
+    assert metrics.rate_limit_wait_total == pytest.approx(30.0)
+
+
+def test_adapter_admissions_follow_the_evaluation_key(tmp_path):
+    from turbo_gepa.adapters.default_adapter import _LimitedBackend
+    from turbo_gepa.seed_initializer import initialize_seeds_from_examples
+
+    requests: list[dict] = []
+
+    async def acompletion(**kwargs):
+        requests.append(kwargs)
+        message = types.SimpleNamespace(content="Work it out step by step; the answer is 4. " * 2)
+        return types.SimpleNamespace(
+            choices=[types.SimpleNamespace(message=message)], usage=types.SimpleNamespace(total_tokens=10)
+        )
+
+    config = Config(task_tpm=10**6, reflection_tpm=10**6, cache_path=str(tmp_path / "cache"), log_path=str(tmp_path / "logs"))
+    adapter = DefaultAdapter(
+        [DefaultDataInst(input="2+2?", answer="4", id="q0")],
+        config=config,
+        task_lm="test/admission-task",
+        reflection_lm="test/admission-reflection",
+        auto_config=False,
+        backend=types.SimpleNamespace(acompletion=acompletion),
+    )
+    adapter.task_model.max_tokens = 1000
+    task_limiter, reflection_limiter = adapter.task_limiter, adapter.reflection_limiter
+    task_limiter.configure(None, None)
+    task_limiter.configure(None, 10**6)
+
+    async def scenario() -> None:
+        await adapter._admit_task_call(Candidate(text="Answer briefly."), "q0")
+        # The evaluator may hand the runner another object for the same prompt
+        await adapter._task_runner(Candidate(text="Answer briefly."), "q0")
+        assert task_limiter.stats()["acquired"] == 1  # The runner used the admission
+        # A runner failing before it reaches the call still releases its admission
+        await adapter._admit_task_call(Candidate(text="Answer briefly."), "q0")
+        example = adapter.example_map.pop("q0")
+        with pytest.raises(KeyError):
+            await adapter._task_runner(Candidate(text="Answer briefly."), "q0")
+        assert not adapter._admitted_task_calls
+        adapter.example_map["q0"] = example
+        seeds = await initialize_seeds_from_examples(
+            [{"input": "2+2?", "output": "4"}],
+            num_seeds=1,
+            reflection_lm="test/admission-reflection",
+            backend=_LimitedBackend(adapter, "seed_initialization", timeout=1.0),
+        )
+        assert len(seeds) == 1
+
+    before = reflection_limiter.stats()["acquired"]
+    asyncio.run(scenario())
+    # Prompt (~4 characters per token) plus the completion budget
+    prompt_tokens = (len("Answer briefly.") + len("2+2?")) / 4.0
+    assert task_limiter.stats()["tokens_estimated"] == pytest.approx(2 * (prompt_tokens + 1000))
+    assert requests[0]["max_tokens"] == 1000
+    assert reflection_limiter.stats()["acquired"] == before + 1  # Seed initialization is metered too
@@ -0,0 +1,113 @@
+"""
+Tests for the indexed ready queue.
+
+These tests verify that:
+1. Candidates are deduplicated by scheduling key, including while in flight
+2. Each rung launches by priority, then insertion order, and failed launches return to the front
+3. A full queue evicts its oldest entry and removal keeps rung counts in step
+4. Shrinking the rung count folds dropped rungs into the last one
+5. The orchestrator queues candidates with the best score estimate first
+"""
+
+from unittest.mock import Mock
+
+from turbo_gepa.archive import Archive
+from turbo_gepa.cache import DiskCache
+from turbo_gepa.config import Config
+from turbo_gepa.evaluator import AsyncEvaluator
+from turbo_gepa.interfaces import Candidate
+from turbo_gepa.orchestrator import Orchestrator
+from turbo_gepa.ready_queue import ReadyQueue
+from turbo_gepa.sampler import InstanceSampler
+from turbo_gepa.scheduler import scheduling_key
+
+
+def _cand(text: str, **meta) -> Candidate:
+    return Candidate(text=text, meta=meta)
+
+
+def test_dedup_by_scheduling_key_and_inflight():
+    queue = ReadyQueue(2)
+    original = _cand("a")
+    promoted = _cand("a", quality=0.5, _sched_key=scheduling_key(original))
+
+    assert queue.push(original, 0)
+    assert not queue.push(promoted, 1)  # Same scheduling key despite a different fingerprint
+    assert original in queue and promoted in queue
+
+    assert queue.pop(0) is original
+    queue.mark_inflight(scheduling_key(original))
+    assert not queue.push(promoted, 1)
+    queue.release(scheduling_key(original))
+    assert queue.push(promoted, 1)
+    assert queue.rung_sizes() == [0, 1]
+
+
+def test_rung_order_priority_and_front():
+    queue = ReadyQueue(2)
+    a, b, c, d = (_cand(t) for t in "abcd")
+    queue.push(a, 0)
+    queue.push(b, 0)
+    queue.push(c, 0, priority=-1.0)
+    queue.push(d, 1)
+
+    assert queue.rung_items(0) == [c, a, b]
+    assert queue.pop(0) is c
+    assert queue.pop(0) is a
+    assert queue.push(a, 0, front=True)
+    assert queue.peek(0) is a
+    assert list(queue) == [b, d, a]  # Iteration follows insertion order across rungs
+    assert queue.pop() is b  # Without a rung, the oldest entry overall
+
+
+def test_eviction_and_removal():
+    queue = ReadyQueue(2, maxlen=3)
+    cands = [_cand(f"c{i}") for i in range(5)]
+    for i, cand in enumerate(cands):
+        queue.push(cand, i % 2)
+
+    assert list(queue) == cands[2:]
+    assert queue.rung_sizes() == [2, 1]
+    assert queue.remove(scheduling_key(cands[2])) is cands[2]
+    assert queue.remove(scheduling_key(cands[2])) is None
+    assert queue.rung_items(0) == [cands[4]]
+    assert queue.pop(0) is cands[4]
+    assert queue.pop(0) is None
+    assert len(queue) == 1
+
+
+def test_resize_moves_dropped_rungs_to_last():
+    queue = ReadyQueue(3)
+    a, b, c = _cand("a"), _cand("b"), _cand("c")
+    queue.push(a, 2)
+    queue.push(b, 1)
+    queue.push(c, 9)  # Clamped to the last rung
+
+    queue.resize(2)
+    assert queue.rung_sizes() == [0, 3]
+    assert queue.rung_items(1) == [a, b, c]
+    queue.resize(4)
+    assert queue.rung_sizes() == [0, 3, 0, 0]
+    assert queue.pop(1) is a
+
+
+def test_orchestrator_enqueues_by_score_estimate(tmp_path):
+    async def task_runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        return {"quality": 0.0}
+
+    cache = DiskCache(str(tmp_path))
+    orchestrator = Orchestrator(
+        config=Config(eval_concurrency=4, shards=(0.5, 1.0)),
+        evaluator=AsyncEvaluator(cache=cache, task_runner=task_runner),
+        archive=Archive(bins_length=8, bins_bullets=6),
+        sampler=InstanceSampler(["ex1", "ex2"], seed=0),
+        mutator=Mock(),
+        cache=cache,
+        show_progress=False,
+    )
+    seed = _cand("seed")
+    weak_child = _cand("weak", parent_score=0.2)
+    strong_child = _cand("strong", parent_score=0.8)
+    orchestrator.enqueue([seed, weak_child, strong_child])
+
+    assert orchestrator.queue.rung_items(0) == [strong_child, weak_child, seed]
@@ -0,0 +1,266 @@
+"""
+Tests for resuming an optimization run from saved state.
+
+These tests verify that:
+1. Restored archive candidates are rebuilt from cached records without re-evaluation
+2. Candidates with incomplete cache coverage fall back to the evaluator
+3. A run resumed from a full checkpoint makes the same decisions as an uninterrupted run
+4. Checkpoints append only their changes to a journal that is replayed and compacted
+5. Entries that were not replaced are neither re-serialized nor re-diffed
+6. Tracked sections rebuild and journal only the keys changed since the last checkpoint
+"""
+
+import asyncio
+import json
+from unittest.mock import Mock
+
+from turbo_gepa.archive import Archive
+from turbo_gepa.cache import DiskCache, SerializationMemo, TrackedDict, TrackedSet
+from turbo_gepa.config import Config
+from turbo_gepa.evaluator import AsyncEvaluator
+from turbo_gepa.interfaces import Candidate, EvalResult
+from turbo_gepa.orchestrator import Orchestrator
+from turbo_gepa.sampler import InstanceSampler
+
+EXAMPLES = ["ex1", "ex2", "ex3"]
+
+
+def _result(quality: float, example_id: str) -> EvalResult:
+    return EvalResult(
+        objectives={"quality": quality},
+        traces=[{"example_id": example_id, "quality": quality}],
+        n_examples=1,
+        shard_fraction=1.0,
+        example_ids=[example_id],
+    )
+
+
+def _orchestrator(cache: DiskCache, calls: list[tuple[str, str]]) -> Orchestrator:
+    async def task_runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        calls.append((candidate.text, example_id))
+        return {"quality": 0.0}
+
+    return Orchestrator(
+        config=Config(eval_concurrency=4, shards=(0.5, 1.0)),
+        evaluator=AsyncEvaluator(cache=cache, task_runner=task_runner),
+        archive=Archive(bins_length=8, bins_bullets=6),
+        sampler=InstanceSampler(EXAMPLES, seed=0),
+        mutator=Mock(),
+        cache=cache,
+        show_progress=False,
+    )
+
+
+def test_restore_state_rebuilds_results_from_cache(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    complete = Candidate(text="complete", meta={"source": "seed"})
+    partial = Candidate(text="partial", meta={"source": "mutation"})
+    calls: list[tuple[str, str]] = []
+
+    async def scenario() -> Orchestrator:
+        await cache.batch_set([(complete, eid, _result(q, eid)) for eid, q in zip(EXAMPLES, (1.0, 1.0, 0.0))])
+        await cache.batch_set([(partial, eid, _result(1.0, eid)) for eid in EXAMPLES[:2]])
+        resumed_cache = DiskCache(str(tmp_path))
+        orchestrator = _orchestrator(resumed_cache, calls)
+        state = {"round": 3, "evaluations": 12, "pareto": [complete], "qd": [partial], "queue": []}
+        await orchestrator._restore_state(state)
+        return orchestrator
+
+    orchestrator = asyncio.run(scenario())
+
+    # Only the example missing from the partial candidate's cache was evaluated
+    assert calls == [("partial", "ex3")]
+    entries = {entry.candidate.text: entry.result for entry in orchestrator.archive.pareto_entries()}
+    assert abs(entries["complete"].objectives["quality"] - 2 / 3) < 1e-9
+    assert entries["complete"].shard_fraction == 1.0
+    assert entries["complete"].example_ids == EXAMPLES
+    assert orchestrator.round_index == 3
+
+
+def test_checkpoint_resume_matches_uninterrupted_run(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    seeds = [Candidate(text=f"seed {i}", meta={}) for i in range(4)]
+    qualities = {"seed 0": 0.9, "seed 1": 0.2, "seed 2": 0.7, "seed 3": 0.4}
+    calls: list[tuple[str, str]] = []
+
+    async def ingest(orchestrator: Orchestrator, candidate: Candidate) -> str:
+        shard_idx = orchestrator.scheduler.current_shard_index(candidate)
+        fraction = orchestrator._runtime_shards[shard_idx]
+        example_ids = orchestrator.sampler.sample_shard(orchestrator.round_index, 2 if fraction < 1.0 else 3)
+        result = EvalResult(
+            objectives={"quality": qualities[candidate.text]},
+            traces=[{"example_id": example_id, "quality": qualities[candidate.text]} for example_id in example_ids],
+            n_examples=len(example_ids),
+            shard_fraction=fraction,
+            example_ids=example_ids,
+        )
+        orchestrator.evaluations_run += 1
+        orchestrator.round_index += 1
+        enriched, decision = await orchestrator._ingest_result(candidate, result)
+        if decision == "promoted":
+            orchestrator.enqueue([enriched])
+        return decision
+
+    async def drain(orchestrator: Orchestrator) -> list[str]:
+        decisions = []
+        while orchestrator.queue:
+            candidate = orchestrator.queue.pop()
+            decisions.append(await ingest(orchestrator, candidate))
+        return decisions
+
+    def snapshot(orchestrator: Orchestrator) -> dict:
+        return json.loads(json.dumps(orchestrator._checkpoint_state(), sort_keys=True))
+
+    async def scenario() -> tuple[list[str], list[str], dict, dict]:
+        original = _orchestrator(cache, calls)
+        for seed in seeds:
+            await ingest(original, seed)
+        original.enqueue([c for c in original.archive.pareto_candidates()])
+        await original._save_state()
+        await original._save_task
+
+        resumed = _orchestrator(DiskCache(str(tmp_path)), calls)
+        await resumed._restore_state(DiskCache(str(tmp_path)).load_state())
+        assert snapshot(resumed) == snapshot(original)
+        assert resumed.score_matrix.get_state() == original.score_matrix.get_state() != {}
+
+        expected = await drain(original)
+        actual = await drain(resumed)
+        return expected, actual, snapshot(original), snapshot(resumed)
+
+    expected, actual, original_state, resumed_state = asyncio.run(scenario())
+
+    assert calls == []  # Nothing was re-evaluated on restore
+    assert expected and actual == expected
+    assert resumed_state == original_state
+
+
+def test_checkpoint_journal_appends_deltas_and_compacts(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    seed = Candidate(text="seed", meta={})
+    archive = {f"cand{i}": {"quality": i / 10, "traces": ["x" * 200]} for i in range(50)}
+
+    def save(round_num: int) -> bool:
+        checkpoint = {"archive": dict(archive), "queue": [f"cand{round_num}"], "empty": {}}
+        return cache.save_checkpoint(round_num, round_num * 4, [seed], [], [seed], checkpoint, compact_every=3)
+
+    assert save(0)  # First save of a process writes a full snapshot
+    snapshot_size = cache._state_path().stat().st_size
+
+    archive["cand51"] = {"quality": 0.9, "traces": []}
+    del archive["cand0"]
+    assert not save(1)
+    assert not save(1)  # Unchanged state appends nothing
+    journal = cache._journal_path().read_text().splitlines()
+    assert len(journal) == 2  # Header plus one delta
+    assert len(journal[1]) < snapshot_size // 10
+
+    state = DiskCache(str(tmp_path)).load_state()
+    assert state["round"] == 1 and state["evaluations"] == 4
+    assert state["checkpoint"]["archive"] == archive
+    assert state["checkpoint"]["queue"] == ["cand1"]
+    assert state["checkpoint"]["empty"] == {}
+    assert state["pareto"] == [seed]
+
+    # A torn final line is ignored on load
+    with cache._journal_path().open("a", encoding="utf-8") as f:
+        f.write('{"del":[],"set":[[["round"],')
+    assert DiskCache(str(tmp_path)).load_state()["round"] == 1
+
+    # A fresh process compacts on its first save; a stale journal is never replayed onto it
+    resumed = DiskCache(str(tmp_path))
+    assert resumed.save_checkpoint(2, 8, [], [], [], {"archive": {}}, compact_every=3)
+    assert not resumed._journal_path().exists()
+    assert resumed.load_state()["checkpoint"] == {"archive": {}}
+    for round_num in range(3, 6):
+        assert not resumed.save_checkpoint(round_num, 0, [], [], [], {"archive": {}, "n": round_num}, compact_every=3)
+    assert resumed.save_checkpoint(6, 0, [], [], [], {"archive": {}, "n": 6}, compact_every=3)
+    assert DiskCache(str(tmp_path)).load_state()["checkpoint"]["n"] == 6
+
+
+def test_checkpoint_journal_skips_memoized_entries(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    serialized: list[str] = []
+
+    def serialize(result: EvalResult) -> dict:
+        serialized.append(result.example_ids[0])
+        return {"quality": result.objectives["quality"], "traces": result.traces}
+
+    memo = SerializationMemo(serialize)
+    results = {f"cand{i}": _result(i / 10, f"ex{i}") for i in range(20)}
+
+    def save(round_num: int, shape: object) -> bool:
+        snapshot = {key: memo(key, result) for key, result in results.items()}
+        memo.prune()
+        return cache.save_checkpoint(round_num, 0, [], [], [], {"results": snapshot, "shape": shape})
+
+    assert save(0, 1)
+    results["cand3"] = _result(0.95, "ex3")
+    del results["cand4"]
+    # A leaf that becomes a subtree, and back again, replays correctly
+    assert not save(1, {"a": 1})
+    assert not save(2, 2)
+    assert len(serialized) == 21  # Unreplaced results are serialized once
+
+    state = DiskCache(str(tmp_path)).load_state()
+    assert state["checkpoint"]["shape"] == 2
+    assert state["checkpoint"]["results"]["cand3"]["quality"] == 0.95
+    assert set(state["checkpoint"]["results"]) == set(results)
+
+
+def test_tracked_sections_rebuild_only_changed_keys(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    serialized: list[str] = []
+
+    def serialize(children: set[str]) -> list[str]:
+        serialized.append(",".join(sorted(children)))
+        return sorted(children)
+
+    children = TrackedDict({f"p{i}": {f"c{i}"} for i in range(50)}, default_factory=set)
+    seen = TrackedSet((f"c{i}", 0) for i in range(50))
+
+    def save(round_num: int) -> tuple[bool, dict]:
+        checkpoint = {"children": children.snapshot(serialize), "seen": seen.snapshot(nested=True)}
+        return cache.save_checkpoint(round_num, 0, [], [], [], checkpoint), checkpoint
+
+    assert save(0)[0]
+    first = save(1)[1]
+    assert len(serialized) == 50 and first["children"] is children.snapshot(serialize)
+
+    children["p1"].add("x")  # Edited in place, so reported with touch()
+    children.touch("p1")
+    children["new"].add("y")  # Missing keys are filled like defaultdict
+    children.touch("new")
+    del children["p2"]
+    seen.add(("c1", 1))
+    seen.discard(("c3", 0))
+    assert not save(2)[0]
+    assert serialized[50:] == ["c1,x", "y"]
+
+    line = json.loads(cache._journal_path().read_text().splitlines()[-1])
+    assert sorted(tuple(path[1:]) for path in line["del"]) == [("children", "p2"), ("seen", "c3", "0")]
+    assert sorted((tuple(path[1:]), value) for path, value in line["set"] if path[0] == "checkpoint") == [
+        (("children", "new"), ["y"]),
+        (("children", "p1"), ["c1", "x"]),
+        (("seen", "c1", "1"), True),
+    ]
+    state = DiskCache(str(tmp_path)).load_state()["checkpoint"]
+    assert state["children"] == {key: sorted(value) for key, value in children.items()}
+    assert state["seen"]["c1"] == {"0": True, "1": True} and "c3" not in state["seen"]
+
+
+def test_orchestrator_checkpoint_reuses_unchanged_sections(tmp_path):
+    orchestrator = _orchestrator(DiskCache(str(tmp_path)), [])
+    orchestrator._children_seen.add("child")
+    orchestrator._candidate_generations["child"] = 1
+    first = orchestrator._checkpoint_state()
+    second = orchestrator._checkpoint_state()
+    for section in ("children_seen", "candidate_generations", "parent_children", "lineage_history"):
+        assert second["lineage"][section] is first["lineage"][section]
+    assert second["scheduler"]["candidate_levels"] is first["scheduler"]["candidate_levels"]
+    assert second["sampler"]["order"] is first["sampler"]["order"]
+
+    orchestrator._candidate_generations["other"] = 2
+    third = orchestrator._checkpoint_state()
+    assert third["lineage"]["candidate_generations"] == {"child": 1, "other": 2}
+    assert third["lineage"]["children_seen"] is first["lineage"]["children_seen"]
@@ -3,13 +3,19 @@ Tests for ASHA successive halving behavior in the scheduler.
 
 These tests verify that:
 1. Promoted candidates stay in rung for threshold calculation
-2. Parent-based promotion bypasses quantile checks
+2. Parent-based promotion bypasses quantile checks, paired on common examples when possible
 3. Seeds get promoted and re-queued correctly
 4. Streaming ASHA pruning works as expected
+5. Rung thresholds come from an incrementally sorted, optionally windowed view
+6. Racing bounds settle shard evaluations early without changing clear-cut decisions
 """
 
+import asyncio
+
 import pytest
-from turbo_gepa.scheduler import BudgetedScheduler, SchedulerConfig
+from turbo_gepa.cache import DiskCache
+from turbo_gepa.evaluator import AsyncEvaluator
+from turbo_gepa.scheduler import BudgetedScheduler, RaceBound, SchedulerConfig
 from turbo_gepa.interfaces import Candidate, EvalResult
 
 
@@ -95,6 +101,56 @@ class TestParentBasedPromotion:
             decision = scheduler.record(child, result, "quality")
             assert decision == expected_decision, f"Score {score} should {expected_decision}, got {decision}"
 
+    def test_children_compared_on_common_examples(self):
+        """A parent's per-example scores on the child's shard override its mean from another shard."""
+        config = SchedulerConfig(shards=[0.2, 1.0], eps_improve=0.01, quantile=0.6, paired_min_examples=4)
+        scheduler = BudgetedScheduler(config)
+
+        # Parent scored 0.70 overall, but only 0.25 on these (hard) examples; the child gets 0.50 on them
+        parent_scores = {f"ex{i}": 1.0 if i == 0 else 0.0 for i in range(4)}
+        traces = [{"example_id": f"ex{i}", "quality": 1.0 if i < 2 else 0.0} for i in range(4)]
+        result = EvalResult(objectives={"quality": 0.5}, traces=traces, n_examples=4, shard_fraction=0.2)
+
+        child = Candidate(text="child", meta={"parent": "p", "parent_objectives": {"quality": 0.70}})
+        assert scheduler.paired_delta(result, parent_scores, "quality") == (0.25, 4)
+        assert scheduler.record(child, result, "quality", parent_example_scores=parent_scores) == "promoted"
+
+        # Unpaired, the same result looks worse than the parent
+        unpaired = Candidate(text="unpaired", meta={"parent": "p", "parent_objectives": {"quality": 0.70}})
+        assert scheduler.record(unpaired, result, "quality") == "pruned"
+
+        # Too few common examples falls back to the parent's mean
+        sparse = Candidate(text="sparse", meta={"parent": "p", "parent_objectives": {"quality": 0.70}})
+        few = {"ex0": 1.0, "ex1": 0.0}
+        assert scheduler.paired_delta(result, few, "quality") is None
+        assert scheduler.record(sparse, result, "quality", parent_example_scores=few) == "pruned"
+
+    @pytest.mark.asyncio
+    async def test_pairing_uses_mapped_objective(self, tmp_path):
+        """Child traces carry the mapped objective, so both sides of a pair are on the same scale."""
+
+        async def task_runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+            quality = 1.0 if candidate.text == "child" or example_id == "ex0" else 0.0
+            return {"quality": quality, "tokens": 10.0}
+
+        def metrics_mapper(metrics: dict[str, float]) -> dict[str, float]:
+            return {"accuracy": 100.0 * metrics["quality"]}
+
+        evaluator = AsyncEvaluator(DiskCache(str(tmp_path)), task_runner, metrics_mapper=metrics_mapper)
+        examples = [f"ex{i}" for i in range(4)]
+        parent = Candidate(text="parent")
+        await evaluator.eval_on_shard(parent, examples, concurrency=2)
+        # The parent side of a pair: mapped per-example objectives from the cache
+        parent_scores = {}
+        for example_id in examples:
+            cached = await evaluator.cached_result(parent, example_id, objectives_only=True)
+            parent_scores[example_id] = cached.objectives["accuracy"]
+
+        result = await evaluator.eval_on_shard(Candidate(text="child"), examples, concurrency=2)
+        assert all(trace["accuracy"] == 100.0 for trace in result.traces)
+        scheduler = BudgetedScheduler(SchedulerConfig(shards=[0.2, 1.0], eps_improve=0.01, quantile=0.6, paired_min_examples=4))
+        assert scheduler.paired_delta(result, parent_scores, "accuracy") == (75.0, 4)
+
     def test_children_without_parent_use_quantile(self):
         """Children without parent metadata should use quantile-based pruning."""
         config = SchedulerConfig(
@@ -302,5 +358,141 @@ class TestEdgeCases:
         pass  # Test disabled - scheduler behavior changed
 
 
+class TestRungOrderStatistics:
+    """Test the incrementally maintained per-rung score distribution."""
+
+    def test_threshold_matches_full_recompute(self):
+        """Incremental sorted means must give the same threshold as rescanning the rung."""
+        import random
+        import statistics
+
+        config = SchedulerConfig(shards=[0.2, 1.0], eps_improve=0.01, quantile=0.6)
+        scheduler = BudgetedScheduler(config)
+        rung = scheduler.rungs[0]
+        rng = random.Random(0)
+        for step in range(500):
+            key = f"cand{rng.randrange(80)}"
+            if step % 37 == 0:
+                rung.remove(key)
+            else:
+                rung.update(key, rng.choice([0.0, 0.25, 0.5, 0.75, 1.0]))
+
+            samples = sorted((statistics.fmean(v) for v in rung.results.values()), reverse=True)
+            if not samples:
+                assert scheduler._promotion_threshold(rung) == float("-inf")
+                continue
+            rank = min(max(int(len(samples) * (1 - config.quantile)), 0), len(samples) - min(2, len(samples)))
+            expected = samples[rank] + (config.eps_improve if len(set(samples)) > 1 else 0.0)
+            if len(samples) == 1:
+                expected = samples[0]
+            assert scheduler._promotion_threshold(rung) == expected
+            assert rung.sorted_means() == sorted(samples)
+
+    def test_window_ages_out_oldest_candidates(self):
+        """With a rung window, only the most recently scored candidates set the threshold."""
+        config = SchedulerConfig(shards=[0.2, 1.0], eps_improve=0.0, quantile=0.5, rung_window=3)
+        scheduler = BudgetedScheduler(config)
+        for i, score in enumerate([0.9, 0.8, 0.1, 0.2, 0.3]):
+            scheduler.rungs[0].update(f"c{i}", score)
+
+        rung = scheduler.rungs[0]
+        assert list(rung.results) == ["c2", "c3", "c4"]
+        assert rung.sorted_means() == [0.1, 0.2, 0.3]
+
+        # Re-scoring a candidate refreshes it, so the oldest remaining one ages out instead
+        rung.update("c2", 0.5)
+        rung.update("c5", 0.4)
+        assert list(rung.results) == ["c4", "c2", "c5"]
+
+        restored = BudgetedScheduler(config)
+        restored.set_state(scheduler.get_state())
+        assert restored.rungs[0].sorted_means() == rung.sorted_means()
+        assert restored._promotion_threshold(restored.rungs[0]) == scheduler._promotion_threshold(rung)
+
+
+class TestRacing:
+    """Test sequential promote/prune decisions on partial shards."""
+
+    @pytest.mark.parametrize("method", ["hoeffding", "bernstein", "beta"])
+    def test_settles_clear_outcomes_early(self, method):
+        """A perfect streak promotes, a failing streak prunes, a coin flip near the target stays open."""
+        race = RaceBound(target=0.5, method=method, confidence=0.95, min_examples=5)
+        shard = 200
+
+        def first_verdict(scores):
+            total = total_sq = 0.0
+            for n, score in enumerate(scores, start=1):
+                total += score
+                total_sq += score * score
+                verdict = race.settle(total, total_sq, n, shard)
+                if verdict is not None:
+                    return verdict, n
+            return None, len(scores)
+
+        verdict, n = first_verdict([1.0] * shard)
+        assert verdict == "promote" and n < shard // 2
+        verdict, n = first_verdict([0.0] * shard)
+        assert verdict == "prune" and n < shard // 2
+        assert first_verdict([1.0, 0.0] * 50) == (None, 100)
+
+        # Outcomes no remaining example can change settle whatever the bound, even before min_examples
+        assert race.settle(total=101, total_sq=101, n=101, shard_size=shard) == "promote"
+        assert race.settle(total=0, total_sq=0, n=101, shard_size=shard) == "prune"
+        assert race.settle(total=2, total_sq=2, n=2, shard_size=4) == "promote"
+        # The final rung never promotes on a partial shard
+        final = RaceBound(target=0.5, method=method, allow_promote=False)
+        assert final.settle(total=150, total_sq=150, n=150, shard_size=shard) is None
+
+    def test_scheduler_supplies_targets(self):
+        """Targets follow record(): parent + eps when a parent exists, else the rung threshold."""
+        config = SchedulerConfig(shards=[0.2, 1.0], eps_improve=0.05, quantile=0.5, racing="beta")
+        scheduler = BudgetedScheduler(config)
+
+        child = Candidate(text="child", meta={"parent_objectives": {"quality": 0.6}})
+        race = scheduler.race_bound(child, "quality")
+        assert race.target == pytest.approx(0.65) and race.allow_promote and race.method == "beta"
+
+        seed = Candidate(text="seed", meta={})
+        assert scheduler.race_bound(seed, "quality") is None  # Empty rung: the first score promotes
+        for i, score in enumerate([0.2, 0.4, 0.6, 0.8]):
+            scheduler.rungs[0].update(f"c{i}", score)
+        race = scheduler.race_bound(seed, "quality")
+        assert race.target == scheduler._promotion_threshold(scheduler.rungs[0])
+
+        scheduler._candidate_levels[scheduler._sched_key(seed)] = 1
+        scheduler._candidate_levels[scheduler._sched_key(child)] = 1
+        assert scheduler.race_bound(seed, "quality") is None
+        assert scheduler.race_bound(child, "quality").allow_promote is False
+
+        off = SchedulerConfig(shards=[0.2, 1.0], eps_improve=0.05, quantile=0.5)
+        assert BudgetedScheduler(off).race_bound(child, "quality") is None
+        with pytest.raises(ValueError, match="Unknown racing bound"):
+            BudgetedScheduler(SchedulerConfig(shards=[1.0], eps_improve=0.0, quantile=0.5, racing="bayes"))
+
+    @pytest.mark.asyncio
+    async def test_evaluator_stops_once_settled(self, tmp_path):
+        """A settled race cancels the rest of the shard and reports the examples it left unscored."""
+        from turbo_gepa.metrics import Metrics
+
+        calls = 0
+
+        async def task_runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.001)
+            return {"quality": 1.0}
+
+        metrics = Metrics()
+        evaluator = AsyncEvaluator(DiskCache(str(tmp_path)), task_runner, metrics=metrics)
+        examples = [f"ex{i}" for i in range(100)]
+        race = RaceBound(target=0.5, method="hoeffding", min_examples=5)
+        result = await evaluator.eval_on_shard(Candidate(text="strong"), examples, concurrency=1, race=race)
+
+        assert result.objectives["quality"] == 1.0
+        assert result.n_examples < calls < len(examples)  # Calls already running when it settled still finish
+        assert metrics.early_stops_racing == 1
+        assert metrics.racing_examples_saved == len(examples) - result.n_examples
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,163 @@
+"""
+Tests for the run-wide candidates x examples score matrix.
+
+These tests verify that:
+1. Scores round-trip through rows and columns added on the fly (past the initial capacity)
+2. Difficulty, coverage and agreement queries match a direct computation
+3. Both the NumPy and the pure-Python storage give identical answers and snapshots
+4. Removed rows are reused and unchanged rows keep their snapshot objects
+5. Recorded scores are the evaluator's mapped objectives, whatever they are named
+6. The sampler draws hard examples that split scored candidates first
+"""
+
+import random
+
+import pytest
+
+from turbo_gepa.cache import DiskCache
+from turbo_gepa.evaluator import AsyncEvaluator
+from turbo_gepa.interfaces import Candidate, EvalResult
+from turbo_gepa.sampler import InstanceSampler
+from turbo_gepa.score_matrix import ScoreMatrix, np
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def use_numpy(request):
+    if request.param and np is None:
+        pytest.skip("numpy not installed")
+    return request.param
+
+
+def test_scores_grow_with_rows_and_columns(use_numpy):
+    matrix = ScoreMatrix(["ex0", "ex1"], use_numpy=use_numpy)
+    result = EvalResult(
+        objectives={"quality": 0.5},
+        traces=[
+            {"example_id": "ex0", "quality": 1.0},
+            {"example_id": "ex1", "quality": 0.0},
+            {"example_id": "ex9", "error": "timeout"},  # No score: skipped
+        ],
+        n_examples=3,
+    )
+    assert matrix.record("a", result) == 2
+    for i in range(20):  # Forces the dense array to grow in both directions
+        matrix.set(f"c{i}", f"new{i}", i / 20)
+
+    assert matrix.shape == (21, 22)
+    assert matrix.get("a", "ex0") == 1.0
+    assert matrix.get("a", "new3") is None
+    assert matrix.get("missing", "ex0") is None
+    assert matrix.scores("a") == {"ex0": 1.0, "ex1": 0.0}
+    assert matrix.scores("a", ["ex1", "new3", "unknown"]) == {"ex1": 0.0}
+    assert matrix.scores("c5") == {"new5": 0.25}
+    assert matrix.coverage("a") == 2 and matrix.coverage("missing") == 0
+
+    matrix.remove("a")
+    assert matrix.scores("a") == {} and "a" not in matrix
+    assert matrix.shape == (20, 22)
+
+
+@pytest.mark.asyncio
+async def test_records_mapped_objective(tmp_path):
+    async def task_runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        return {"quality": 1.0 if example_id == "ex0" else 0.0, "tokens": 40.0}
+
+    def metrics_mapper(metrics: dict[str, float]) -> dict[str, float]:
+        return {"accuracy": 0.5 + 0.5 * metrics["quality"], "neg_cost": -metrics["tokens"]}
+
+    evaluator = AsyncEvaluator(DiskCache(str(tmp_path)), task_runner, metrics_mapper=metrics_mapper)
+    result = await evaluator.eval_on_shard(Candidate(text="prompt"), ["ex0", "ex1"], concurrency=2)
+
+    matrix = ScoreMatrix(["ex0", "ex1"])
+    assert matrix.record("a", result, "accuracy") == 2
+    assert matrix.scores("a") == {"ex0": 1.0, "ex1": 0.5}
+    assert sum(matrix.scores("a").values()) / 2 == result.objectives["accuracy"]
+    assert matrix.record("b", result, "neg_cost") == 2
+    assert matrix.scores("b") == {"ex0": -40.0, "ex1": -40.0}
+
+
+def test_removed_rows_are_reused(use_numpy):
+    matrix = ScoreMatrix(["ex0", "ex1"], use_numpy=use_numpy)
+    matrix.set("a", "ex0", 1.0)
+    matrix.set("b", "ex1", 0.5)
+    before = matrix.get_state()
+    assert matrix.get_state()["b"] is before["b"]  # Unchanged rows are not rebuilt
+
+    matrix.remove("a")
+    matrix.set("c", "ex1", 0.0)  # Takes the freed row, which starts empty
+    state = matrix.get_state()
+    assert state == {"b": {"ex1": 0.5}, "c": {"ex1": 0.0}}
+    assert state["b"] is before["b"]
+    assert matrix.candidates == ["b", "c"]
+    assert matrix.example_means() == {"ex1": (0.25, 2)}
+    if use_numpy:
+        assert matrix._data.shape[0] == 8
+    else:
+        assert len(matrix._rows) == 2
+
+    matrix.set("b", "ex0", 1.0)
+    assert matrix.get_state()["b"] == {"ex0": 1.0, "ex1": 0.5}
+
+
+def test_queries_match_direct_computation(use_numpy):
+    rng = random.Random(0)
+    examples = [f"ex{i}" for i in range(12)]
+    matrix = ScoreMatrix(examples, use_numpy=use_numpy)
+    rows: dict[str, dict[str, float]] = {}
+    for c in range(9):
+        key = f"c{c}"
+        rows[key] = {ex: float(rng.random() < 0.6) for ex in rng.sample(examples, rng.randint(3, 12))}
+        for ex, score in rows[key].items():
+            matrix.set(key, ex, score)
+
+    means = matrix.example_means()
+    for ex in examples:
+        values = [row[ex] for row in rows.values() if ex in row]
+        if values:
+            assert means[ex] == (pytest.approx(sum(values) / len(values)), len(values))
+            assert matrix.difficulty()[ex] == pytest.approx(1 - sum(values) / len(values))
+        else:
+            assert ex not in means
+    subset = matrix.example_means(["c0", "c1", "unknown"])
+    assert all(count <= 2 for _, count in subset.values())
+
+    common = [ex for ex in rows["c0"] if ex in rows["c1"]]
+    expected = (sum(rows["c0"][ex] == rows["c1"][ex] for ex in common) / len(common), len(common)) if common else None
+    assert matrix.agreement("c0", "c1") == expected
+    assert matrix.agreement("c0", "unknown") is None
+
+
+def test_storages_agree_and_snapshot_round_trips():
+    if np is None:
+        pytest.skip("numpy not installed")
+    dense = ScoreMatrix(use_numpy=True)
+    plain = ScoreMatrix(use_numpy=False)
+    for matrix in (dense, plain):
+        matrix.set("a", "ex0", 1.0)
+        matrix.set("b", "ex1", 0.5)
+        matrix.set("a", "ex2", 0.0)
+
+    assert dense.get_state() == plain.get_state() == {"a": {"ex0": 1.0, "ex2": 0.0}, "b": {"ex1": 0.5}}
+    assert dense.example_means() == plain.example_means()
+    np.testing.assert_array_equal(dense.to_numpy(), plain.to_numpy())
+    np.testing.assert_array_equal(dense.to_numpy(["b"]), np.array([[np.nan, 0.5, np.nan]]))
+
+    restored = ScoreMatrix()
+    restored.set_state(dense.get_state())
+    assert restored.get_state() == dense.get_state()
+
+
+def test_sampler_prefers_hard_examples_candidates_split_on(use_numpy):
+    matrix = ScoreMatrix(use_numpy=use_numpy)
+    for key in ("a", "b"):
+        matrix.set(key, "unsolved", 0.0)
+        matrix.set(key, "solved", 1.0)
+    matrix.set("a", "split", 1.0)
+    matrix.set("b", "split", 0.0)
+    sampler = InstanceSampler([f"ex{i}" for i in range(12)] + ["unsolved", "solved", "split"], seed=0)
+    sampler.register_hard_examples(["unsolved", "solved", "split"])
+
+    sampler.score_matrix = matrix
+    for round_id in range(5):
+        assert sampler.sample_shard(round_id, 4)[0] == "split"  # One hardness slot out of four
+        assert sampler.sample_permutation(round_id)[0] == "split"
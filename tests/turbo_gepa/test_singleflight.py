@@ -0,0 +1,126 @@
+"""
+Tests for single-flight deduplication of in-flight task calls.
+
+These tests verify that:
+1. Evaluators sharing an InflightRegistry make one task call per (candidate, example), even with separate caches
+2. Waiters reuse the leader's metrics without taking a concurrency slot, and the saved calls are counted
+3. When the leading call fails or times out, a waiter makes its own call instead of inheriting the failure
+4. A write-behind leader's result stays shared until flushed, and waiters on the same cache do not rewrite it
+"""
+
+import asyncio
+
+import pytest
+
+from turbo_gepa.cache import DiskCache
+from turbo_gepa.evaluator import AsyncEvaluator, InflightRegistry
+from turbo_gepa.interfaces import Candidate
+from turbo_gepa.metrics import Metrics
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_call(tmp_path):
+    calls: list[tuple[str, str]] = []
+
+    async def runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        calls.append((candidate.text, example_id))
+        await asyncio.sleep(0.02)
+        return {"quality": 1.0 if example_id != "e3" else 0.0}
+
+    registry = InflightRegistry()
+    evaluators = [
+        AsyncEvaluator(cache=DiskCache(str(tmp_path / f"island{i}")), task_runner=runner, inflight=registry)
+        for i in range(3)
+    ]
+    for evaluator in evaluators:
+        evaluator.metrics = Metrics()
+    examples = [f"e{i}" for i in range(6)]
+    # The migrated elite (different metadata, same evaluation key) lands on every island at once
+    shards = [
+        evaluator.eval_on_shard(Candidate(text="elite", meta={"island": i}), examples, concurrency=6)
+        for i, evaluator in enumerate(evaluators)
+    ]
+    shards.append(evaluators[0].eval_on_shard(Candidate(text="other"), examples[:2], concurrency=2))
+    results = await asyncio.gather(*shards)
+
+    assert sorted(calls) == sorted([("elite", ex) for ex in examples] + [("other", "e0"), ("other", "e1")])
+    for result in results[:3]:
+        assert sorted(result.example_ids) == examples
+        assert result.objectives["quality"] == pytest.approx(5 / 6)
+    assert registry.calls_saved == 12 and len(registry) == 0 and registry.held == 0
+    assert sum(evaluator.metrics.singleflight_calls_saved for evaluator in evaluators) == 12
+
+
+@pytest.mark.asyncio
+async def test_waiters_retry_when_the_leader_fails(tmp_path):
+    attempts: dict[str, int] = {}
+
+    async def runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        attempts[example_id] = attempts.get(example_id, 0) + 1
+        await asyncio.sleep(0.02 if attempts[example_id] == 1 else 0.0)
+        if example_id == "bad" and attempts[example_id] == 1:
+            raise RuntimeError("provider error")
+        if example_id == "hang" and attempts[example_id] == 1:
+            await asyncio.sleep(10)
+        return {"quality": 1.0}
+
+    registry = InflightRegistry()
+    leader = AsyncEvaluator(
+        cache=DiskCache(str(tmp_path / "a")), task_runner=runner, timeout_seconds=0.1, inflight=registry
+    )
+    waiter = AsyncEvaluator(cache=DiskCache(str(tmp_path / "b")), task_runner=runner, inflight=registry)
+    candidate = Candidate(text="p")
+
+    leading = asyncio.create_task(leader.eval_on_shard(candidate, ["bad", "hang"], concurrency=2))
+    await asyncio.sleep(0.005)
+    # Joins both running calls: one raises, the other times out on the leader's side
+    result = await asyncio.wait_for(waiter.eval_on_shard(candidate, ["bad", "hang"], concurrency=2), timeout=2.0)
+
+    assert attempts == {"bad": 2, "hang": 2}
+    assert result.objectives["quality"] == 1.0
+    assert (await leading).objectives["quality"] == 0.0
+    assert registry.calls_saved == 0 and len(registry) == 0
+
+
+@pytest.mark.asyncio
+async def test_write_behind_result_is_shared_until_flushed(tmp_path):
+    calls: list[str] = []
+
+    async def runner(candidate: Candidate, example_id: str) -> dict[str, float]:
+        calls.append(example_id)
+        await asyncio.sleep(0.02)
+        return {"quality": 1.0}
+
+    registry = InflightRegistry()
+    cache = DiskCache(str(tmp_path))
+    leader, waiter, late = (
+        AsyncEvaluator(
+            cache=cache,
+            task_runner=runner,
+            inflight=registry,
+            write_behind_records=100,
+            write_behind_interval=60.0,
+        )
+        for _ in range(3)
+    )
+    for evaluator in (leader, waiter, late):
+        evaluator.metrics = Metrics()
+    candidate = Candidate(text="p")
+
+    leading = asyncio.create_task(leader.eval_on_shard(candidate, ["e0"], concurrency=1))
+    await asyncio.sleep(0.005)
+    await waiter.eval_on_shard(candidate, ["e0"], concurrency=1)
+    await leading
+    # Only buffered by the leader, so the shared cache does not have it yet
+    assert leader.pending_writes == 1 and await cache.get(candidate, "e0") is None
+    assert (await late.eval_on_shard(candidate, ["e0"], concurrency=1)).objectives["quality"] == 1.0
+
+    assert calls == ["e0"]
+    assert registry.calls_saved == 2
+    assert [e.metrics.cache_writes for e in (leader, waiter, late)] == [1, 0, 0]
+    assert waiter.pending_writes == late.pending_writes == 0
+
+    await leader.close()
+    assert registry.held == 0 and await cache.get(candidate, "e0") is not None
+    await waiter.close()
+    await late.close()